@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   checks W2N against the shared conformance corpus of all ports and records the throughput
+
+   The corpus files are in the conformance directory of the repository, one file per language,
+   the format is documented in conformance/README.md. Every case is checked, then every operation
+   is timed over all cases of the language. The exit code is 1 if a case fails.
+   With --record the expected column is written from the results of W2N, review the diff!
+
+   usage: python -m benchmarks.conformance [--lang en fa] [--engine fsm legacy] [--repeat 3] [--output report.json] [--record]
+'''
+import argparse
+import json
+import os
+import sys
+import time
+
+from word2numberi18n.tables import available_languages
+from word2numberi18n.w2n import W2N, ENGINES
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, "conformance")
+OPS = ("word", "text", "text-keep-zero")
+ERROR = "!error"
+ESCAPES = {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
+def corpus_file(lang: str, corpus_dir: str=CORPUS_DIR) -> str:
+    return os.path.join(corpus_dir, lang + ".tsv")
+
+
+def unescape(field: str) -> str:
+    if "\\" not in field:
+        return field
+    chars = []
+    position = 0
+    while position < len(field):
+        char = field[position]
+        if char == "\\" and position + 1 < len(field) and field[position + 1] in UNESCAPES:
+            chars.append(UNESCAPES[field[position + 1]])
+            position += 2
+        else:
+            chars.append(char)
+            position += 1
+    return "".join(chars)
+
+
+def escape(field: str) -> str:
+    return "".join(ESCAPES.get(char, char) for char in field)
+
+
+def read_corpus(path: str) -> list:
+    """ [internal] function to read the cases of a corpus file
+
+    input: path of the file
+    output: list of (line number, op, input, expected or None if the line has no expected column)
+    raise: ValueError for a malformed line
+    """
+    cases = []
+    with open(path, encoding="utf-8") as corpus:
+        for line_number, line in enumerate(corpus, 1):
+            line = line.rstrip("\r\n")
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) not in (2, 3) or fields[0] not in OPS:
+                raise ValueError(f"{path}:{line_number}: expected op, input and expected separated by tabs, op one of {', '.join(OPS)}")
+            cases.append((line_number, fields[0], unescape(fields[1]), unescape(fields[2]) if len(fields) == 3 else None))
+    return cases
+
+
+def canonical_number(number: int, scale: int) -> str:
+    """ [internal] function to write a result like the corpus, without trailing zeros after the point
+
+    input: integer and scale of the result type "scaled"
+    output: string like "2.05" or "120"
+    """
+    if not scale:
+        return str(number)
+    integer, fraction = divmod(number, 10 ** scale)
+    digits = str(fraction).zfill(scale).rstrip("0")
+    return f"{integer}.{digits}" if digits else str(integer)
+
+
+def convert(instance, op: str, text: str) -> str:
+    """ [internal] function to get the result of one case in the form of the expected column
+    """
+    if op == "word":
+        result = instance.try_word_to_num(text, result_type="scaled")
+        if result.error is not None:
+            return f"{ERROR} {result.error}"
+        return canonical_number(*result.value)
+    return instance.text_to_num(text, ignore_zero=op == "text")
+
+
+def matches(actual: str, expected: str) -> bool:
+    """ [internal] function to compare a result with the expected column
+    "!error" matches every error, "!error <code>" only the error with this code
+    """
+    if expected == ERROR:
+        return actual.startswith(ERROR + " ")
+    return actual == expected
+
+
+def check(lang: str, engine: str=None, repeat: int=3, corpus_dir: str=CORPUS_DIR) -> dict:
+    """ [internal] function to check one language against its corpus and to time every op
+
+    input: language code, parser engine or None for W2N.engine, count of timed runs, corpus directory
+    output: dict with the count of cases, the failures and the throughput per op
+    """
+    instance = W2N(lang_param=lang, engine=engine)
+    cases = read_corpus(corpus_file(lang, corpus_dir))
+    failures = []
+    for line_number, op, text, expected in cases:
+        actual = convert(instance, op, text)
+        if expected is None or not matches(actual, expected):
+            failures.append({"line": line_number, "op": op, "input": text, "expected": expected, "actual": actual})
+
+    throughput = {}
+    for op in OPS:
+        texts = [text for _, case_op, text, _ in cases if case_op == op]
+        if not texts:
+            continue
+        best = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            for text in texts:
+                convert(instance, op, text)
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        throughput[op] = {"cases": len(texts), "ops_per_sec": len(texts) / best if best else 0.0}
+    return {"engine": instance.engine, "cases": len(cases), "failures": failures, "throughput": throughput}
+
+
+def record(lang: str, engine: str=None, corpus_dir: str=CORPUS_DIR) -> int:
+    """ [internal] function to write the expected column of a corpus file from the results of W2N
+    comments and blank lines are kept, error codes are written as "!error <code>"
+
+    input: language code, parser engine or None for W2N.engine, corpus directory
+    output: count of changed cases
+    """
+    instance = W2N(lang_param=lang, engine=engine)
+    path = corpus_file(lang, corpus_dir)
+    expected = {line_number: (op, text, old) for line_number, op, text, old in read_corpus(path)}
+    changed = 0
+    with open(path, encoding="utf-8") as corpus:
+        lines = corpus.read().splitlines()
+    for line_number, (op, text, old) in expected.items():
+        actual = convert(instance, op, text)
+        if old is None or not matches(actual, old):
+            changed += 1
+            lines[line_number - 1] = "\t".join([op, escape(text), escape(actual)])
+    with open(path, "w", encoding="utf-8", newline="\n") as corpus:
+        corpus.write("\n".join(lines) + "\n")
+    return changed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.conformance")
+    parser.add_argument("--lang", nargs="+", help="languages, default all with a corpus file")
+    parser.add_argument("--engine", nargs="+", choices=ENGINES, default=[W2N.engine], help="parser engines, default W2N.engine")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs, the best run counts")
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="corpus directory")
+    parser.add_argument("--output", help="JSON report file")
+    parser.add_argument("--record", action="store_true", help="write the expected column with the first engine")
+    args = parser.parse_args(argv)
+
+    langs = args.lang or [lang for lang in available_languages() if os.path.exists(corpus_file(lang, args.corpus))]
+    if args.record:
+        for lang in langs:
+            print(f"{lang}: {record(lang, args.engine[0], args.corpus)} cases recorded")
+        return 0
+
+    report = {"python": sys.version.split()[0], "languages": {}}
+    failed = 0
+    print(f"{'lang':<5}{'engine':<8}{'cases':>7}{'failed':>8}" + "".join(f"{op + ' ops/s':>22}" for op in OPS))
+    for lang in langs:
+        report["languages"][lang] = results = [check(lang, engine, args.repeat, args.corpus) for engine in args.engine]
+        for result in results:
+            failed += len(result["failures"])
+            print(f"{lang:<5}{result['engine']:<8}{result['cases']:>7}{len(result['failures']):>8}"
+                  + "".join(f"{result['throughput'].get(op, {}).get('ops_per_sec', 0):>22,.0f}" for op in OPS))
+            for failure in result["failures"]:
+                print(f"  {lang}.tsv:{failure['line']} {failure['op']} {failure['input']!r}: "
+                      f"expected {failure['expected']!r}, got {failure['actual']!r}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, ensure_ascii=False)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,7 +23,10 @@ setuptools.setup(
     include_package_data=True,
     packages=['word2numberi18n', 'word2numberi18n/data'],
     package_data={
-        'word2numberi18n/data': ["*.properties"],
+        'word2numberi18n/data': ["*.properties", "*.pack"],
+    },
+    extras_require={
+        'numpy': ['numpy'],  # vectorized engine of word_to_num_many and BatchResult.to_numpy
     },
     classifiers=[
         'Intended Audience :: Developers',
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import logging
+from word2numberi18n import w2n
+
+class TestBatch(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestBatch, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    
+    def test_columns_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        result = instance.word_to_num_many(["صد و بیست", "دو ممیز سه", "میلیون میلیون", 2 ** 70, "نهصد و نود و نه تریلیون", None])
+        self.assertEqual(len(result), 6)
+        self.assertEqual(list(result.values), [120, 0, 0, 0, 999_000_000_000_000, 0])
+        self.assertEqual(list(result.valid), [1, 0, 0, 0, 1, 0])
+        self.assertEqual(result.overflow, {1: 2.3, 3: 2 ** 70})
+        self.assertEqual(sorted(result.errors), [2, 5])
+        self.assertEqual(result.to_list(), [120, 2.3, None, 2 ** 70, 999_000_000_000_000, None])
+        self.assertEqual(result[-1], None)
+
+    def test_scalar_equal_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        inputs = ["دو هزار و نوزده", "پنج", "هزار میلیون", "دو هزار و نوزده", "ون", "پنج", 1.5]
+        for str_out in (False, True):
+            expected = []
+            for number_sentence in inputs:
+                try:
+                    expected.append(instance.word_to_num(number_sentence, str_out=str_out))
+                except ValueError:
+                    expected.append(None)
+            self.assertEqual(instance.word_to_num_many(iter(inputs), str_out=str_out).to_list(), expected)
+
+    def test_unhashable(self):
+        instance = w2n.W2N(lang_param="fa")
+        result = instance.word_to_num_many([["پنج"], "پنج"])
+        self.assertEqual(result.to_list(), [None, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
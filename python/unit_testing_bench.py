@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import io
+import json
+import random
+import logging
+import tempfile
+import contextlib
+from functools import partial
+from word2numberi18n import w2n, bench
+from word2numberi18n.parallel import convert_parallel
+from word2numberi18n.tables import available_languages, load_tables
+
+class TestBench(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestBench, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+
+    def test_corpus_deterministic(self):
+        tables = load_tables("en")
+        for workload in bench.WORKLOADS:
+            self.assertEqual(bench.make_corpus(tables, workload, 50, seed=7), bench.make_corpus(tables, workload, 50, seed=7))
+            self.assertEqual(len(bench.make_corpus(tables, workload, 50)), 50)
+        self.assertNotEqual(bench.make_corpus(tables, "phrases", 50, seed=7), bench.make_corpus(tables, "phrases", 50, seed=8))
+        self.assertRaises(ValueError, bench.make_corpus, tables, "unknown", 1)
+        for workload, corpus in bench.CORPORA.items():
+            self.assertEqual(bench.make_corpus(tables, workload, 50), bench.make_corpus(tables, corpus, 50))
+
+    def test_generated_numbers(self):
+        for lang in available_languages():
+            tables = load_tables(lang)
+            instance = w2n.W2N(lang_param=lang, tables=tables, engine="fsm")  # the legacy engine splits "quatre-vingt-huit"
+            rng = random.Random(lang)
+            for _ in range(100):
+                words, number = bench.make_number(tables, rng, all_measures=True)
+                with self.subTest(lang=lang, words=words):
+                    self.assertEqual(instance.word_to_num(words), number)
+
+    def test_compounds(self):
+        tables = load_tables("de")
+        self.assertEqual([bench.compound_word(tables, number) for number in (1, 21, 100, 324)],
+                         ["ein", "einundzwanzig", "hundert", "dreihundertvierundzwanzig"])
+        instance = w2n.W2N(lang_param="de", tables=tables)
+        for number in range(1, 1000):
+            self.assertEqual(instance.word_to_num(bench.compound_word(tables, number)), number)
+        self.assertFalse(bench.applies(load_tables("en"), "compounds"))
+
+    def test_run(self):
+        report = bench.run(["de", "en", "fa"], size=20, repeat=1, startup=False)
+        self.assertEqual(set(report["languages"]), {"de", "en", "fa"})
+        self.assertIsNone(report["startup"])
+        for lang, results in report["languages"].items():
+            self.assertEqual(set(results["workloads"]), {workload for workload in bench.WORKLOADS
+                                                         if bench.applies(load_tables(lang), workload)})
+            self.assertEqual("compounds" in results["workloads"], lang == "de")
+            self.assertGreater(results["construction"]["seconds"], 0)
+            for workload, measurement in results["workloads"].items():
+                self.assertEqual(measurement["items"], 20)
+                if workload.startswith("malformed"):
+                    self.assertGreater(measurement["errors"], 0)
+                else:
+                    self.assertEqual(measurement["errors"], 0)
+                self.assertGreater(measurement["ops_per_sec"], 0)
+                self.assertLessEqual(measurement["p50_us"], measurement["p99_us"])
+                self.assertGreater(measurement["peak_bytes"], 0)
+        self.assertEqual(report["languages"]["en"]["workloads"]["decimals_scaled"]["arguments"], {"result_type": "scaled"})
+        self.assertEqual(report["languages"]["en"]["workloads"]["sparse_unfiltered"]["settings"], {"prefilter": False})
+        workloads = report["languages"]["en"]["workloads"]
+        self.assertEqual(workloads["malformed"]["errors"], workloads["malformed_try"]["errors"])
+        json.dumps(report)
+
+    def test_sparse_text(self):
+        tables = load_tables("en")
+        corpus = bench.make_corpus(tables, "sparse_text", 1000)
+        number_free = sum(tables.number_filter().search(text.lower()) is None for text in corpus)
+        self.assertTrue(850 < number_free < 950, number_free)
+        instance = w2n.W2N(lang_param="en", tables=tables)
+        instance.prefilter = False
+        self.assertEqual([instance.text_to_num(text) for text in corpus], [w2n.W2N(lang_param="en").text_to_num(text) for text in corpus])
+
+    def test_batch(self):
+        convert = partial(convert_parallel, lang="en", workers=2, chunk_size=2)
+        measurement = bench.measure_workload(convert, ["two", "million million", "three", "four", "five"], 2, batch=True)
+        self.assertEqual(measurement["items"], 5)
+        self.assertEqual(measurement["errors"], 1)
+        self.assertGreater(measurement["ops_per_sec"], 0)
+        convert = w2n.W2N(lang_param="en").word_to_num_many
+        self.assertEqual(bench.measure_workload(convert, ["two", "million million"], 1, batch=True)["errors"], 1)
+
+    def test_main_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.json")
+            with contextlib.redirect_stdout(io.StringIO()) as console:
+                bench.main(["--lang", "sk", "--workload", "phrases", "--size", "10", "--repeat", "1", "--no-startup", "--output", path])
+            with open(path, encoding="utf-8") as result:
+                report = json.load(result)
+        self.assertEqual(report["format"], bench.FORMAT_VERSION)
+        self.assertEqual(list(report["languages"]["sk"]["workloads"]), ["phrases"])
+        self.assertIn("phrases", console.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
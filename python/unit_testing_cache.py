@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import logging
+from word2numberi18n import w2n
+from word2numberi18n.cache import ResultCache
+
+class TestCache(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestCache, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    
+    def test_same_results_fa(self):
+        cache = ResultCache(max_size=16)
+        cached = w2n.W2N(lang_param="fa", result_cache=cache)
+        plain = w2n.W2N(lang_param="fa")
+        for number_sentence in ["صد و بیست", "صد و بیست", " صد و بیست ", "دو ممیز سه", "112"]:
+            self.assertEqual(cached.word_to_num(number_sentence), plain.word_to_num(number_sentence))
+            self.assertEqual(cached.word_to_num(number_sentence, str_out=True), plain.word_to_num(number_sentence, str_out=True))
+        self.assertEqual(cache.stats()["hits"], 4)
+        self.assertEqual(cache.stats()["misses"], 4)  # the numeral "112" bypasses the cache
+        self.assertIsNone(plain.result_cache)
+
+    def test_negative_results_fa(self):
+        cache = ResultCache()
+        instance = w2n.W2N(lang_param="fa", result_cache=cache)
+        for count in range(3):
+            with self.assertRaises(ValueError) as context:
+                instance.word_to_num("میلیون میلیون")
+            self.assertIn("میلیون", str(context.exception))
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+        # the errors are cached as results, exceptions of the conversion are not
+        self.assertEqual(instance.try_word_to_num("میلیون میلیون").error, "redundant_word")
+        self.assertEqual(cache.stats()["size"], 1)
+        self.assertRaises(ValueError, instance.word_to_num, "یک", result_type="unknown")
+        self.assertRaises(ValueError, instance.word_to_num, "یک", result_type="unknown")
+        self.assertEqual(cache.stats()["size"], 1)
+
+    def test_eviction(self):
+        cache = ResultCache(max_size=2)
+        instance = w2n.W2N(lang_param="fa", result_cache=cache)
+        instance.word_to_num("یک")
+        instance.word_to_num("دو")
+        instance.word_to_num("یک")
+        instance.word_to_num("سه")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        instance.word_to_num("یک")
+        self.assertEqual(cache.stats()["hits"], 2)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"size": 0, "max_size": 2, "hits": 0, "misses": 0, "evictions": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
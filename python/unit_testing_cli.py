@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import io
+import json
+import logging
+import tempfile
+import subprocess
+import contextlib
+from word2numberi18n import cli
+
+LINES = ["two hundred and five", "no number", "nine point five", "I paid three dollars and ninety cents", ""]
+
+class TestCli(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestCli, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.input = os.path.join(self.directory.name, "input.txt")
+        with open(self.input, "w", encoding="utf-8") as input_file:
+            input_file.write("\n".join(LINES * 3) + "\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+    def convert(self, *arguments):
+        output = os.path.join(self.directory.name, "output.txt")
+        with contextlib.redirect_stderr(io.StringIO()) as summary:
+            self.assertEqual(cli.main(["--lang", "en", "--output", output, *arguments, self.input]), 0)
+        with open(output, encoding="utf-8") as output_file:
+            return output_file.read().split("\n")[:-1], summary.getvalue()
+
+
+    def test_word_mode(self):
+        lines, summary = self.convert("--workers", "1", "--engine", "fsm")
+        self.assertEqual(lines, ["205", "", "9.5", "", ""] * 3)
+        self.assertIn("15 lines, 9 errors", summary)
+
+    def test_text_mode(self):
+        lines, _ = self.convert("--workers", "1", "--mode", "text")
+        self.assertEqual(lines[:5], ["205", "no number", "9.5", "I paid 3 dollars and 90 cents", ""])
+
+    def test_spans_mode(self):
+        lines, _ = self.convert("--workers", "1", "--mode", "spans")
+        records = [json.loads(line) for line in lines]
+        self.assertEqual([record["line"] for record in records], list(range(1, 16)))
+        self.assertEqual(records[0]["spans"], [{"start": 0, "end": 20, "value": "205", "text": "two hundred and five"}])
+        self.assertEqual([span["value"] for span in records[3]["spans"]], ["3", "90"])
+
+    def test_process_pool_order(self):
+        # small chunks on more workers give the same output in the same order
+        for mode in cli.MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(self.convert("--workers", "2", "--chunk-size", "2", "--mode", mode)[0],
+                                 self.convert("--workers", "1", "--mode", mode)[0])
+
+    def test_stdin(self):
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__)) + os.pathsep + environment.get("PYTHONPATH", "")
+        completed = subprocess.run([sys.executable, "-m", "word2numberi18n", "--lang", "fa", "--workers", "2", "--mode", "text"],
+                                   input="فصل یک از بخش دو\n", env=environment, capture_output=True, text=True, encoding="utf-8", check=True)
+        self.assertEqual(completed.stdout, "فصل 1 از بخش 2\n")
+        self.assertIn("1 lines, 0 errors", completed.stderr)
+
+    def test_read_chunks(self):
+        chunks = list(cli.read_chunks([io.StringIO("a\nb\r\nc"), io.StringIO("d\n")], 3))
+        self.assertEqual(chunks, [(1, ["a", "b", "c"]), (4, ["d"])])
+        self.assertRaises(ValueError, cli.run, [], io.StringIO(), "unknown")
+
+
+if __name__ == '__main__':
+    unittest.main()
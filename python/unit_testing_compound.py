@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import logging
+from word2numberi18n import w2n, pack
+from word2numberi18n.compound import CompoundSegmenter
+from word2numberi18n.tables import load_tables, parse_properties
+
+# German compounds and numbers with units before tens: (text, expected)
+DE_FIXTURES = [
+    ("dreihundertvierundzwanzigtausend", 324000),
+    ("einundzwanzig", 21),
+    ("Hunderttausend", 100000),
+    ("zweihundertfünfundzwanzig", 225),
+    ("neunzehnhundertvierundachtzig", 1984),
+    ("tausendundeins", 1001),
+    ("dreißig", 30),
+    ("vier und zwanzig", 24),
+    ("zwei Millionen dreihundertvierundzwanzigtausendfünfhundertsiebenundsechzig", 2324567),
+    ("dreikommafünf", 3.5),
+]
+
+
+class TestCompound(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestCompound, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+
+    def test_segment(self):
+        segmenter = CompoundSegmenter(["drei", "zehn", "dreizehn", "vier", "zwanzig", "hundert"], ["und"])
+        self.assertEqual(segmenter.segment("dreihundertvierundzwanzig"), ("drei", "hundert", "vier", "und", "zwanzig"))
+        self.assertEqual(segmenter.segment("dreizehn"), ("dreizehn",))  # fewest words
+        self.assertEqual(segmenter.segment("zehndrei"), ("zehn", "drei"))
+        for word in ["dreieck", "undzwanzig", "vierund", "vierundundzwanzig", "zwanzigx"]:
+            with self.subTest(word=word):
+                self.assertIsNone(segmenter.segment(word))
+
+    def test_segment_linear(self):
+        # every split of "a" * n is a segmentation, only the dynamic programming finds the best one in time
+        segmenter = CompoundSegmenter(["a", "aa"])
+        self.assertEqual(segmenter.segment("a" * 2001), ("aa",) * 1000 + ("a",))
+        self.assertIsNone(segmenter.segment("a" * 2000 + "b"))
+
+    def test_de(self):
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="de", engine=engine)
+            for text, expected in DE_FIXTURES:
+                with self.subTest(engine=engine, text=text):
+                    self.assertEqual(instance.word_to_num(text), expected)
+
+    def test_de_text(self):
+        instance = w2n.W2N(lang_param="de")
+        self.assertEqual(instance.text_to_num("Ich habe dreihundertvierundzwanzig Euro und ein Dreieck"),
+                         "Ich habe 324 Euro und ein Dreieck")
+        self.assertEqual(instance.text_to_num("Seite vier und zwanzig, Zeile drei"), "Seite 24, Zeile 3")
+        self.assertEqual(instance.extract_numbers("Nummer Fünfundzwanzig!"),
+                         [w2n.NumberSpan(7, 21, "25", "Fünfundzwanzig")])
+
+    def test_options(self):
+        self.assertIsNotNone(load_tables("de").segmenter)
+        self.assertTrue(load_tables("de").unit_first)
+        self.assertIsNone(load_tables("en").segmenter)
+        self.assertFalse(load_tables("en").unit_first)
+        fields = parse_properties("de")
+        fields["options"]["compund"] = "true"
+        self.assertRaises(ValueError, pack.validate_fields, "de", fields)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import shutil
+import tempfile
+from word2numberi18n import w2n
+from word2numberi18n.tables import available_languages
+from benchmarks import conformance
+
+# failing corpus lines per language and engine, any other failure breaks the test
+KNOWN_FAILURES = {
+    # the legacy engine reads the spaced "quatre vingt" as 24
+    ("fr", "legacy"): {35, 37, 38},
+}
+
+class TestConformance(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestConformance, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_corpus(self):
+        for lang in available_languages():
+            for engine in w2n.ENGINES:
+                with self.subTest(lang=lang, engine=engine):
+                    result = conformance.check(lang, engine, repeat=1)
+                    self.assertGreater(result["cases"], 30)
+                    self.assertEqual(set(result["throughput"]), set(conformance.OPS))
+                    self.assertEqual({failure["line"] for failure in result["failures"]},
+                                     KNOWN_FAILURES.get((lang, engine), set()))
+
+    def test_format(self):
+        self.assertEqual(conformance.unescape(r"a\tb\\n\n\q"), "a\tb\\n\n\\q")
+        self.assertEqual(conformance.unescape(conformance.escape("a\tb\\c\nd")), "a\tb\\c\nd")
+        self.assertEqual(conformance.canonical_number(250, 2), "2.5")
+        self.assertEqual(conformance.canonical_number(0, 1), "0")
+        self.assertEqual(conformance.canonical_number(205, 2), "2.05")
+        self.assertTrue(conformance.matches("!error place_set", "!error"))
+        self.assertFalse(conformance.matches("!error place_set", "!error redundant_word"))
+        self.assertFalse(conformance.matches("12", "!error"))
+
+    def test_record(self):
+        corpus_dir = tempfile.mkdtemp()
+        try:
+            path = conformance.corpus_file("en", corpus_dir)
+            with open(path, "w", encoding="utf-8") as corpus:
+                corpus.write("# comment\nword\ttwo point zero five\nword\tmillion million\t!error\n"
+                             "text-keep-zero\tcall zero one\\tnow\tcall 01\\tnow\nword\tseven\t8\n")
+            self.assertEqual(len(conformance.check("en", corpus_dir=corpus_dir, repeat=1)["failures"]), 2)
+            self.assertEqual(conformance.record("en", corpus_dir=corpus_dir), 2)
+            with open(path, encoding="utf-8") as corpus:
+                self.assertEqual(corpus.read(), "# comment\nword\ttwo point zero five\t2.05\nword\tmillion million\t!error\n"
+                                                "text-keep-zero\tcall zero one\\tnow\tcall 01\\tnow\nword\tseven\t7\n")
+            self.assertEqual(conformance.main(["--lang", "en", "--corpus", corpus_dir, "--repeat", "1"]), 0)
+        finally:
+            shutil.rmtree(corpus_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
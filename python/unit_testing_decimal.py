@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import random
+from decimal import Decimal
+from word2numberi18n import w2n
+from word2numberi18n.cache import ResultCache
+from word2numberi18n.results import RESULT_TYPES, make_result
+
+# (text, number, str, decimal, scaled)
+EN_FIXTURES = [
+    ("two point zero five", 2.05, "2.05", Decimal("2.05"), (205, 2)),
+    ("one hundred twenty", 120, "120", Decimal(120), (120, 0)),
+    ("zero point zero", 0.0, "0.0", Decimal("0.0"), (0, 1)),
+    ("three thousand point one two three", 3000.123, "3000.123", Decimal("3000.123"), (3000123, 3)),
+    ("seven point twenty", 7.0, "7.0", Decimal("7.0"), (70, 1)),  # no digit after point
+]
+
+
+class TestDecimal(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestDecimal, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_result_types(self):
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="en", engine=engine)
+            for text, *expected in EN_FIXTURES:
+                for result_type, value in zip(RESULT_TYPES, expected):
+                    with self.subTest(engine=engine, text=text, result_type=result_type):
+                        result = instance.word_to_num(text, result_type=result_type)
+                        self.assertEqual(result, value)
+                        self.assertIs(type(result), type(value))
+                        if result_type == "decimal":  # same digits after the point
+                            self.assertEqual(str(result), str(value))
+            self.assertEqual(instance.word_to_num("two point zero five", str_out=True), "2.05")
+            self.assertRaises(ValueError, instance.word_to_num, "two", result_type="float")
+
+    def test_exact(self):
+        text = "one point " + " ".join(["one", "two", "three", "four", "five", "six", "seven", "eight", "nine", "zero"] * 4)
+        digits = "1234567890" * 4
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="en", engine=engine)
+            with self.subTest(engine=engine):
+                self.assertEqual(str(instance.word_to_num(text, result_type="decimal")), "1." + digits)
+                self.assertEqual(instance.word_to_num(text, result_type="scaled"), (int("1" + digits), 40))
+                self.assertEqual(instance.word_to_num(text), float("1." + digits))
+
+    def test_float_rounding(self):
+        # the float from integers is the correctly rounded one like float() of the string
+        rng = random.Random(7)
+        for _ in range(2000):
+            integer = rng.randrange(10 ** rng.randrange(1, 16))
+            scale = rng.randrange(1, 20)
+            fraction = rng.randrange(10 ** scale)
+            with self.subTest(integer=integer, fraction=fraction, scale=scale):
+                self.assertEqual(make_result(integer, fraction, scale, "number"),
+                                 float(f"{integer}.{fraction:0{scale}d}"))
+
+    def test_batch_scaled(self):
+        instance = w2n.W2N(lang_param="en")
+        result = instance.word_to_num_many(["two point zero five", "twenty", "twenty", 7, "million million",
+                                            "one point " + "one " * 20], result_type="scaled")
+        self.assertEqual(list(result.values), [205, 20, 20, 7, 0, 0])
+        self.assertEqual(list(result.scales), [2, 0, 0, 0, 0, 0])
+        self.assertEqual(list(result.valid), [1, 1, 1, 1, 0, 0])
+        self.assertEqual(result.to_list(), [(205, 2), (20, 0), (20, 0), (7, 0), None, (int("1" * 21), 20)])
+        self.assertEqual(list(result.errors), [4])
+        decimals = instance.word_to_num_many(["two point zero five", "x"], result_type="decimal")
+        self.assertEqual(decimals.to_list(), [Decimal("2.05"), None])
+        self.assertRaises(ValueError, instance.word_to_num_many, ["two"], result_type="float")
+
+    def test_cache(self):
+        instance = w2n.W2N(lang_param="en", result_cache=ResultCache(max_size=16))
+        self.assertEqual(instance.word_to_num("two point five"), 2.5)
+        self.assertEqual(instance.word_to_num("two point five", result_type="scaled"), (25, 1))
+        self.assertEqual(instance.word_to_num("two point five", str_out=True), "2.5")
+        self.assertEqual(instance.result_cache.stats()["size"], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+from word2numberi18n import w2n
+from word2numberi18n.detect import LanguageDetector
+from word2numberi18n.tables import load_tables
+
+# mixed records: (text, detected language, number)
+RECORDS = [
+    ("two hundred and five", "en", 205),
+    ("doscientos cinco", "es", 205),
+    ("deux cent cinq", "fr", 205),
+    ("quatre-vingt-dix-neuf", "fr", 99),
+    ("двести пять", "ru", 205),
+    ("دویست و پنج", "fa", 205),
+    ("dreihundertvierundzwanzigtausend", "de", 324000),
+    ("dvesto päť", "sk", 205),
+    ("duzentos e cinco", "pt", 205),
+    ("two lakh", "hi", 200000),
+]
+
+
+class TestDetect(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestDetect, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+
+    def test_detect(self):
+        detector = w2n.language_detector()
+        for text, lang, _ in RECORDS:
+            with self.subTest(text=text):
+                self.assertEqual(detector.detect(text), lang)
+        self.assertIsNone(detector.detect("hello world"))
+        self.assertIs(w2n.language_detector(), detector)
+
+    def test_auto(self):
+        for text, _, number in RECORDS:
+            with self.subTest(text=text):
+                self.assertEqual(w2n.word_to_num(text, lang_param=w2n.AUTO), number)
+        self.assertEqual(w2n.word_to_num(12, lang_param="auto"), 12)
+        self.assertRaises(ValueError, w2n.word_to_num, "hello world", "auto")
+        self.assertRaises(ValueError, w2n.word_to_num, "million million", "auto")
+
+    def test_weights(self):
+        detector = LanguageDetector([load_tables("en"), load_tables("hi")])
+        # on a tie the first language wins, words only one language knows decide
+        self.assertEqual(detector.rank("two thousand"), ["en", "hi"])
+        self.assertEqual(detector.rank("two lakh"), ["hi", "en"])
+        scores = detector.scores("two million")
+        self.assertGreater(scores["en"], scores["hi"])
+        scores = detector.scores("two point five")
+        self.assertEqual(scores, {"en": 0.5 + 1.0 + 0.5, "hi": 0.5 + 1.0 + 0.5})  # shared words count half
+        self.assertEqual(LanguageDetector([load_tables("hi"), load_tables("en")]).detect("two thousand"), "hi")
+
+    def test_fallback(self):
+        # the next language converts if the best one fails: "lakh" after "thousand" is malformed in hi
+        self.assertEqual(w2n.language_detector().rank("two thousand lakh"), ["hi", "en"])
+        self.assertRaises(ValueError, w2n.W2N(lang_param="hi").word_to_num, "two thousand lakh")
+        self.assertEqual(w2n.word_to_num("two thousand lakh", "auto"), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
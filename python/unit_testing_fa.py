@@ -112,8 +112,9 @@ class TestW2N(unittest.TestCase):
         self.assertEqual(instance.text_to_num('یک میلیارد و دو میلیون و بیست و سه هزار و چهل و نه ممیز دو سه شش نه'), '1002023049.2369')
         self.assertEqual(instance.text_to_num('نه تریلیون و یک میلیارد و دو میلیون و بیست و سه هزار و چهل و نه ممیز دو سه شش نه'), '9001002023049.2369')
         self.assertEqual(instance.text_to_num('ممیز یک'), '0.1')
-        self.assertEqual(instance.text_to_num('ممیز'), '0')
-        self.assertEqual(instance.text_to_num('ممیز نوزده'), '0')
+        # in a text the point word is only part of a number before a digit word
+        self.assertEqual(instance.text_to_num('ممیز'), 'ممیز')
+        self.assertEqual(instance.text_to_num('ممیز نوزده'), 'ممیز 19')
         self.assertEqual(instance.text_to_num('صد و سی و پنج'), '135')
         self.assertEqual(instance.text_to_num('صد'), '100')
         self.assertEqual(instance.text_to_num('هزار'), '1000')
@@ -122,7 +123,7 @@ class TestW2N(unittest.TestCase):
         self.assertEqual(instance.text_to_num('تریلیون'), '1000000000000')
         self.assertEqual(instance.text_to_num("یک میلیون و هزار"), '1001000')
         self.assertEqual(instance.text_to_num('نه ممیز نه نه نه'), '9.999')
-        self.assertEqual(instance.text_to_num('هفتم ممیز نوزده'), 'هفتم 0')
+        self.assertEqual(instance.text_to_num('هفتم ممیز نوزده'), 'هفتم ممیز 19')
         # self.assertEqual(instance.text_to_num('هفت میلیون، هشتصد و شصت و سه هزار، دویست، پنجاه و چهار'), '7863254') # TODO
         self.assertEqual(instance.text_to_num('دویست'), '200')
 
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import io
+import random
+import logging
+import importlib
+from word2numberi18n import w2n
+from word2numberi18n.tables import load_tables
+
+LANGS = ["de", "en", "es", "fa", "fr", "hi", "pt", "ru", "sk"]
+SUITES = ["en", "es", "fa", "fr", "ru", "sk"]
+FUZZ_SIZE = 300
+# the legacy engine splits one word numbers over 20 like "quatre-vingt-quinze" or "veintitrés"
+LEGACY_COMPOUND_LANGS = {"es", "fr"}
+
+
+def small_number_words(tables, number):
+    # words of a number under 1000 from the canonical names of the language
+    names = tables.name_by_value
+    words = []
+    hundreds, rest = divmod(number, 100)
+    if hundreds > 1 and hundreds * 100 in names:
+        words.append(names[hundreds * 100])
+    elif hundreds == 1:
+        words.append(names[100])
+    elif hundreds > 1:
+        words += [names[hundreds], names[100]]
+    if rest in names and (rest > 0 or not words):
+        words.append(names[rest])
+    elif rest > 0:
+        words += [names[rest // 10 * 10], names[rest % 10]]
+    return words
+
+
+def make_number(tables, rng):
+    # random well formed number with measure words, from the highest measure to the lowest
+    measures = [value for value in tables.sorted_measure_values if value >= 1000]
+    words = []
+    number = 0
+    limit = 1000
+    for index, measure in enumerate(measures):
+        higher = measures[index - 1] if index > 0 else measure * 1000
+        multiplier = rng.randrange(min(higher // measure, 1000)) if rng.random() < 0.6 else 0
+        if multiplier > 0:
+            words += small_number_words(tables, multiplier) + [tables.name_by_value[measure]]
+            number += multiplier * measure
+        limit = measure
+    rest = rng.randrange(min(limit, 1000))
+    if rest > 0 or not words:
+        words += small_number_words(tables, rest)
+        number += rest
+    return " ".join(words), number
+
+
+def make_phone_number(tables, rng):
+    # groups which can not continue each other, read with is_separate
+    groups = [rng.choice([value for value in range(1, 100) if value < 20 or value % 10])
+              for _ in range(rng.randrange(2, 6))]
+    words = [word for group in groups for word in small_number_words(tables, group)]
+    return " ".join(words), int("".join(map(str, groups)))
+
+
+class TestFsm(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestFsm, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+        self.engine = w2n.W2N.engine
+
+    def tearDown(self):
+        w2n.W2N.engine = self.engine
+        os.environ.pop("w2n.lang", None)
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+
+    def test_engine_parameter(self):
+        self.assertEqual(w2n.W2N(lang_param="en", engine="legacy").engine, "legacy")
+        self.assertEqual(w2n.W2N(lang_param="en").engine, w2n.W2N.engine)
+        self.assertRaises(ValueError, w2n.W2N, "en", None, None, "unknown")
+
+    def test_default_engine(self):
+        # the legacy engine stays the default, it reads the vigesimal French tens and English years like before
+        self.assertEqual(w2n.W2N.engine, "legacy")
+        self.assertEqual(w2n.W2N(lang_param="fr").word_to_num("soixante dix sept"), 77)
+        self.assertEqual(w2n.W2N(lang_param="en").word_to_num("nineteen eighty four"), 103)
+        self.assertRaises(ValueError, w2n.W2N(lang_param="en", engine="fsm").word_to_num, "nineteen eighty four")
+
+    def test_vigesimal(self):
+        instance = w2n.W2N(lang_param="fr", engine="fsm")
+        for words, number in [("dix sept", 17), ("soixante dix", 70), ("soixante dix sept", 77), ("soixante et onze", 71),
+                              ("soixante quinze", 75), ("quatre vingt", 80), ("quatre vingt huit", 88),
+                              ("quatre vingt dix sept", 97), ("deux cent quatre vingt", 280), ("quatre vingt mille", 80000),
+                              ("mille neuf cent quatre vingt quatre", 1984), ("dix neuf cent quatre vingt quatre", 1984)]:
+            with self.subTest(words=words):
+                self.assertEqual(instance.word_to_num(words), number)
+        for words in ["trente dix", "vingt dix", "dix dix", "soixante vingt", "vingt quatre vingt", "soixante dix onze"]:
+            with self.subTest(words=words):
+                self.assertRaises(ValueError, instance.word_to_num, words)
+        # without the option the tens are not formed by twenty
+        self.assertRaises(ValueError, w2n.W2N(lang_param="en", engine="fsm").word_to_num, "four twenty")
+
+    def test_suites(self):
+        # every language suite passes with both engines
+        for lang in SUITES:
+            suite_module = importlib.import_module(f"unit_testing_{lang}")
+            os.environ.pop("w2n.lang", None)
+            if lang == "ru":
+                os.environ["w2n.lang"] = "ru"  # like the import of the suite
+            for engine in w2n.ENGINES:
+                with self.subTest(lang=lang, engine=engine):
+                    w2n.W2N.engine = engine
+                    suite = unittest.defaultTestLoader.loadTestsFromModule(suite_module)
+                    result = unittest.TextTestRunner(stream=io.StringIO()).run(suite)
+                    self.assertTrue(result.wasSuccessful(), result.failures + result.errors)
+            os.environ.pop("w2n.lang", None)
+
+    def test_fuzz_numbers(self):
+        rng = random.Random(20221018)
+        for lang in LANGS:
+            tables = load_tables(lang)
+            engines = [w2n.W2N(lang_param=lang, tables=tables, engine=engine) for engine in w2n.ENGINES
+                       if engine != "legacy" or lang not in LEGACY_COMPOUND_LANGS]
+            for _ in range(FUZZ_SIZE):
+                words, number = make_number(tables, rng)
+                digit_words = [rng.choice(tables.decimal_words) for _ in range(rng.randrange(3))]
+                digits = "".join(str(tables.number_system[word]) for word in digit_words)
+                with self.subTest(lang=lang, words=words):
+                    for instance in engines:
+                        self.assertEqual(instance.word_to_num(words), number)
+                        if digits:
+                            self.assertEqual(instance.word_to_num(f"{words} {tables.point_name} {' '.join(digit_words)}", str_out=True),
+                                             f"{number}.{digits}")
+
+    def test_fuzz_separate(self):
+        rng = random.Random(20221018)
+        for lang in LANGS:
+            tables = load_tables(lang)
+            engines = [w2n.W2N(lang_param=lang, tables=tables, engine=engine) for engine in w2n.ENGINES
+                       if engine != "legacy" or lang not in LEGACY_COMPOUND_LANGS]
+            for _ in range(FUZZ_SIZE):
+                words, number = make_phone_number(tables, rng)
+                with self.subTest(lang=lang, words=words):
+                    for instance in engines:
+                        self.assertEqual(instance.word_to_num(words, is_separate=True), number)
+
+    def test_fuzz_words(self):
+        # random word sequences either convert or raise ValueError, never another error
+        rng = random.Random(20221018)
+        for lang in LANGS:
+            tables = load_tables(lang)
+            vocabulary = list(tables.number_system) + [tables.point_name, "lorem"] + list(tables.conjunctions)
+            engines = [w2n.W2N(lang_param=lang, tables=tables, engine=engine) for engine in w2n.ENGINES]
+            for _ in range(FUZZ_SIZE):
+                words = " ".join(rng.choice(vocabulary) for _ in range(rng.randrange(1, 8)))
+                for instance in engines:
+                    for is_separate in (False, True):
+                        try:
+                            instance.word_to_num(words, is_separate=is_separate)
+                        except ValueError:
+                            pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import subprocess
+from word2numberi18n import registry
+
+# import time budget in microseconds, cumulative time of `python -X importtime`,
+# best of IMPORT_RUNS runs with cached bytecode (see README.md)
+IMPORT_BUDGET_US = {
+    "word2numberi18n": 5_000,
+    "word2numberi18n.w2n": 50_000,
+}
+IMPORT_RUNS = 5
+# modules which are not needed to import word2numberi18n.w2n, the first ones neither to convert with a given language
+UNUSED_MODULES = ["pickle", "typing", "locale", "numpy", "tracemalloc", "subprocess", "argparse"]
+DEFERRED_MODULES = UNUSED_MODULES + ["hashlib"]
+PACKAGE_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(*arguments) -> subprocess.CompletedProcess:
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)  # measure with cached bytecode like an installed package
+    environment.pop("w2n.lang", None)
+    environment["PYTHONPATH"] = PACKAGE_ROOT + os.pathsep + environment.get("PYTHONPATH", "")
+    return subprocess.run([sys.executable, *arguments], env=environment, cwd=PACKAGE_ROOT,
+                          check=True, capture_output=True, text=True)
+
+
+def import_times(module: str) -> dict:
+    """ cumulative import time in microseconds of every module imported by `import module` """
+    times = {}
+    for line in run_python("-X", "importtime", "-c", f"import {module}").stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestImport(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestImport, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+
+    def test_deferred_modules(self):
+        code = ("import sys; before = set(sys.modules); from word2numberi18n import w2n; "
+                "print(' '.join(sorted(set(sys.modules) - before))); "
+                "w2n.W2N(lang_param='en').word_to_num('two hundred and five'); w2n.word_to_num('پنج', lang_param='fa'); "
+                "print(' '.join(sorted(set(sys.modules) - before)))")
+        imported, converted = [line.split() for line in run_python("-c", code).stdout.splitlines()]
+        self.assertIn("word2numberi18n.w2n", imported)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+        for module in UNUSED_MODULES:
+            self.assertNotIn(module, converted)
+
+    def test_import_budget(self):
+        import_times("word2numberi18n.w2n")  # warm up the bytecode cache
+        for module, budget in IMPORT_BUDGET_US.items():
+            best = min(import_times(module)[module] for _ in range(IMPORT_RUNS))
+            with self.subTest(module=module):
+                self.assertLessEqual(best, budget, f"import {module} takes {best} us, budget {budget} us")
+
+    def test_locale_read_once(self):
+        lang_env = os.environ.pop("w2n.lang", None)
+        try:
+            registry.locale_language.cache_clear()
+            first = registry.resolve_language(None)
+            for _ in range(10):
+                self.assertEqual(registry.resolve_language(None), first)
+            self.assertEqual(registry.locale_language.cache_info().misses, 1)
+        finally:
+            if lang_env is not None:
+                os.environ["w2n.lang"] = lang_env
+
+
+if __name__ == '__main__':
+    unittest.main()
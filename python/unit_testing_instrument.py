@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import re
+import logging
+from word2numberi18n import w2n, instrument
+from word2numberi18n.cache import ResultCache
+
+PROMETHEUS_SAMPLE = re.compile(r'^[a-z0-9_]+(\{[a-z]+="[^"]*"\})? [0-9.e+-]+$')
+
+
+class TestInstrument(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestInstrument, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+
+    def test_disabled(self):
+        self.assertIsNone(w2n.W2N.instrumentation)
+        with instrument.profile() as collected:
+            self.assertIs(w2n.W2N.instrumentation, collected)
+        self.assertIsNone(w2n.W2N.instrumentation)
+        w2n.W2N(lang_param="en").word_to_num("two hundred and five")
+        self.assertEqual(collected.to_dict()["stages"], {})
+
+    def test_stages(self):
+        instance = w2n.W2N(lang_param="en", engine="fsm")
+        legacy = w2n.W2N(lang_param="en", engine="legacy")
+        with instrument.profile() as collected:
+            instance.word_to_num("two hundred and five")
+            legacy.word_to_num("nine thousand point five")
+            self.assertRaises(ValueError, instance.word_to_num, "million million")
+            instance.text_to_num("I paid three dollars and five cents")
+        data = collected.to_dict()
+        calls = {stage: timer["calls"] for stage, timer in data["stages"].items()}
+        # the parser returns errors instead of raising, so "million million" is a parse call too
+        self.assertEqual(calls, {"normalize": 3, "convert": 3, "parse": 4, "clean_str": 1, "validate": 1,
+                                 "get_number_value": 1, "normalize_text": 1, "extract_numbers": 1})
+        for timer in data["stages"].values():
+            self.assertGreaterEqual(timer["seconds"], timer["max_seconds"])
+        self.assertEqual(data["counters"], {"word_to_num_errors": 1, "number_groups": 2})
+        self.assertEqual(data["token_counts"]["buckets"], {"1": 0, "2": 1, "4": 2})
+        self.assertEqual(data["token_counts"]["sum"], 10)
+
+    def test_instance(self):
+        # an instance with own instrumentation, the other instances stay without
+        collected = instrument.Instrumentation()
+        instance = w2n.W2N(lang_param="fa")
+        instance.instrumentation = collected
+        instance.word_to_num("صد و بیست")
+        w2n.W2N(lang_param="fa").word_to_num("صد و بیست")
+        self.assertEqual(collected.to_dict()["stages"]["normalize"]["calls"], 1)
+        collected.reset()
+        self.assertEqual(collected.to_dict()["stages"], {})
+
+    def test_prometheus(self):
+        previous_cache = w2n.W2N.result_cache
+        w2n.W2N.result_cache = ResultCache(max_size=16)
+        try:
+            with instrument.profile() as collected:
+                for _ in range(3):
+                    w2n.W2N(lang_param="en", engine="fsm").word_to_num("two hundred and five")
+            text = collected.to_prometheus()
+        finally:
+            w2n.W2N.result_cache = previous_cache
+        samples = {}
+        for line in text.splitlines():
+            if not line.startswith("#"):
+                self.assertRegex(line, PROMETHEUS_SAMPLE)
+                name, value = line.rsplit(" ", 1)
+                samples[name] = float(value)
+        self.assertEqual(samples['w2n_stage_calls_total{stage="normalize"}'], 3)
+        self.assertEqual(samples['w2n_stage_calls_total{stage="parse"}'], 1)  # the others are cache hits
+        self.assertEqual(samples['w2n_tokens_bucket{le="+Inf"}'], 3)
+        self.assertEqual(samples['w2n_tokens_bucket{le="4"}'], 3)
+        self.assertEqual(samples["w2n_tokens_count"], 3)
+        self.assertEqual(samples["w2n_result_cache_hits_total"], 2)
+        self.assertIn("w2n_registry_size", samples)
+        self.assertIn("# TYPE w2n_tokens histogram", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+from decimal import Decimal
+from word2numberi18n import w2n, results
+from word2numberi18n.instrument import profile
+from word2numberi18n.numerals import numeral_parts
+
+# (language, text, expected)
+FIXTURES = [
+    ("en", "1,250", 1250),
+    ("en", "2.5", 2.5),
+    ("en", " 12 ", 12),
+    ("en", "1,234,567.25", 1234567.25),
+    ("en", "١٢٣", 123),
+    ("fa", "۱۲۳", 123),
+    ("fa", "۱٬۲۵۰٫۵", 1250.5),
+    ("hi", "२०२४", 2024),
+    ("en", "3 million", 3000000),
+    ("en", "2.5 thousand", 2500),
+    ("en", "1.2345 thousand", 1234.5),
+    ("en", "1 million and 250 thousand", 1250000),
+    ("en", "5 hundred 20 thousand", 520000),
+    ("en", "25 Hundred", 2500),
+    ("en", "thousand 5", 1005),
+    ("fa", "۲ میلیون", 2000000),
+    ("fa", "۲٫۵ میلیارد و ۳۰۰ میلیون", 2800000000),
+    ("hi", "२ lac", 200000),
+    ("de", "2 Millionen", 2000000),
+    # languages with the option decimal_comma
+    ("de", "1.000", 1000),
+    ("de", "1,250", 1.25),
+    ("de", "1.234.567,25", 1234567.25),
+    ("de", "2,5 Millionen", 2500000),
+    ("fr", "2,5 mille", 2500),
+    ("es", "12", 12),
+]
+
+
+class TestNumerals(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestNumerals, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_numerals(self):
+        for engine in w2n.ENGINES:
+            for lang, text, expected in FIXTURES:
+                with self.subTest(engine=engine, lang=lang, text=text):
+                    result = w2n.W2N(lang_param=lang, engine=engine).word_to_num(text)
+                    self.assertEqual(result, expected)
+                    self.assertIs(type(result), type(expected))
+
+    def test_numeral_parts(self):
+        self.assertEqual(numeral_parts("0.050"), (0, 50, 3))
+        self.assertEqual(numeral_parts("۰٫۰۵۰"), (0, 50, 3))
+        self.assertEqual(numeral_parts("1.250,5", decimal_comma=True), (1250, 5, 1))
+        self.assertEqual(numeral_parts("۱٬۲۵۰٫۵", decimal_comma=True), (1250, 5, 1))
+        for text in ["1,25", "1,2345", ",125", "1.", ".5", "1.2.3", "12a", "²", "two", ""]:
+            with self.subTest(text=text):
+                self.assertIsNone(numeral_parts(text))
+        for text in ["1.25", "1,250.5", "1,2,3"]:
+            with self.subTest(text=text, decimal_comma=True):
+                self.assertIsNone(numeral_parts(text, decimal_comma=True))
+
+    def test_result_types(self):
+        instance = w2n.W2N(lang_param="fa")
+        self.assertEqual(instance.word_to_num("۲٫۵۰", result_type="decimal"), Decimal("2.50"))
+        self.assertEqual(instance.word_to_num("۲٫۵ هزار", result_type="scaled"), (2500, 0))
+        self.assertEqual(instance.word_to_num("1,250.5", str_out=True), "1250.5")
+
+    def test_errors(self):
+        instance = w2n.W2N(lang_param="en")
+        for text in ["1 2", "5 thousand million", "1 hundred 5 hundred", "250 hundred", "1,25"]:
+            for engine in w2n.ENGINES:
+                with self.subTest(text=text, engine=engine):
+                    self.assertRaises(ValueError, w2n.W2N(lang_param="en", engine=engine).word_to_num, text)
+        self.assertEqual(instance.word_to_num("two 5"), 2)  # numerals next to number words are skipped as before
+        # digits which are no numeral of the language are never dropped
+        for lang, text, token, index in [("en", "1,25", "1,25", 0), ("en", "two 1,25", "1,25", 1), ("en", "1,25 million", "1,25", 0),
+                                         ("de", "2.5 Millionen", "2.5", 0), ("de", "zwei 12a", "12a", 1)]:
+            with self.subTest(lang=lang, text=text):
+                result = w2n.W2N(lang_param=lang).try_word_to_num(text)
+                self.assertEqual((result.error, result.token, result.index), (results.INVALID_NUMERAL, token, index))
+
+    def test_bypass(self):
+        with profile() as collected:
+            w2n.W2N(lang_param="en").word_to_num("1,250")
+        self.assertEqual(collected.counters, {"numerals": 1})
+        self.assertEqual(collected.stages, {})
+        self.assertEqual(w2n.word_to_num("۱۲۳", w2n.AUTO), 123)
+        self.assertEqual(w2n.word_to_num("3 million", w2n.AUTO), 3000000)
+        # the separators depend on the language: the words decide, without words the process default
+        self.assertEqual(w2n.word_to_num("2,5 Millionen", w2n.AUTO), 2500000)
+        self.assertEqual(w2n.word_to_num("1,250", w2n.AUTO), w2n.word_to_num("1,250"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import tempfile
+from word2numberi18n import pack
+from word2numberi18n.tables import LanguageTables, available_languages, load_tables, parse_properties
+
+class TestPack(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestPack, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+
+    def test_shipped_packs_current(self):
+        # run "python -m word2numberi18n.pack" after changing a configuration file
+        for lang in available_languages():
+            with self.subTest(lang=lang):
+                self.assertTrue(pack.is_current(lang))
+
+    def test_same_tables(self):
+        for lang in available_languages():
+            packed = load_tables(lang)
+            parsed = load_tables(lang, use_pack=False)
+            for name in LanguageTables.__slots__:
+                if name != "_substitute":
+                    with self.subTest(lang=lang, name=name):
+                        self.assertEqual(getattr(packed, name), getattr(parsed, name))
+
+    def test_fallback(self):
+        fields = parse_properties("en")
+        fields["replace_source"] = None
+        with tempfile.TemporaryDirectory() as directory:
+            source_path = os.path.join(directory, "config_xx.properties")
+            pack_path = os.path.join(directory, "config_xx.pack")
+            with open(source_path, "w", encoding="utf-8") as source:
+                source.write("zero=0")
+            data = pack.encode_pack(fields, pack.source_digest(source_path))
+            with open(pack_path, "wb") as pack_data:
+                pack_data.write(data)
+            self.assertEqual(pack.read_pack(pack_path, source_path)["number_system"], fields["number_system"])
+
+            # stale: the configuration file changed after the pack was compiled
+            with open(source_path, "a", encoding="utf-8") as source:
+                source.write("\none=1")
+            self.assertIsNone(pack.read_pack(pack_path, source_path))
+            # missing pack
+            self.assertIsNone(pack.read_pack(pack_path + ".missing", source_path))
+            # without configuration file the pack is used as it is
+            self.assertIsNotNone(pack.read_pack(pack_path, source_path + ".missing"))
+
+        # broken payload, unknown version, no pack at all
+        self.assertIsNone(pack.decode_pack(data[:-1] + bytes([data[-1] ^ 1])))
+        self.assertIsNone(pack.decode_pack(data[:4] + b"\xff\xff" + data[6:]))
+        self.assertIsNone(pack.decode_pack(b"zero=0"))
+
+    def test_validate(self):
+        fields = parse_properties("en")
+        pack.validate_fields("en", fields)
+        self.assertRaises(ValueError, pack.validate_fields, "en", dict(fields, point_name=""))
+        self.assertRaises(ValueError, pack.validate_fields, "en", dict(fields, measure_values=[10 ** 30]))
+        self.assertRaises(ValueError, pack.validate_fields, "en", dict(fields, zero_words=["one"]))
+        self.assertRaises(ValueError, pack.validate_fields, "en", dict(fields, conjunctions=["one"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import threading
+from word2numberi18n import w2n
+from word2numberi18n.bench import make_corpus
+from word2numberi18n.cache import ResultCache
+from word2numberi18n.parallel import convert_parallel
+
+
+class TestParallel(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestParallel, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_word(self):
+        tables = w2n.registry.get("en")
+        inputs = make_corpus(tables, "long_numbers", 300) + make_corpus(tables, "decimals", 300) + ["million million", "", 7]
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="en", engine=engine)
+            expected = instance.word_to_num_many(inputs).to_list()
+            with self.subTest(engine=engine):
+                self.assertEqual(convert_parallel(inputs, "en", workers=4, chunk_size=16, engine=engine), expected)
+                self.assertEqual(convert_parallel(inputs, "en", workers=1, engine=engine), expected)
+        self.assertEqual(convert_parallel(["two point five"], "en", result_type="scaled"), [(25, 1)])
+        self.assertEqual(convert_parallel([], "en", workers=4), [])
+
+    def test_text(self):
+        instance = w2n.W2N(lang_param="fa")
+        texts = make_corpus(instance.tables, "free_text", 200)
+        self.assertEqual(convert_parallel(texts, "fa", workers=3, op="text", chunk_size=7, ignore_zero=False),
+                         [instance.text_to_num(text, ignore_zero=False) for text in texts])
+        self.assertEqual(convert_parallel(texts, "fa", workers=3, op="spans", chunk_size=7),
+                         [instance.extract_numbers(text) for text in texts])
+        self.assertRaises(ValueError, convert_parallel, texts, "fa", op="html")
+        self.assertRaises(ValueError, convert_parallel, texts, "fa", workers=0)
+
+    def test_no_shared_cache(self):
+        previous = w2n.W2N.result_cache
+        w2n.W2N.result_cache = ResultCache(max_size=64)
+        try:
+            self.assertEqual(convert_parallel(["two", "three"] * 50, "en", workers=2, chunk_size=10), [2, 3] * 50)
+            self.assertEqual(w2n.W2N.result_cache.stats()["size"], 0)
+        finally:
+            w2n.W2N.result_cache = previous
+
+    def test_shared_instance(self):
+        # one instance used by many threads at once, also the compound caches of German
+        for lang in ("en", "de"):
+            instance = w2n.W2N(lang_param=lang, engine="legacy")
+            inputs = make_corpus(instance.tables, "long_numbers", 200)
+            expected = [instance.word_to_num(text) for text in inputs]
+            results = [None] * 8
+            barrier = threading.Barrier(len(results))
+
+            def convert(index):
+                barrier.wait()
+                results[index] = [instance.word_to_num(text) for text in inputs]
+
+            threads = [threading.Thread(target=convert, args=(index,)) for index in range(len(results))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with self.subTest(lang=lang):
+                self.assertEqual(results, [expected] * len(results))
+
+
+if __name__ == '__main__':
+    unittest.main()
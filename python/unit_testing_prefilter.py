@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import random
+from word2numberi18n import w2n
+from word2numberi18n.bench import make_corpus, FILLER_WORDS
+from word2numberi18n.instrument import profile
+from word2numberi18n.tables import available_languages, load_tables
+
+
+class TestPrefilter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestPrefilter, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_same_spans(self):
+        # texts of filler words, vocabulary words, glued words, upper case and punctuation
+        rng = random.Random(3)
+        for lang in available_languages():
+            filtered = w2n.W2N(lang_param=lang)
+            unfiltered = w2n.W2N(lang_param=lang)
+            unfiltered.prefilter = False
+            tables = filtered.tables
+            vocabulary = [*tables.number_system, *tables.normalize_data, tables.point_name, *tables.conjunctions]
+            texts = make_corpus(tables, "free_text", 50)
+            for _ in range(500):
+                words = []
+                for _ in range(rng.randrange(1, 8)):
+                    word = rng.choice(vocabulary) if rng.random() < 0.2 else rng.choice(FILLER_WORDS)
+                    if rng.random() < 0.1:
+                        word += rng.choice(vocabulary)
+                    if rng.random() < 0.2:
+                        word = word.upper()
+                    words.append(word + rng.choice(["", ",", "-", "."]))
+                texts.append(" ".join(words))
+            for text in texts:
+                with self.subTest(lang=lang, text=text):
+                    self.assertEqual(filtered.extract_numbers(text), unfiltered.extract_numbers(text))
+
+    def test_filter(self):
+        self.assertIsNone(load_tables("en").number_filter().search("someone wrote tones of notes"))
+        self.assertIsNotNone(load_tables("en").number_filter().search("ninety-eight"))
+        self.assertIsNotNone(load_tables("en").number_filter().search("a dozen"))
+        self.assertIsNotNone(load_tables("de").number_filter().search("dreihundertvierundzwanzig"))
+        self.assertIsNone(load_tables("de").number_filter().search("das haus am see"))
+        self.assertIs(load_tables("fa").number_filter(), load_tables("fa").number_filter())
+
+    def test_skip(self):
+        instance = w2n.W2N(lang_param="fa")
+        text = "امروز هوا خیلی خوب است."
+        with profile() as collected:
+            self.assertEqual(instance.text_to_num(text), text)
+            self.assertEqual(instance.text_to_num("فصل یک"), "فصل 1")
+        self.assertEqual(collected.counters, {"number_free_texts": 1, "number_groups": 1})
+        self.assertEqual(collected.to_dict()["stages"]["normalize_text"]["calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
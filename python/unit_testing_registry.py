@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import threading
+from word2numberi18n import w2n
+from word2numberi18n.registry import LanguageRegistry, resolve_language
+from word2numberi18n.tables import load_tables
+
+class TestRegistry(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestRegistry, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    def setUp(self):
+        # "w2n.lang" overrides every language parameter
+        self.env_lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.env_lang is not None:
+            os.environ["w2n.lang"] = self.env_lang
+    
+    
+    def test_language_code(self):
+        self.assertEqual(resolve_language("en"), "en")
+        self.assertEqual(resolve_language("en_US"), "en")
+        self.assertEqual(resolve_language("FR"), "fr")
+
+    def test_shared_instance(self):
+        registry = LanguageRegistry(load_tables)
+        first = registry.get("fa")
+        self.assertIs(registry.get("fa_IR"), first)
+        self.assertEqual(registry.stats()["misses"], 1)
+        self.assertEqual(registry.stats()["hits"], 1)
+        self.assertEqual(registry.stats()["loads"], 1)
+        self.assertIn("fa", registry.stats()["load_times"])
+
+    def test_preload_evict(self):
+        registry = LanguageRegistry(load_tables)
+        registry.preload(["en", "fa"])
+        self.assertEqual(registry.languages(), ["en", "fa"])
+        self.assertTrue(registry.evict("en"))
+        self.assertFalse(registry.evict("en"))
+        self.assertNotIn("en", registry)
+        registry.get("fa")
+        self.assertEqual(registry.stats()["loads"], 2)
+
+    def test_bounded(self):
+        registry = LanguageRegistry(load_tables, max_size=2)
+        registry.preload(["en", "fa", "fr"])
+        self.assertEqual(registry.languages(), ["fa", "fr"])
+        self.assertEqual(registry.stats()["evictions"], 1)
+        registry.get("fa")
+        registry.get("es")
+        self.assertEqual(registry.languages(), ["fa", "es"])
+
+    def test_threads(self):
+        registry = LanguageRegistry(load_tables)
+        results = []
+        def worker():
+            results.append(registry.get("fa"))
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(registry.stats()["loads"], 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_module_function(self):
+        w2n.registry.preload(["fa"])
+        loads = w2n.registry.stats()["loads"]
+        self.assertEqual(w2n.word_to_num("صد و بیست", "fa"), 120)
+        self.assertEqual(w2n.word_to_num("دویست", "fa"), 200)
+        self.assertEqual(w2n.registry.stats()["loads"], loads)
+
+    def test_language_instance(self):
+        first = w2n.language_instance("fa")
+        first.engine = "fsm"
+        first.prefilter = False
+        second = w2n.language_instance("fa")
+        self.assertIsNot(second, first)
+        self.assertIs(second.tables, first.tables)
+        self.assertEqual(second.engine, w2n.W2N.engine)
+        self.assertTrue(second.prefilter)
+
+
+if __name__ == '__main__':
+    unittest.main()
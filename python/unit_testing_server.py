@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import json
+import socket
+import logging
+import tempfile
+import threading
+from word2numberi18n import server
+from word2numberi18n.client import Client, ServerError, parse_address
+
+
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestServer, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang_env = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang_env is not None:
+            os.environ["w2n.lang"] = self.lang_env
+
+
+    def test_ops(self):
+        with server.ConversionServer("127.0.0.1:0", ["en", "fa"]).start() as conversion_server, \
+                Client(conversion_server.address, lang="en") as client:
+            self.assertTrue(client.ping())
+            self.assertEqual(client.word_to_num("two hundred and five"), 205)
+            self.assertEqual(client.word_to_num("صد و بیست", lang="fa"), 120)
+            self.assertEqual(client.word_to_num("nine point five"), 9.5)
+            self.assertEqual(client.text_to_num("I have three cats"), "I have 3 cats")
+            self.assertEqual(client.extract_numbers("nine point five"),
+                             [{"start": 0, "end": 15, "value": "9.5", "text": "nine point five"}])
+            self.assertRaises(ServerError, client.word_to_num, "no number")
+            self.assertRaises(ValueError, client.word_to_num, "five", lang="xx")
+            results = client.convert_many("word", ["one", "bad", 3, "one"])
+            self.assertEqual([results[0], results[2], results[3]], [1, 3, 1])
+            self.assertIsInstance(results[1], ServerError)
+            stats = client.stats()
+            self.assertEqual(stats["requests"], 11)
+            self.assertEqual(stats["errors"], 3)
+            self.assertEqual(sorted(stats["languages"]), ["en", "fa"])
+
+    def test_micro_batches(self):
+        # requests sent together wait for each other within the window and are converted in one batch
+        with server.ConversionServer("127.0.0.1:0", ["en"], window=0.2, max_batch=8).start() as conversion_server, \
+                Client(conversion_server.address, lang="en") as client:
+            self.assertEqual(client.convert_many("word", ["one", "two", "three"]), [1, 2, 3])
+            stats = client.stats()
+            self.assertEqual(stats["batches"], 1)
+            self.assertEqual(stats["batch_size"]["buckets"], {"1": 0, "2": 0, "4": 1})
+            # at most max_batch requests per batch
+            self.assertEqual(client.convert_many("word", ["five"] * 20), [5] * 20)
+            stats = client.stats()
+            self.assertEqual(stats["requests"], 23)
+            self.assertGreaterEqual(stats["batches"], 4)
+            self.assertEqual(max(int(bucket) for bucket, count in stats["batch_size"]["buckets"].items() if count), 8)
+            self.assertGreaterEqual(stats["max_queue_depth"], 8)
+            self.assertEqual(stats["queue_depth"], 0)
+
+    def test_concurrent_clients(self):
+        with server.ConversionServer("127.0.0.1:0", ["en"], window=0.01).start() as conversion_server:
+            failures = []
+
+            def work(number):
+                with Client(conversion_server.address, lang="en") as client:
+                    for _ in range(20):
+                        if client.word_to_num(f"{['one', 'two', 'three', 'four'][number]} hundred") != (number + 1) * 100:
+                            failures.append(number)
+
+            threads = [threading.Thread(target=work, args=(number,)) for number in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(failures, [])
+            stats = conversion_server.stats()
+            self.assertEqual(stats["requests"], 80)
+            self.assertEqual(stats["batch_size"]["count"], stats["batches"])
+
+    def test_protocol_errors(self):
+        with server.ConversionServer("127.0.0.1:0", ["en"]).start() as conversion_server:
+            connection = socket.create_connection(parse_address(conversion_server.address)[1])
+            connection.sendall(b'not json\n{"id": 1, "op": "nope"}\n{"id": 2, "op": "text", "input": 5}\n\n'
+                               b'{"id": "last", "op": "word", "lang": "en", "input": "six"}\n')
+            connection.shutdown(socket.SHUT_WR)  # the queued request is still answered
+            with connection, connection.makefile("r", encoding="utf-8") as reader:
+                responses = [json.loads(line) for line in reader]
+            self.assertEqual([response["id"] for response in responses], [None, 1, 2, "last"])
+            self.assertIn("invalid JSON", responses[0]["error"])
+            self.assertIn("unknown op", responses[1]["error"])
+            self.assertEqual(responses[3]["result"], 6)
+
+    def test_request_too_long(self):
+        with server.ConversionServer("127.0.0.1:0", ["en"]).start() as conversion_server, \
+                Client(conversion_server.address, lang="en") as client:
+            with self.assertRaisesRegex(ServerError, "request longer than"):
+                client.text_to_num("one " * server.MAX_REQUEST_BYTES)
+
+    @unittest.skipIf(server.ThreadingUnixServer is None, "no Unix domain sockets")
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "w2n.sock")
+            with server.ConversionServer(f"unix:{path}").start() as conversion_server, \
+                    Client(conversion_server.address) as client:
+                self.assertEqual(client.word_to_num("seven", lang="en"), 7)
+            self.assertFalse(os.path.exists(path))
+
+    def test_histogram(self):
+        histogram = server.Histogram()
+        for value in [1, 2, 3, 4, 5, 8, 9]:
+            histogram.add(value)
+        self.assertEqual(histogram.snapshot(), {"count": 7, "mean": 32 / 7,
+                                                "buckets": {"1": 1, "2": 1, "4": 2, "8": 2, "16": 1}})
+        self.assertEqual(parse_address("localhost:99"), (socket.AF_INET, ("localhost", 99)))
+        self.assertRaises(ValueError, server.ConversionServer, "127.0.0.1:0", max_batch=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import logging
+from word2numberi18n import w2n
+from word2numberi18n.spans import NumberSpan
+
+class TestSpans(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestSpans, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    
+    def test_offsets_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        text = 'فصل یک از بخش دو و فصل یک از بخش هیجده'
+        spans = instance.extract_numbers(text)
+        self.assertEqual([span.value for span in spans], ['1', '2', '1', '18'])
+        for span in spans:
+            self.assertEqual(text[span.start:span.end], span.text)
+        self.assertEqual(spans[2].start, text.index('یک', spans[0].end))
+        self.assertEqual(spans[3].text, 'هیجده')
+
+    def test_phone_number_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        text = 'شماره همراه من صفر نهصد و سی و دو پانصد و چهل و هشت هفتاد هشتاد و پنج است'
+        self.assertEqual(instance.extract_numbers(text, ignore_zero=False), [NumberSpan(15, 69, '09325487085', text[15:69])])
+
+    def test_original_text_en(self):
+        instance = w2n.W2N(lang_param="en")
+        text = 'Chapter Twenty-Five:  two  hundred five PAGES, Twenty-Five again.\nthree'
+        self.assertEqual(instance.text_to_num(text), 'Chapter 25:  205 PAGES, 25 again.\n3')
+        spans = instance.extract_numbers(text)
+        self.assertEqual([(span.start, span.end) for span in spans], [(8, 19), (22, 39), (47, 58), (66, 71)])
+
+    def test_offsets_after_replace(self):
+        self.assertEqual(w2n.W2N(lang_param="fr").extract_numbers('Il a Vingt et un ans'), [NumberSpan(5, 16, '21', 'Vingt et un')])
+        self.assertEqual(w2n.W2N(lang_param="es").extract_numbers('tres mil millones de euros'), [NumberSpan(0, 17, '3000000000', 'tres mil millones')])
+        # lower case of "İ" is longer than "İ"
+        self.assertEqual(w2n.W2N(lang_param="en").extract_numbers('İİ a hundred'), [NumberSpan(3, 12, '100', 'a hundred')])
+
+    def test_malformed_en(self):
+        instance = w2n.W2N(lang_param="en")
+        self.assertEqual(instance.text_to_num('one, million million, two'), '1, million million, 2')
+
+
+if __name__ == '__main__':
+    unittest.main()
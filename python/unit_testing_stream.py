@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import io
+import logging
+from word2numberi18n import w2n
+
+class TestStream(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestStream, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    
+    def test_split_numbers_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        text = 'من ورودی سال هزار و سیصد و نود و هشت دانشکده به شماره دانشجویی نود و هشت سی و یک صفر یازده هستم. فصل یک از بخش دو کتاب'
+        expected = instance.text_to_num(text, ignore_zero=False)
+        self.assertEqual(expected, 'من ورودی سال 1398 دانشکده به شماره دانشجویی 9831011 هستم. فصل 1 از بخش 2 کتاب')
+        for size in range(1, 12):
+            chunks = [text[start:start+size] for start in range(0, len(text), size)]
+            self.assertEqual(''.join(instance.text_to_num_stream(chunks, ignore_zero=False)), expected)
+
+    def test_split_point_en(self):
+        # the word after the point decides if the point is part of the number
+        instance = w2n.W2N(lang_param="en")
+        text = 'at some point we paid one point five and the point is one point'
+        expected = instance.text_to_num(text)
+        self.assertEqual(expected, 'at some point we paid 1.5 and the point is 1 point')
+        for size in range(1, 12):
+            chunks = [text[start:start+size] for start in range(0, len(text), size)]
+            self.assertEqual(''.join(instance.text_to_num_stream(chunks)), expected)
+
+    def test_file_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        text = 'به ترتیب بیست و یک و سی و چهار نفر\nدر این دو حادثه آسیب دیدند.\n' * 50
+        pieces = list(instance.text_to_num_stream(io.StringIO(text)))
+        self.assertEqual(''.join(pieces), instance.text_to_num(text))
+        self.assertEqual(list(instance.text_to_num_stream(io.StringIO(''))), [])
+
+    def test_bounded_fa(self):
+        instance = w2n.W2N(lang_param="fa")
+        chunks = ['یک '] * 100
+        pieces = list(instance.text_to_num_stream(chunks, max_pending=10))
+        self.assertGreater(len(pieces), 10)
+        self.assertTrue(all(len(piece) < 20 for piece in pieces))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import operator
+from word2numberi18n import w2n
+from word2numberi18n.tables import load_tables
+
+class TestTables(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestTables, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    def setUp(self):
+        # "w2n.lang" overrides every language parameter
+        self.env_lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.env_lang is not None:
+            os.environ["w2n.lang"] = self.env_lang
+    
+    
+    def test_read_only(self):
+        tables = load_tables("en")
+        self.assertEqual(tables.sorted_measure_values, (1_000_000_000_000, 1_000_000_000, 1_000_000, 1_000, 100))
+        self.assertEqual(tables.point_name, "point")
+        self.assertEqual(tables.decimal_words[0], "zero")
+        self.assertEqual(tables.name_by_value[1000], "thousand")
+        self.assertEqual(tables.measures[0], (1_000_000_000_000, "trillion"))
+        self.assertEqual(tables.measure_words, {"trillion", "billion", "million", "thousand", "hundred"})
+        self.assertRaises(AttributeError, setattr, tables, "point_name", "dot")
+        self.assertRaises(TypeError, operator.setitem, tables.number_system, "dozen", 12)
+
+    def test_replace_whole_words(self):
+        self.assertEqual(load_tables("en").replace("a thousand and an apple"), "one thousand and one apple")
+        self.assertEqual(load_tables("en").replace("hundreds of thousands"), "hundred of thousands")
+        self.assertEqual(load_tables("es").replace("tres mil millones y un millon"), "tres milmillónes y uno millón")
+        self.assertEqual(load_tables("fr").replace("vingt et un, vingt et une"), "vingt-et-un, vingt et un")
+        self.assertEqual(load_tables("pt").replace("dois"), "dois")
+
+    def test_languages_coexist(self):
+        english = w2n.W2N("en")
+        persian = w2n.W2N("fa")
+        german = w2n.W2N("de")
+        self.assertEqual(w2n.W2N("en").sorted_measure_values, english.sorted_measure_values)
+        self.assertNotIn("صد", english.number_system)
+        self.assertNotIn("hundred", persian.number_system)
+        self.assertEqual(english.localizedPointName, "point")
+        self.assertEqual(german.localizedPointName, "komma")
+        self.assertEqual(english.word_to_num("three billion"), 3_000_000_000)
+        self.assertEqual(persian.word_to_num("سه میلیارد"), 3_000_000_000)
+
+    def test_shared_tables(self):
+        tables = load_tables("fa")
+        first = w2n.W2N("fa", tables)
+        second = w2n.W2N("fa", tables)
+        self.assertIs(first.number_system, second.number_system)
+        self.assertEqual(first.word_to_num("صد و بیست"), second.word_to_num("صد و بیست"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import logging
+from word2numberi18n import w2n
+
+# text_to_num fixtures per language: (text, ignore_zero, expected)
+TEXT_FIXTURES = {
+    "de": [
+        ("Ich habe zwei hundert und fünf Euro", True, "Ich habe 205 Euro"),
+        ("zwanzig Euro und drei Cent", True, "20 Euro und 3 Cent"),
+        ("null acht neun", False, "089"),
+        ("Seite vierundzwanzig von dreihundert", True, "Seite 24 von 300"),
+        ("fünf und zwanzig Äpfel", True, "25 Äpfel"),
+        ("Er ist ein guter Mann", True, "Er ist ein guter Mann"),
+        ("ein Mann und eine Frau", True, "ein Mann und eine Frau"),
+        ("ein tausend Euro", True, "1000 Euro"),
+    ],
+    "en": [
+        ("I paid two hundred and five dollars and three cents", True, "I paid 205 dollars and 3 cents"),
+        ("call zero nine one two now", False, "call 0912 now"),
+        ("call zero nine one two now", True, "call 912 now"),
+        ("two point five and seven", True, "2.5 and 7"),
+        # the point word is only part of a number before a digit word
+        ("at some point", True, "at some point"),
+        ("the point is one", True, "the point is 1"),
+        ("one point", True, "1 point"),
+        ("one point, five", True, "1 point, 5"),
+        ("point five", True, "0.5"),
+        ("at some point five", True, "at some 0.5"),
+        ("zero point five", False, "0.5"),
+        # a decimal is never joined with other groups
+        ("one point two point three", True, "1.2 point 3"),
+        ("one two point five", True, "1 2.5"),
+        ("two point five six seven", True, "2.567"),
+        # an ambiguous word like the article "a" is only a number next to another number word
+        ("I have a dog", True, "I have a dog"),
+        ("a couple of hours", True, "a couple of hours"),
+        ("a dozen eggs", True, "a dozen eggs"),
+        ("a hundred dollars", True, "100 dollars"),
+        ("two dozen eggs", True, "2 dozen eggs"),
+        ("one dog", True, "1 dog"),
+    ],
+    "es": [
+        ("Tengo treinta y dos años", True, "Tengo 32 años"),
+        ("dos mil millones de pesos y un euro", True, "2000000000 de pesos y un euro"),
+        ("un perro y una casa", True, "un perro y una casa"),
+        ("un millón de pesos", True, "1000000 de pesos"),
+        ("treinta y un años", True, "31 años"),
+    ],
+    "fa": [
+        ("به ترتیب بیست و یک و سی و چهار نفر", False, "به ترتیب 21 و 34 نفر"),
+        ("صفر نهصد و دوازده", False, "0912"),
+    ],
+    "fr": [
+        ("Il a quarante et un ans", True, "Il a 41 ans"),
+        ("vingt et une fois", True, "21 fois"),
+        # vigesimal numbers, hyphenated and spaced
+        ("quatre-vingt-dix-sept euros", True, "97 euros"),
+        ("soixante-dix-sept", True, "77"),
+        ("quatre vingt dix sept euros", True, "97 euros"),
+        ("soixante dix sept ans", True, "77 ans"),
+        ("soixante et onze", True, "71"),
+        ("quatre vingt", True, "80"),
+        ("en mille neuf cent quatre vingt quatre", True, "en 1984"),
+        ("en mille neuf cent quatre-vingt-quatre", True, "en 1984"),
+        ("dix sept fois", True, "17 fois"),
+        ("un chat et une souris", True, "un chat et une souris"),
+        ("cent un chats", True, "101 chats"),
+    ],
+    "hi": [
+        ("two lakh and five", True, "200005"),
+    ],
+    "pt": [
+        ("tenho cem e vinte reais", True, "tenho 120 reais"),
+        ("um cão e uma casa", True, "um cão e uma casa"),
+        ("vinte e um anos", True, "21 anos"),
+    ],
+    "ru": [
+        ("у меня две тысячи сто двадцать и пять рублей", True, "у меня 2125 рублей"),
+    ],
+    "sk": [
+        ("mám dvadsať a päť rokov", True, "mám 25 rokov"),
+    ],
+}
+
+class TestText(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        super(TestText, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+    
+    
+    def test_fixtures(self):
+        for lang, fixtures in TEXT_FIXTURES.items():
+            instance = w2n.W2N(lang_param=lang)
+            for text, ignore_zero, expected in fixtures:
+                with self.subTest(lang=lang, text=text):
+                    self.assertEqual(instance.text_to_num(text, ignore_zero=ignore_zero), expected)
+
+    def test_vigesimal(self):
+        # French 70 to 99 in a text, hyphenated and spaced, with both engines
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="fr", engine=engine)
+            for number in range(70, 100):
+                hyphenated = instance.tables.name_by_value[number]
+                for words in (hyphenated, hyphenated.replace("-", " ")):
+                    with self.subTest(engine=engine, words=words):
+                        self.assertEqual(instance.text_to_num(f"il a {words} ans"), f"il a {number} ans")
+
+    def test_text_words(self):
+        for lang in TEXT_FIXTURES:
+            tables = w2n.W2N(lang_param=lang).tables
+            with self.subTest(lang=lang):
+                self.assertEqual(len(tables.conjunctions), 1)
+                self.assertEqual(len(tables.zero_words), 1)
+                self.assertTrue(tables.zero_words <= set(tables.number_system))
+
+
+if __name__ == '__main__':
+    unittest.main()
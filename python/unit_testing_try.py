@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+from word2numberi18n import w2n
+from word2numberi18n import results
+from word2numberi18n.cache import ResultCache
+from word2numberi18n.results import ConversionResult
+
+# (text, error code, offending word, index of the word) the same for both engines
+FIXTURES = [
+    ("million million", results.REDUNDANT_WORD, "million", 1),
+    ("two million and three million", results.REDUNDANT_WORD, "million", 4),
+    ("thousand million", results.MEASURE_SEQUENCE, "million", 1),
+    ("five thousand, three million", results.MEASURE_SEQUENCE, "million", 3),
+    ("two point five point one", results.REDUNDANT_POINT, "point", 3),
+    ("one point thousand", results.MEASURE_AFTER_POINT, "thousand", 2),
+    ("hello world", results.NO_NUMBER_WORDS, None, None),
+    ("1 2", results.NUMERALS_WITHOUT_MEASURE, "2", 1),
+    ("5 thousand million", results.MEASURE_SEQUENCE, "million", 2),
+    ("1 hundred 5 hundred", results.PLACE_SET, "hundred", 3),
+]
+
+
+class TestTry(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestTry, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def test_errors(self):
+        for engine in w2n.ENGINES:
+            instance = w2n.W2N(lang_param="en", engine=engine)
+            for text, error, token, index in FIXTURES:
+                with self.subTest(engine=engine, text=text):
+                    result = instance.try_word_to_num(text)
+                    self.assertEqual(result, ConversionResult(error=error, token=token, index=index))
+                    self.assertFalse(result.ok)
+                    self.assertIsNone(result.value)
+                    with self.assertRaises(ValueError) as context:
+                        instance.word_to_num(text)
+                    self.assertEqual(str(context.exception), result.message)
+        result = w2n.W2N(lang_param="en", engine="fsm").try_word_to_num("twenty thirty")
+        self.assertEqual((result.error, result.token, result.index), (results.PLACE_SET, "thirty", 1))
+        self.assertEqual(w2n.W2N(lang_param="en").try_word_to_num(["two"]).error, results.INVALID_TYPE)
+
+    def test_values(self):
+        instance = w2n.W2N(lang_param="en")
+        self.assertEqual(instance.try_word_to_num("two hundred and five"), ConversionResult(205))
+        self.assertEqual(instance.try_word_to_num(3.5).value, 3.5)
+        self.assertEqual(instance.try_word_to_num("1,250").value, 1250)
+        self.assertEqual(instance.try_word_to_num("two point zero five", result_type="scaled").value, (205, 2))
+        result = instance.try_word_to_num("seven")
+        self.assertTrue(result.ok)
+        self.assertIsNone(result.message)
+        self.assertEqual(result.unwrap(), 7)
+        self.assertRaises(AttributeError, setattr, result, "other", 1)
+        self.assertRaises(ValueError, instance.try_word_to_num, "seven", result_type="roman")
+
+    def test_module(self):
+        self.assertEqual(w2n.try_word_to_num("ninety-eight", "en").value, 98)
+        self.assertEqual(w2n.try_word_to_num("xyz qwv", w2n.AUTO).error, results.NO_LANGUAGE)
+        self.assertEqual(w2n.try_word_to_num("million million", w2n.AUTO).error, results.REDUNDANT_WORD)
+        with self.assertRaises(ValueError) as context:
+            w2n.word_to_num("xyz qwv", w2n.AUTO)
+        self.assertTrue(str(context.exception).startswith("No valid number words found in any language!"))
+
+    def test_cache(self):
+        cache = ResultCache()
+        instance = w2n.W2N(lang_param="fa", result_cache=cache)
+        first = instance.try_word_to_num("میلیون میلیون")
+        self.assertIs(instance.try_word_to_num("میلیون میلیون"), first)
+        self.assertRaises(ValueError, instance.word_to_num, "میلیون میلیون")
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_batch(self):
+        instance = w2n.W2N(lang_param="en")
+        batch = instance.word_to_num_many(["one", "million million", "two"])
+        with self.assertRaises(ValueError) as context:
+            instance.word_to_num("million million")
+        self.assertEqual(batch.errors, {1: str(context.exception)})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+import unittest
+import sys
+import os
+import logging
+import random
+from word2numberi18n import w2n
+from word2numberi18n.bench import make_corpus
+from word2numberi18n.instrument import profile
+from word2numberi18n.tables import available_languages
+
+try:
+    from word2numberi18n import vectorized
+except ImportError:  # NumPy is an optional extra
+    vectorized = None
+
+
+@unittest.skipIf(vectorized is None, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestVectorized, cls).setUpClass()
+        logging.basicConfig(stream=sys.stderr, level=logging.INFO)
+        log = logging.getLogger("SYSTEM")
+        log.info(f"Testsystem is {sys.implementation.name} v{sys.version_info.major}.{sys.version_info.minor}@{sys.platform}")
+
+    def setUp(self):
+        self.lang = os.environ.pop("w2n.lang", None)
+
+    def tearDown(self):
+        if self.lang is not None:
+            os.environ["w2n.lang"] = self.lang
+
+    def assertSameBatch(self, first, second):
+        self.assertEqual(first.to_list(), second.to_list())
+        self.assertEqual(first.values, second.values)
+        self.assertEqual(first.valid, second.valid)
+        self.assertEqual(first.overflow, second.overflow)
+        self.assertEqual(first.errors, second.errors)
+        self.assertEqual(first.scales, second.scales)
+
+    def test_same_results(self):
+        # corpora and random word sequences with errors, decimals, numerals and other inputs
+        rng = random.Random(7)
+        for lang in available_languages():
+            scalar = w2n.W2N(lang_param=lang, engine="fsm")
+            numpy_engine = w2n.W2N(lang_param=lang, engine="fsm")
+            numpy_engine.vectorized = True
+            tables = scalar.tables
+            vocabulary = [*tables.number_system, *tables.normalize_data, tables.point_name, *tables.conjunctions, "x", "12"]
+            inputs = make_corpus(tables, "phrases", 100) + make_corpus(tables, "long_numbers", 100)
+            inputs += [" ".join(rng.choice(vocabulary) for _ in range(rng.randrange(1, 7))) for _ in range(500)]
+            inputs += [3, 2.5, None, ["two"], "1,250", "two " * 40]
+            for result_type in ("number", "scaled"):
+                with self.subTest(lang=lang, result_type=result_type):
+                    self.assertSameBatch(numpy_engine.word_to_num_many(inputs, result_type=result_type),
+                                         scalar.word_to_num_many(inputs, result_type=result_type))
+
+    def test_rows(self):
+        instance = w2n.W2N(lang_param="en", engine="fsm")
+        instance.vectorized = True
+        inputs = ["two hundred and five", "million million", "two point five", "twenty-one"] * 100
+        with profile() as collected:
+            result = instance.word_to_num_many(inputs)
+        self.assertEqual(result.to_list()[:4], [205, None, 2.5, 21])
+        self.assertEqual(collected.counters["vectorized_rows"], 2)  # the others by the scalar path
+        self.assertEqual(collected.counters["word_to_num_errors"], 1)
+        self.assertIn("vectorize", collected.to_dict()["stages"])
+
+    def test_scalar_batches(self):
+        # small batches, is_separate, other result types and the legacy engine keep the scalar path
+        instance = w2n.W2N(lang_param="en", engine="legacy")
+        instance.vectorized = True
+        with profile() as collected:
+            instance.word_to_num_many(["twenty thirty"] * 300)
+            w2n.W2N(lang_param="en").word_to_num_many(["two"] * 10)
+        self.assertNotIn("vectorized_rows", collected.counters)
+        self.assertEqual(instance.word_to_num_many(["twenty thirty"] * 300).to_list()[0], 50)
+
+    def test_encode(self):
+        tables = w2n.W2N(lang_param="en").tables
+        word_ids, classes, values = tables.token_ids()
+        ids = vectorized.encode(word_ids, "ninety-eight and hello")
+        self.assertEqual([values[token_id] for token_id in ids], [90, 8, 0, 0])
+        self.assertIs(tables.token_ids(), tables.token_ids())
+
+
+if __name__ == '__main__':
+    unittest.main()
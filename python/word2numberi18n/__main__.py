@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   python -m word2numberi18n, see word2numberi18n.cli
+'''
+import sys
+
+from word2numberi18n.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
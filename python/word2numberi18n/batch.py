@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   columnar results of batch conversions
+'''
+from array import array
+
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+class BatchResult:
+    ''' Columnar result of a batch conversion
+
+    values:   int64 column, 0 where the item has no int64 value
+    valid:    mask with 1 where values holds the result of the item
+    overflow: index to result for results without int64 value (float, str or big int)
+    errors:   index to error message for items which could not be converted
+    scales:   only for scaled results, count of digits after the point, values holds the number times 10**scale
+    '''
+
+    __slots__ = ("values", "valid", "overflow", "errors", "scales")
+
+    def __init__(self, scaled: bool=False):
+        self.values = array("q")
+        self.valid = bytearray()
+        self.overflow = {}
+        self.errors = {}
+        self.scales = bytearray() if scaled else None
+
+    @classmethod
+    def from_numpy(cls, values, valid, overflow: dict, errors: dict, scales=None):
+        """ [internal] function to build a result from whole columns, eg. of the vectorized engine
+
+        input: int64 array, bool or uint8 array, overflow and errors like the attributes, uint8 array of scales or None
+        output: BatchResult
+        """
+        batch = cls(scaled=scales is not None)
+        batch.values.frombytes(values.astype("=i8", copy=False).tobytes())
+        batch.valid = bytearray(valid.astype("u1", copy=False).tobytes())
+        batch.overflow = overflow
+        batch.errors = errors
+        if scales is not None:
+            batch.scales = bytearray(scales.astype("u1", copy=False).tobytes())
+        return batch
+
+    def append(self, result):
+        """ [internal] function to add the result of the next item
+        """
+        if type(result) is int and INT64_MIN <= result <= INT64_MAX:
+            self.values.append(result)
+            self.valid.append(1)
+        else:
+            self.overflow[len(self.values)] = result
+            self.values.append(0)
+            self.valid.append(0)
+
+    def append_scaled(self, result):
+        """ [internal] function to add the (integer, scale) result of the next item
+        int and float inputs are given back as they are, an int is added with scale 0
+        """
+        if type(result) is tuple:
+            value, scale = result
+        else:
+            value, scale = result, 0
+        if type(value) is int and INT64_MIN <= value <= INT64_MAX and scale < 256:
+            self.values.append(value)
+            self.valid.append(1)
+            self.scales.append(scale)
+        else:
+            self.overflow[len(self.values)] = result
+            self.values.append(0)
+            self.valid.append(0)
+            self.scales.append(0)
+
+    def append_error(self, message: str):
+        """ [internal] function to add the error of the next item
+        """
+        self.errors[len(self.values)] = message
+        self.values.append(0)
+        self.valid.append(0)
+        if self.scales is not None:
+            self.scales.append(0)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index: int):
+        """ public function to get the result of one item
+        output: result or None if the item could not be converted
+        """
+        if index < 0:
+            index += len(self.values)
+        if self.valid[index]:
+            if self.scales is not None:
+                return self.values[index], self.scales[index]
+            return self.values[index]
+        return self.overflow.get(index)
+
+    def to_list(self) -> list:
+        """ public function to get the results as list, None for errors
+        """
+        return [self[index] for index in range(len(self.values))]
+
+    def to_numpy(self):
+        """ public function to get the int64 column and the validity mask as NumPy arrays
+        the arrays share the memory of this result
+
+        output: tuple of int64 array and bool array, for scaled results with the uint8 array of the scales
+        raise: ImportError if NumPy is not installed
+        """
+        import numpy
+        arrays = numpy.frombuffer(self.values, dtype=numpy.int64), numpy.frombuffer(self.valid, dtype=numpy.bool_)
+        if self.scales is not None:
+            return arrays + (numpy.frombuffer(self.scales, dtype=numpy.uint8),)
+        return arrays
+
+    def __repr__(self):
+        return f"{type(self).__name__}(size={len(self.values)}, errors={len(self.errors)})"
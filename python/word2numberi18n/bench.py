@@ -0,0 +1,492 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   benchmark suite for every bundled language
+
+   usage: python -m word2numberi18n.bench [--lang en fa ...] [--size 2000] [--repeat 3]
+                                          [--seed 42] [--engine fsm] [--output result.json]
+
+   The corpora are generated from the vocabulary of the configuration files with a seeded
+   random generator, so the same arguments give the same corpora on every machine.
+'''
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import sysconfig
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+
+from word2numberi18n import pack
+from word2numberi18n.batch import BatchResult
+from word2numberi18n.parallel import convert_parallel
+from word2numberi18n.tables import available_languages, load_tables
+from word2numberi18n.w2n import W2N, ENGINES
+
+
+FORMAT_VERSION = 1
+# workload name to the converting method of W2N or to convert_parallel
+WORKLOADS = {
+    "phrases": "word_to_num",
+    "long_numbers": "word_to_num",
+    "decimals": "word_to_num",
+    "free_text": "text_to_num",
+    "compounds": "word_to_num",
+    "decimals_str": "word_to_num",
+    "decimals_decimal": "word_to_num",
+    "decimals_scaled": "word_to_num",
+    "threads": "convert_parallel",
+    "sparse_text": "text_to_num",
+    "sparse_unfiltered": "text_to_num",
+    "batch": "word_to_num_many",
+    "batch_vectorized": "word_to_num_many",
+    "malformed": "word_to_num",
+    "malformed_try": "try_word_to_num",
+    "normalize": "normalize",
+    "zero_text": "text_to_num",
+    "engine_legacy": "word_to_num",
+    "engine_fsm": "word_to_num",
+}
+# operations which convert the whole corpus in one call
+BATCH_OPERATIONS = ("convert_parallel", "word_to_num_many")
+# workloads measured on the corpus of another workload
+CORPORA = {
+    "decimals_str": "decimals",
+    "decimals_decimal": "decimals",
+    "decimals_scaled": "decimals",
+    "threads": "long_numbers",
+    "sparse_unfiltered": "sparse_text",
+    "batch": "long_numbers",
+    "batch_vectorized": "long_numbers",
+    "malformed_try": "malformed",
+    "engine_legacy": "long_numbers",
+    "engine_fsm": "long_numbers",
+}
+# keyword arguments of the converting method
+ARGUMENTS = {
+    "decimals_str": {"result_type": "str"},
+    "decimals_decimal": {"result_type": "decimal"},
+    "decimals_scaled": {"result_type": "scaled"},
+    "threads": {"op": "word", "workers": os.cpu_count() or 1},
+    "zero_text": {"ignore_zero": False},
+}
+# attributes of the W2N instance of the workload
+SETTINGS = {
+    "sparse_unfiltered": {"prefilter": False},
+    "batch": {"engine": "fsm"},
+    "batch_vectorized": {"engine": "fsm", "vectorized": True},
+    "engine_legacy": {"engine": "legacy"},
+    "engine_fsm": {"engine": "fsm"},
+}
+FILLER_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do")
+SPARSE_NUMBER_SHARE = 0.1
+MALFORMED_SHARE = 0.33
+
+
+def small_number_words(tables, number: int) -> list:
+    """ [internal] function to get the words of a number under 1000 from the canonical names of a language
+
+    input: LanguageTables, number
+    output: list of words
+    """
+    names = tables.name_by_value
+    words = []
+    hundreds, rest = divmod(number, 100)
+    if hundreds > 1 and hundreds * 100 in names:
+        words.append(names[hundreds * 100])
+    elif hundreds == 1:
+        words.append(names[100])
+    elif hundreds > 1:
+        words += [names[hundreds], names[100]]
+    if rest in names and (rest > 0 or not words):
+        words.append(names[rest])
+    elif rest > 0:
+        words += [names[rest // 10 * 10], names[rest % 10]]
+    return words
+
+
+def make_number(tables, rng, all_measures: bool=False):
+    """ [internal] function to get a random well formed number with measure words
+
+    input: LanguageTables, random generator, True to use every measure word of the language
+    output: tuple of words and value
+    """
+    measures = [value for value in tables.sorted_measure_values if value >= 1000]
+    words = []
+    number = 0
+    limit = 1000
+    for index, measure in enumerate(measures):
+        higher = measures[index - 1] if index > 0 else measure * 1000
+        if all_measures or rng.random() < 0.5:
+            multiplier = rng.randrange(1, min(higher // measure, 1000))
+            words += small_number_words(tables, multiplier) + [tables.name_by_value[measure]]
+            number += multiplier * measure
+        limit = measure
+    rest = rng.randrange(min(limit, 1000))
+    if rest > 0 or not words:
+        words += small_number_words(tables, rest)
+        number += rest
+    return " ".join(words), number
+
+
+def make_text(tables, rng) -> str:
+    """ [internal] function to get filler text with up to three numbers and conjunctions
+
+    input: LanguageTables, random generator
+    output: text
+    """
+    conjunctions = sorted(tables.conjunctions) or [""]
+    words = []
+    for _ in range(rng.randrange(1, 4)):
+        words += rng.sample(FILLER_WORDS, rng.randrange(1, 6))
+        words.append(make_number(tables, rng)[0])
+        words.append(rng.choice(conjunctions))
+    words += rng.sample(FILLER_WORDS, rng.randrange(1, 6))
+    return " ".join(word for word in words if word)
+
+
+def zero_text(tables, rng) -> str:
+    """ [internal] function to get filler text with numbers and a number read in digits after a zero word, eg. "zero nine one two"
+
+    input: LanguageTables, random generator
+    output: text
+    """
+    digits = [rng.choice(tables.decimal_words) for _ in range(rng.randrange(2, 9))]
+    return " ".join([make_text(tables, rng), min(tables.zero_words, default=tables.decimal_words[0]), *digits])
+
+
+def number_free_sentence(rng) -> str:
+    """ [internal] function to get a sentence of filler words with punctuation and without numbers
+    """
+    words = [rng.choice(FILLER_WORDS) for _ in range(rng.randrange(5, 25))]
+    words[0] = words[0].capitalize()
+    return " ".join(word + ("," if rng.random() < 0.1 else "") for word in words) + "."
+
+
+def rule_text(tables, rng) -> str:
+    """ [internal] function to get a text of number words, words of the replacement rules and filler words
+
+    input: LanguageTables, random generator
+    output: text
+    """
+    words = [*tables.number_system, *tables.normalize_data, *FILLER_WORDS]
+    return " ".join(rng.choice(words) for _ in range(rng.randrange(5, 40)))
+
+
+def compound_word(tables, number: int) -> str:
+    """ [internal] function to get a number under 1000 written as one word, eg. "dreihundertvierundzwanzig"
+
+    input: LanguageTables, number
+    output: compound word
+    """
+    # the shortest spelling of each word, eg. "hundert" for "einhundert"
+    shortest = {}
+    for word, replacement in tables.normalize_data.items():
+        if len(word) < len(shortest.get(replacement, replacement)):
+            shortest[replacement] = word
+    words = [shortest.get(word, word) for word in small_number_words(tables, number)]
+    rest = number % 100
+    if tables.unit_first and rest > 0 and rest not in tables.name_by_value:
+        words[-2:] = [words[-1], min(tables.conjunctions, default=""), words[-2]]
+    return "".join(words)
+
+
+def applies(tables, workload: str) -> bool:
+    """ [internal] function to check if a workload is measured for a language
+
+    input: LanguageTables, workload name
+    output: False for compounds of a language without compound number words and for batch_vectorized without NumPy
+    """
+    if workload == "compounds":
+        return tables.segmenter is not None
+    if workload == "batch_vectorized":
+        return importlib.util.find_spec("numpy") is not None
+    return True
+
+
+def make_corpus(tables, workload: str, size: int, seed: int=42) -> list:
+    """ public function to generate the deterministic corpus of a workload
+
+    phrases:      single words and numbers under 1000
+    long_numbers: numbers with every measure word of the language
+    decimals:     numbers with point and up to four digit words
+    free_text:    filler text with up to three numbers and conjunctions
+    zero_text:    free_text and a number read in digits after a zero word
+    sparse_text:  number-free sentences, a tenth of the items are free_text
+    malformed:    phrases, a third of them with a measure word twice (eg. "five million million")
+    compounds:    numbers under 1000 written as one word (languages with the option compound)
+    normalize:    number words, words of the replacement rules and filler words
+    the other workloads use the corpus of the workload in CORPORA
+
+    input: LanguageTables, workload name, count of items, seed
+    output: list of strings
+    """
+    workload = CORPORA.get(workload, workload)
+    rng = random.Random(f"{seed}:{tables.lang}:{workload}")
+    corpus = []
+    for _ in range(size):
+        if workload == "phrases":
+            corpus.append(" ".join(small_number_words(tables, rng.randrange(1000))))
+        elif workload == "long_numbers":
+            corpus.append(make_number(tables, rng, all_measures=True)[0])
+        elif workload == "decimals":
+            digits = [rng.choice(tables.decimal_words) for _ in range(rng.randrange(1, 5))]
+            corpus.append(" ".join([make_number(tables, rng)[0], tables.point_name] + digits))
+        elif workload == "free_text":
+            corpus.append(make_text(tables, rng))
+        elif workload == "zero_text":
+            corpus.append(zero_text(tables, rng))
+        elif workload == "sparse_text":
+            corpus.append(make_text(tables, rng) if rng.random() < SPARSE_NUMBER_SHARE else number_free_sentence(rng))
+        elif workload == "malformed":
+            phrase = " ".join(small_number_words(tables, rng.randrange(1000)))
+            measure = tables.measures[0][1]
+            corpus.append(f"{phrase} {measure} {measure}" if rng.random() < MALFORMED_SHARE else phrase)
+        elif workload == "compounds":
+            corpus.append(compound_word(tables, rng.randrange(1, 1000)))
+        elif workload == "normalize":
+            corpus.append(rule_text(tables, rng))
+        else:
+            raise ValueError(f"Unknown workload {workload}! Please use one of {', '.join(WORKLOADS)}")
+    return corpus
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """ [internal] function to get the nearest rank percentile of sorted values
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))]
+
+
+def measure_workload(convert, corpus: list, repeat: int, batch: bool=False) -> dict:
+    """ [internal] function to measure throughput, latency and peak memory of a converting function
+
+    input: function, corpus, count of timed runs (ValueError and ConversionResult with error are errors),
+           True if the function converts the whole corpus to a BatchResult or a list with None for errors
+           (latency per item of the run)
+    output: dict of measurements
+    """
+    perf_counter_ns = time.perf_counter_ns
+    latencies = []
+    best = None
+    errors = 0
+    for _ in range(max(repeat, 1)):
+        errors = 0
+        run_start = perf_counter_ns()
+        if batch:
+            results = convert(corpus)
+            errors = len(results.errors) if isinstance(results, BatchResult) else results.count(None)
+        else:
+            for item in corpus:
+                start = perf_counter_ns()
+                try:
+                    error = getattr(convert(item), "error", None) is not None
+                except ValueError:
+                    error = True
+                latencies.append(perf_counter_ns() - start)
+                errors += error
+        duration = perf_counter_ns() - run_start
+        if batch:
+            latencies.append(duration / max(len(corpus), 1))
+        best = duration if best is None else min(best, duration)
+
+    # the memory is traced in an extra run, tracing slows down the timed runs
+    tracemalloc.start()
+    try:
+        if batch:
+            convert(corpus)
+        else:
+            for item in corpus:
+                try:
+                    convert(item)
+                except ValueError:
+                    pass
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "items": len(corpus),
+        "errors": errors,
+        "ops_per_sec": len(corpus) / (best / 1e9) if best else 0.0,
+        "p50_us": percentile(latencies, 0.50) / 1e3,
+        "p99_us": percentile(latencies, 0.99) / 1e3,
+        "peak_bytes": peak_bytes,
+    }
+
+
+def measure_construction(lang: str, repeat: int, engine: str=None) -> dict:
+    """ [internal] function to measure the construction of a W2N instance with loading of the configuration file
+    """
+    durations = []
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        W2N(lang_param=lang, engine=engine)
+        durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        W2N(lang_param=lang, engine=engine)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    durations.sort()
+    return {"seconds": percentile(durations, 0.50), "min_seconds": durations[0], "peak_bytes": peak_bytes}
+
+
+def measure_loading(lang: str, repeat: int) -> dict:
+    """ [internal] function to measure loading the tables of a language from the pack and from the configuration file
+    """
+    results = {}
+    for name, use_pack in (("pack_seconds", True), ("text_seconds", False)):
+        durations = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            load_tables(lang, use_pack=use_pack)
+            durations.append(time.perf_counter() - start)
+        durations.sort()
+        results[name] = percentile(durations, 0.50)
+    results["pack_current"] = pack.is_current(lang)
+    return results
+
+
+def measure_startup(repeat: int) -> dict:
+    """ [internal] function to measure the import time of word2numberi18n.w2n in a new interpreter
+    """
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = package_root + os.pathsep + environment.get("PYTHONPATH", "")
+    code = "import time; start = time.perf_counter(); import word2numberi18n.w2n; print(time.perf_counter() - start)"
+    durations = []
+    for _ in range(max(repeat, 1)):
+        output = subprocess.run([sys.executable, "-c", code], env=environment, check=True,
+                                capture_output=True, text=True).stdout
+        durations.append(float(output))
+    durations.sort()
+    return {"import_seconds": percentile(durations, 0.50), "min_import_seconds": durations[0]}
+
+
+def package_version():
+    """ [internal] function to get the version of the installed distribution or None
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python before 3.8
+        return None
+    try:
+        return version("word2number-i18n")
+    except PackageNotFoundError:
+        return None
+
+
+def run(langs=None, size: int=2000, repeat: int=3, seed: int=42, engine: str=None,
+        workloads=None, startup: bool=True) -> dict:
+    """ public function to run the benchmark suite
+
+    input: language codes (all bundled languages if None), corpus size per workload, timed runs,
+           seed of the corpora, parser engine (W2N.engine if None), workload names (all if None),
+           False to skip the startup measurement
+    output: dict ready for JSON
+    """
+    langs = list(langs or available_languages())
+    workloads = list(workloads or WORKLOADS)
+    report = {
+        "format": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "package_version": package_version(),
+        "python": platform.python_version(),
+        "implementation": sys.implementation.name,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "free_threaded": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+        "settings": {"size": size, "repeat": repeat, "seed": seed, "engine": engine or W2N.engine,
+                     "workloads": workloads},
+        "startup": measure_startup(repeat) if startup else None,
+        "languages": {},
+    }
+    for lang in langs:
+        tables = load_tables(lang)
+        instance = W2N(lang_param=lang, tables=tables, engine=engine)
+        results = {"construction": measure_construction(lang, repeat, engine),
+                   "loading": measure_loading(lang, repeat), "workloads": {}}
+        for workload in workloads:
+            if not applies(tables, workload):
+                continue
+            method = WORKLOADS[workload]
+            arguments = ARGUMENTS.get(workload, {})
+            settings = SETTINGS.get(workload, {})
+            workload_instance = instance
+            if settings:
+                workload_instance = W2N(lang_param=lang, tables=tables, engine=engine)
+                for name, value in settings.items():
+                    setattr(workload_instance, name, value)
+            corpus = make_corpus(tables, workload, size, seed)
+            if method == "convert_parallel":
+                convert = partial(convert_parallel, lang=lang, engine=instance.engine, **arguments)
+            else:
+                convert = partial(getattr(workload_instance, method), **arguments)
+            measurement = measure_workload(convert, corpus, repeat, method in BATCH_OPERATIONS)
+            measurement["operation"] = method
+            measurement["arguments"] = arguments
+            measurement["settings"] = settings
+            results["workloads"][workload] = measurement
+        report["languages"][lang] = results
+    return report
+
+
+def format_report(report: dict) -> str:
+    """ [internal] function to format a report as table for the console
+    """
+    lines = [f"{'lang':<5}{'workload':<18}{'ops/s':>12}{'p50 us':>10}{'p99 us':>10}{'peak KiB':>10}{'errors':>8}"]
+    for lang, results in report["languages"].items():
+        for workload, measurement in results["workloads"].items():
+            lines.append(f"{lang:<5}{workload:<18}{measurement['ops_per_sec']:>12,.0f}{measurement['p50_us']:>10.1f}"
+                         f"{measurement['p99_us']:>10.1f}{measurement['peak_bytes'] / 1024:>10.1f}{measurement['errors']:>8}")
+        construction = results["construction"]
+        lines.append(f"{lang:<5}{'construction':<18}{'':>12}{construction['seconds'] * 1e6:>10.1f}{'':>10}"
+                     f"{construction['peak_bytes'] / 1024:>10.1f}")
+        loading = results["loading"]
+        lines.append(f"{lang:<5}{'load pack':<18}{'':>12}{loading['pack_seconds'] * 1e6:>10.1f}"
+                     + ("" if loading["pack_current"] else "  (stale pack, parsed the configuration file)"))
+        lines.append(f"{lang:<5}{'load text':<18}{'':>12}{loading['text_seconds'] * 1e6:>10.1f}")
+    if report["startup"] is not None:
+        lines.append(f"import word2numberi18n.w2n: {report['startup']['import_seconds'] * 1e3:.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m word2numberi18n.bench",
+                                     description="Benchmark word_to_num and text_to_num for the bundled languages.")
+    parser.add_argument("--lang", nargs="+", choices=available_languages(), help="languages, default all")
+    parser.add_argument("--workload", nargs="+", choices=list(WORKLOADS), help="workloads, default all")
+    parser.add_argument("--size", type=int, default=2000, help="items per workload and language")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs, the best run counts")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the synthetic corpora")
+    parser.add_argument("--engine", choices=ENGINES, help="parser engine, default W2N.engine")
+    parser.add_argument("--no-startup", action="store_true", help="skip the import time measurement")
+    parser.add_argument("--output", help="JSON file, default JSON to stdout")
+    arguments = parser.parse_args(argv)
+
+    report = run(arguments.lang, arguments.size, arguments.repeat, arguments.seed, arguments.engine,
+                 arguments.workload, not arguments.no_startup)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2, ensure_ascii=False)
+        print(format_report(report))
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+
+if __name__ == '__main__':
+    main()
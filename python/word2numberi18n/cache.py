@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   bounded result cache for repetitive inputs
+'''
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    ''' Thread-safe LRU cache of conversion results
+
+    The results of `W2N.try_word_to_num` are cached, malformed inputs too as ConversionResult
+    with the error code. Exceptions of the conversion (only ValueError for an unknown result
+    type) are raised and not cached.
+    '''
+
+    def __init__(self, max_size: int=1024):
+        """ max_size: maximum count of cached results
+        """
+        self.max_size = max_size
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_convert(self, key, convert, *args):
+        """ [internal] function to get a cached result or to convert and cache it
+
+        input: hashable key, conversion function and its arguments, the function returns no None
+        output: cached or new result of the conversion
+        raise: exception of the conversion, it is not cached
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self.hits += 1
+                self._results.move_to_end(key)
+            else:
+                self.misses += 1
+        if result is None:
+            result = convert(*args)
+            self._store(key, result)
+        return result
+
+    def _store(self, key, result):
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > max(self.max_size, 0):
+                self._results.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """ public function to remove all results and reset the counters
+        """
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> dict:
+        """ public function to get a snapshot of the cache counters
+        """
+        with self._lock:
+            return {
+                "size": len(self._results),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self):
+        return len(self._results)
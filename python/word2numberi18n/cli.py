@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   command line tool for bulk conversion of line-delimited input
+
+   usage: python -m word2numberi18n [--mode word|text|spans] [--lang en] [--workers N]
+                                    [--chunk-size LINES] [--output FILE] [FILE ...]
+
+   word:  every line is converted with word_to_num, lines which are no number give an empty line
+   text:  every line is converted with text_to_num
+   spans: every line gives one JSON object with the numbers found by extract_numbers
+
+   The lines are sent in chunks to a pool of worker processes, each with its own preloaded
+   language tables. The output keeps the order of the input and only a few chunks per worker
+   are in flight, so the memory stays bounded for inputs of any size.
+'''
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from word2numberi18n.w2n import W2N, ENGINES, registry
+
+
+MODES = ("word", "text", "spans")
+DEFAULT_CHUNK_SIZE = 10000
+# chunks in flight per worker, enough to keep the workers busy while the output is written
+CHUNKS_PER_WORKER = 2
+
+# language instance of this worker process
+_worker = None
+
+
+def init_worker(lang: str, engine: str=None):
+    """ [internal] function to preload the language tables of a worker process
+    """
+    global _worker
+    tables = registry.get(lang)
+    _worker = W2N(lang_param=tables.lang, tables=tables, engine=engine)
+
+
+def convert_chunk(chunk, mode: str, ignore_zero: bool=True):
+    """ [internal] function to convert one chunk of lines in a worker process
+
+    input: tuple of the number of the first line and the list of lines without line end, mode, ignore_zero
+    output: tuple of the converted text, the count of lines, errors and input characters
+    """
+    first_line, lines = chunk
+    instance = _worker
+    output = []
+    errors = 0
+    if mode == "word":
+        for line in lines:
+            result = instance.try_word_to_num(line)
+            if result.error is None:
+                output.append(str(result.value))
+            else:
+                output.append("")
+                errors += 1
+    elif mode == "text":
+        for line in lines:
+            try:
+                output.append(instance.text_to_num(line, ignore_zero))
+            except ValueError:
+                output.append(line)
+                errors += 1
+    else:
+        for line_number, line in enumerate(lines, first_line):
+            try:
+                spans = [span._asdict() for span in instance.extract_numbers(line, ignore_zero)]
+            except ValueError:
+                spans = []
+                errors += 1
+            output.append(json.dumps({"line": line_number, "spans": spans}, ensure_ascii=False))
+    output.append("")
+    return "\n".join(output), len(lines), errors, sum(map(len, lines))
+
+
+def read_chunks(streams, chunk_size: int):
+    """ [internal] function to read the lines of text streams in chunks
+
+    input: iterable of text streams, lines per chunk
+    output: generator of (number of the first line, list of lines without line end)
+    """
+    chunk = []
+    first_line = 1
+    for stream in streams:
+        for line in stream:
+            chunk.append(line.rstrip("\r\n"))
+            if len(chunk) >= chunk_size:
+                yield first_line, chunk
+                first_line += len(chunk)
+                chunk = []
+    if chunk:
+        yield first_line, chunk
+
+
+def open_inputs(paths, encoding: str):
+    """ [internal] function to open the input files one after another, "-" is stdin
+    """
+    for path in paths or ["-"]:
+        if path == "-":
+            yield sys.stdin
+        else:
+            with open(path, "r", encoding=encoding, newline="") as stream:
+                yield stream
+
+
+def run(chunks, output, mode: str="word", lang: str=None, workers: int=1, engine: str=None,
+        ignore_zero: bool=True) -> dict:
+    """ public function to convert chunks of lines and to write the results in input order
+
+    input: iterable of (number of the first line, list of lines), writable text stream, mode,
+           language, count of worker processes (1 converts in this process), parser engine, ignore_zero
+    output: dict with lines, errors, input characters and seconds
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode}! Please use one of {', '.join(MODES)}")
+    start = time.perf_counter()
+    totals = {"lines": 0, "errors": 0, "characters": 0}
+
+    def write(result):
+        text, lines, errors, characters = result
+        output.write(text)
+        totals["lines"] += lines
+        totals["errors"] += errors
+        totals["characters"] += characters
+
+    if workers <= 1:
+        init_worker(lang, engine)
+        for chunk in chunks:
+            write(convert_chunk(chunk, mode, ignore_zero))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(lang, engine)) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(convert_chunk, chunk, mode, ignore_zero))
+                if len(pending) >= workers * CHUNKS_PER_WORKER:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+
+def format_summary(totals: dict) -> str:
+    """ [internal] function to format the throughput and error summary
+    """
+    seconds = max(totals["seconds"], 1e-9)
+    return (f"{totals['lines']} lines, {totals['errors']} errors in {totals['seconds']:.2f} s: "
+            f"{totals['lines'] / seconds:,.0f} lines/s, {totals['characters'] / seconds / 1e6:.2f} M characters/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m word2numberi18n",
+                                     description="Convert number words in line-delimited files or stdin.")
+    parser.add_argument("files", nargs="*", help="input files, default or \"-\" for stdin")
+    parser.add_argument("--mode", choices=MODES, default="word",
+                        help="word: word_to_num per line, text: text_to_num per line, spans: extract_numbers as JSONL")
+    parser.add_argument("--lang", help="language, default from the environment")
+    parser.add_argument("--engine", choices=ENGINES, help="parser engine, default W2N.engine")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes, default CPU count")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="lines per chunk of work")
+    parser.add_argument("--keep-zero", action="store_true", help="keep leading zero words in text and spans mode")
+    parser.add_argument("--encoding", default="utf-8", help="encoding of input and output files")
+    parser.add_argument("--output", help="output file, default stdout")
+    parser.add_argument("--quiet", action="store_true", help="no summary on stderr")
+    arguments = parser.parse_args(argv)
+    if arguments.chunk_size < 1 or arguments.workers < 1:
+        parser.error("--chunk-size and --workers must be at least 1")
+
+    chunks = read_chunks(open_inputs(arguments.files, arguments.encoding), arguments.chunk_size)
+    if arguments.output:
+        with open(arguments.output, "w", encoding=arguments.encoding, newline="\n") as output:
+            totals = run(chunks, output, arguments.mode, arguments.lang, arguments.workers, arguments.engine,
+                         not arguments.keep_zero)
+    else:
+        totals = run(chunks, sys.stdout, arguments.mode, arguments.lang, arguments.workers, arguments.engine,
+                     not arguments.keep_zero)
+        sys.stdout.flush()
+    if not arguments.quiet:
+        print(format_summary(totals), file=sys.stderr)
+    return 0
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   client of the conversion server (see word2numberi18n.server)
+
+   The protocol is newline-delimited JSON over a Unix domain socket or localhost TCP.
+   request:  {"id": 1, "op": "word", "lang": "en", "input": "two hundred and five"}
+   response: {"id": 1, "result": 205} or {"id": 1, "error": "message"}
+   ops: word (word_to_num, option is_separate), text (text_to_num, option ignore_zero),
+        spans (extract_numbers, option ignore_zero), stats and ping
+   A connection can send many requests before reading the responses, the responses
+   can come in another order and are matched by their id.
+'''
+import json
+import socket
+
+
+DEFAULT_PORT = 8765
+
+
+def parse_address(address: str):
+    """ [internal] function to parse a server address
+
+    input: "unix:/path/of/socket", "host:port", ":port" or "host"
+    output: tuple of socket family and socket address
+    """
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":") if ":" in address else (address, "", "")
+    return socket.AF_INET, (host or "127.0.0.1", int(port) if port else DEFAULT_PORT)
+
+
+class ServerError(ValueError):
+    ' error response of the server, a ValueError like the errors of W2N '
+
+
+class Client:
+    ' Connection to a conversion server '
+
+    def __init__(self, address: str=f"127.0.0.1:{DEFAULT_PORT}", lang: str=None, timeout: float=None):
+        """ address: see parse_address
+            lang: language of the requests without language, None for the default of the server
+            timeout: socket timeout in seconds or None to wait without limit
+        """
+        family, socket_address = parse_address(address)
+        self.lang = lang
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        self._socket.connect(socket_address)
+        self._reader = self._socket.makefile("r", encoding="utf-8", newline="\n")
+        self._next_id = 0
+
+    def _send(self, requests):
+        data = "".join(json.dumps(request, ensure_ascii=False) + "\n" for request in requests)
+        self._socket.sendall(data.encode("utf-8"))
+
+    def _receive(self) -> dict:
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("connection closed by the server")
+        return json.loads(line)
+
+    def _request(self, op: str, inputs, options: dict, lang: str=None) -> list:
+        """ [internal] function to send requests of one op and to wait for all responses
+
+        output: list of responses in the order of the inputs
+        raise: ServerError if the server answers without id, eg. to a request longer than its limit
+        """
+        lang = self.lang if lang is None else lang
+        first_id = self._next_id
+        requests = []
+        for number, value in enumerate(inputs, first_id):
+            request = {"id": number, "op": op, "input": value}
+            if lang is not None:
+                request["lang"] = lang
+            request.update(options)
+            requests.append(request)
+        self._next_id += len(requests)
+        self._send(requests)
+        responses = [None] * len(requests)
+        for _ in requests:
+            response = self._receive()
+            if response.get("id") is None:
+                # the server could not read the request, it answers without id and closes the connection
+                raise ServerError(response.get("error", "response without id"))
+            responses[response["id"] - first_id] = response
+        return responses
+
+    def _single(self, op: str, value, options: dict, lang: str=None):
+        response = self._request(op, [value], options, lang)[0]
+        if "error" in response:
+            raise ServerError(response["error"])
+        return response["result"]
+
+    def word_to_num(self, number_sentence: str, lang: str=None, is_separate: bool=False):
+        """ public function to convert a number sentence on the server
+        raise: ServerError if the server can not convert it
+        """
+        return self._single("word", number_sentence, {"is_separate": is_separate}, lang)
+
+    def text_to_num(self, text: str, lang: str=None, ignore_zero: bool=True) -> str:
+        """ public function to convert the numbers of a text on the server
+        raise: ServerError if the server can not convert it
+        """
+        return self._single("text", text, {"ignore_zero": ignore_zero}, lang)
+
+    def extract_numbers(self, text: str, lang: str=None, ignore_zero: bool=True) -> list:
+        """ public function to find the numbers of a text on the server
+        output: list of dicts with start, end, value and text
+        raise: ServerError if the server can not convert it
+        """
+        return self._single("spans", text, {"ignore_zero": ignore_zero}, lang)
+
+    def convert_many(self, op: str, inputs, lang: str=None, **options) -> list:
+        """ public function to send many requests at once and to wait for all responses
+        the server can put them into one batch
+
+        input: op (word, text or spans), iterable of inputs, language, options of the op
+        output: list of results in input order, ServerError instances for errors
+        """
+        return [ServerError(response["error"]) if "error" in response else response["result"]
+                for response in self._request(op, inputs, options, lang)]
+
+    def stats(self) -> dict:
+        """ public function to get the counters and histograms of the server
+        """
+        return self._single("stats", None, {})
+
+    def ping(self) -> bool:
+        return self._single("ping", None, {}) == "pong"
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   segmentation of compound number words like "dreihundertvierundzwanzigtausend"
+'''
+
+
+END = ""  # key of the trie node where a word ends
+
+
+class CompoundSegmenter:
+    ''' Splits compound words into the words of a vocabulary
+
+    The vocabulary is stored in a trie, so all words starting at a position of the compound
+    are found in one walk. The segmentation is a dynamic programming from the end of the
+    compound to its start: the best segmentation of every suffix is computed once, so a
+    compound of n characters takes O(n * longest word) steps. The best segmentation has the
+    fewest words, on a tie the longest first word ("dreizehn", not "drei zehn").
+    Inner words like conjunctions are only allowed between two other words.
+    '''
+
+    __slots__ = ("words", "inner_words", "trie", "max_cache", "_cache")
+
+    def __init__(self, words, inner_words=(), max_cache: int=4096):
+        """ words: words which can be at any place of a compound
+            inner words: words which can only be between two words, eg. "und"
+            max_cache: count of segmented compounds to remember
+        """
+        self.words = frozenset(words)
+        self.inner_words = frozenset(inner_words) - self.words
+        self.max_cache = max_cache
+        self._cache = {}
+        trie = {}
+        for word in self.words | self.inner_words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[END] = word in self.inner_words
+        self.trie = trie
+
+    def segment(self, compound: str):
+        """ public function to split a compound into words of the vocabulary
+
+        input: one lower case word
+        output: tuple of words or None if the compound is no sequence of vocabulary words
+        """
+        try:
+            return self._cache[compound]
+        except KeyError:
+            pass
+        parts = self._segment(compound)
+        if len(self._cache) >= self.max_cache:
+            self._cache.clear()
+        self._cache[compound] = parts
+        return parts
+
+    def _segment(self, compound: str):
+        length = len(compound)
+        # best[i]: best segmentation of compound[i:], starting with any word
+        # best_outer[i]: the same starting with no inner word
+        best = [None] * (length + 1)
+        best_outer = [None] * (length + 1)
+        best[length] = best_outer[length] = ()
+        trie = self.trie
+        for start in range(length - 1, -1, -1):
+            node = trie
+            for end in range(start + 1, length + 1):
+                node = node.get(compound[end - 1])
+                if node is None:
+                    break
+                is_inner = node.get(END)
+                if is_inner is None:
+                    continue
+                if is_inner:
+                    if start == 0 or end == length or best_outer[end] is None:
+                        continue
+                    candidate = (compound[start:end],) + best_outer[end]
+                else:
+                    if best[end] is None:
+                        continue
+                    candidate = (compound[start:end],) + best[end]
+                    if best_outer[start] is None or len(candidate) <= len(best_outer[start]):
+                        best_outer[start] = candidate
+                if best[start] is None or len(candidate) <= len(best[start]):
+                    best[start] = candidate
+        return best_outer[0]
+
+    def __eq__(self, other):
+        if not isinstance(other, CompoundSegmenter):
+            return NotImplemented
+        return self.words == other.words and self.inner_words == other.inner_words
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self.words)} words, {len(self.inner_words)} inner words)"
@@ -8,4 +8,13 @@
    Per line two values separatet by space
    No empty line
    Addon line with "point" char (in German called 'Komma')
+   Lines "replace:<words>=<words>" normalize the input, "measure:<word>=<value>" mark measure words
+   Lines "text:conjunction=<words>", "text:zero=<words>" and "text:ambiguous=<words>" (comma separated) for text_to_num,
+   an ambiguous word like the article "a" is only a number next to another number word
+   Lines "option:compound=true", "option:unit_first=true", "option:vigesimal=true" and "option:decimal_comma=true"
+   for languages writing number words together, reading units before tens, forming tens by twenty and
+   writing numerals like "1.250,5", see word2numberi18n.tables.OPTIONS
+
+   ## packs ##
+   config_<lang>.pack is the compiled config_<lang>.properties, see word2numberi18n.pack
 '''
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   language detection of number sentences over the vocabularies of many languages
+'''
+import re
+
+
+WORD_PART = re.compile(r"\w+")
+
+# weight of a word by its role in a language, measure and point words say more about the language
+WEIGHT_NUMBER = 1.0
+WEIGHT_MEASURE = 2.0
+WEIGHT_POINT = 2.0
+WEIGHT_CONJUNCTION = 0.25
+WEIGHT_COMPOUND = 2.0  # word split by the segmenter of a compounding language
+
+
+class LanguageDetector:
+    ''' Inverted index of the words of many languages
+
+    Every word points to the languages knowing it with the weight of its role. A word known by
+    several languages has its weight divided by their count. One pass over the words of a text
+    sums the weights of all languages at once, the language with the highest score wins, on a
+    tie the one given first.
+    '''
+
+    __slots__ = ("langs", "index", "segmenters")
+
+    def __init__(self, language_tables):
+        """ language_tables: iterable of LanguageTables, ties are won by the first one
+        """
+        language_tables = list(language_tables)
+        self.langs = tuple(tables.lang for tables in language_tables)
+        weights = {}  # word to {language position: weight}
+        for position, tables in enumerate(language_tables):
+            words = {}
+            for word in tables.number_system:
+                words[word] = WEIGHT_NUMBER
+            for word, replacement in tables.normalize_data.items():
+                if WORD_PART.fullmatch(word):
+                    words.setdefault(word, WEIGHT_NUMBER)
+            for word in tables.conjunctions:
+                words.setdefault(word, WEIGHT_CONJUNCTION)
+            for word in tables.measure_words:
+                words[word] = WEIGHT_MEASURE
+            for word, replacement in tables.normalize_data.items():
+                if replacement in tables.measure_words and WORD_PART.fullmatch(word):
+                    words[word] = WEIGHT_MEASURE
+            if tables.point_name:
+                words[tables.point_name] = WEIGHT_POINT
+            for word, weight in words.items():
+                weights.setdefault(word, {})[position] = weight
+        self.index = {word: tuple((position, weight / len(languages)) for position, weight in languages.items())
+                      for word, languages in weights.items()}
+        self.segmenters = tuple((position, tables.segmenter) for position, tables in enumerate(language_tables)
+                                if tables.segmenter is not None)
+
+    def scores(self, text: str) -> dict:
+        """ public function to score every language for a text in one pass over its words
+
+        input: string
+        output: dict of language code to score, 0.0 if no word of the language is in the text
+        """
+        totals = [0.0] * len(self.langs)
+        index = self.index
+        for word in WORD_PART.findall(text.lower()):
+            entries = index.get(word)
+            if entries is not None:
+                for position, weight in entries:
+                    totals[position] += weight
+            else:
+                for position, segmenter in self.segmenters:
+                    parts = segmenter.segment(word)
+                    if parts is not None and len(parts) > 1:
+                        totals[position] += WEIGHT_COMPOUND
+        return dict(zip(self.langs, totals))
+
+    def rank(self, text: str) -> list:
+        """ public function to get the languages of a text from the most to the least likely
+
+        input: string
+        output: list of language codes with a score above 0
+        """
+        scores = self.scores(text)
+        return sorted((lang for lang in self.langs if scores[lang] > 0), key=lambda lang: -scores[lang])
+
+    def detect(self, text: str):
+        """ public function to get the most likely language of a text
+
+        input: string
+        output: language code or None if no language knows a word of the text
+        """
+        ranked = self.rank(text)
+        return ranked[0] if ranked else None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(self.langs)})"
@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   single pass finite-state parser of normalized number words
+'''
+import re
+
+from word2numberi18n.results import (ConversionResult, NO_NUMBER_WORDS, REDUNDANT_POINT, REDUNDANT_WORD,
+                                     MEASURE_SEQUENCE, MEASURE_AFTER_POINT, PLACE_SET)
+
+
+NUMBER_WORD = re.compile(r"\w+(?:-\w+)*")
+WORD_PART = re.compile(r"\w+")
+
+# token classes, precomputed per language by `token_classes`
+DIGIT = 1        # decimal digit word 0..9, also valid after the point
+UNIT = 2         # other word with a value under 10
+TEEN = 3         # 10..19
+TEN = 4          # 20..99, with or without unit like "vingt-et-un"
+HUNDRED = 5      # 100, multiplies the group before it
+HUNDREDS = 6     # 200..999 in one word like "doscientos"
+MEASURE = 7      # 1000 and more, closes the group
+POINT = 8
+CONJUNCTION = 9
+
+# states of the current group: which places are still open
+START = 0        # nothing read
+HUNDRED_SET = 1  # tens and units open
+TEN_SET = 2      # units open
+CLOSED = 3       # no place open
+
+# vigesimal languages: tens followed by a teen, eg. "soixante dix" is 70 and "quatre vingt dix" is 90
+VIGESIMAL_TENS = (60, 80)
+
+
+def token_classes(number_system, point_name: str, conjunctions=(), decimal_words=()) -> dict:
+    """ [internal] function to classify the words of a language for the parser
+
+    input: dict of number word to value, point word, conjunction words, decimal digit words
+    output: dict of word to (token class, value)
+    """
+    classes = {}
+    for word, value in number_system.items():
+        if word in decimal_words:
+            token_class = DIGIT
+        elif value < 10:
+            token_class = UNIT
+        elif value < 20:
+            token_class = TEEN
+        elif value < 100:
+            token_class = TEN
+        elif value == 100:
+            token_class = HUNDRED
+        elif value < 1000:
+            token_class = HUNDREDS
+        else:
+            token_class = MEASURE
+        classes[word] = (token_class, value)
+    for word in conjunctions:
+        classes.setdefault(word, (CONJUNCTION, 0))
+    if point_name:
+        classes[point_name] = (POINT, 0)
+    return classes
+
+
+def word_position(number_sentence: str, offset: int) -> int:
+    """ [internal] function to get the index of the word at offset in number_sentence.split()
+    only called for errors, so the words are not counted while parsing
+    """
+    return len(number_sentence[:offset].split())
+
+
+def find_word(tables, number_sentence: str, word: str, occurrence: int=1):
+    """ [internal] function to get the index of a normalized word in number_sentence.split()
+    the words are read like `W2N.clean_str`, occurrence 2 is the second one of the word
+
+    input: LanguageTables, normalized string, word after the replace rules, occurrence
+    output: index or None if not found
+    """
+    rules = tables.normalize_data
+    for match in WORD_PART.finditer(number_sentence):
+        if rules.get(match.group(), match.group()) == word:
+            occurrence -= 1
+            if occurrence == 0:
+                return word_position(number_sentence, match.start())
+    return None
+
+
+def parse_number_words(tables, number_sentence: str, is_separate: bool=False):
+    """ [internal] function to validate and calculate a normalized number sentence in one pass
+    words which are no number words are skipped like in `W2N.clean_str`, hyphenated words
+    are split if they are no number word as a whole, eg. "thirty-five" but not "quatre-vingt"
+
+    Each group under 1000 runs through the states START, HUNDRED_SET, TEN_SET and CLOSED.
+    A word for a place which is already set ends the group: with `is_separate` the digits of
+    the group are kept and a new group starts (eg. phone numbers), otherwise it is an error.
+    A measure word multiplies the group and adds it to the total. For languages with the
+    option unit_first a ten after a unit and a conjunction is added to the unit, eg. "vier und zwanzig".
+    For languages with the option vigesimal a unit before twenty multiplies it, eg. "quatre vingt",
+    a teen continues sixty and eighty and ten leaves the units open, eg. "soixante dix sept".
+
+    input: LanguageTables, normalized string, is_separate
+    output: tuple of pre-decimal int, post-decimal digits as int and their count (0 without decimal words)
+            or ConversionResult with the error if the number is formal incorrect
+    """
+    classes = tables.token_classes
+    rules = tables.normalize_data
+    total = 0
+    group = 0
+    state = START
+    separated = ""      # digits of the finished groups with is_separate
+    last_measure = 0
+    in_decimal = False  # after the point
+    fraction = 0        # digits after the point as int
+    scale = 0           # count of digits after the point
+    decimal_valid = True
+    has_words = False
+    unit_first = tables.unit_first
+    after_unit = 0      # unit_first: 1 after a unit in an open group, 2 after the conjunction following it
+    vigesimal = tables.vigesimal
+    last_unit = 0       # vigesimal: value of the unit which starts the tens of the group, eg. "quatre" of "quatre vingt"
+    for match in NUMBER_WORD.finditer(number_sentence):
+        text_word = match.group()
+        if '-' in text_word and rules.get(text_word, text_word) not in classes:
+            words = WORD_PART.findall(text_word)
+        else:
+            words = (text_word,)
+        for word in words:
+            word = rules.get(word, word)
+            token = classes.get(word)
+            if token is None:
+                continue
+            token_class, value = token
+            if token_class == CONJUNCTION:
+                if after_unit == 1:
+                    after_unit = 2
+                continue
+            has_words = True
+            if after_unit:
+                if after_unit == 2 and token_class == TEN and value % 10 == 0:
+                    group += value
+                    state = CLOSED
+                    after_unit = 0
+                    continue
+                after_unit = 0
+            if in_decimal:
+                if token_class == POINT:
+                    return ConversionResult(error=REDUNDANT_POINT, token=word, index=word_position(number_sentence, match.start()))
+                if word in tables.measure_words:
+                    return ConversionResult(error=MEASURE_AFTER_POINT, token=word, index=word_position(number_sentence, match.start()))
+                if token_class == DIGIT:
+                    fraction = fraction * 10 + value
+                    scale += 1
+                else:
+                    decimal_valid = False
+                continue
+
+            if token_class == MEASURE:
+                if last_measure and value >= last_measure:
+                    if value == last_measure:
+                        return ConversionResult(error=REDUNDANT_WORD, token=word, index=word_position(number_sentence, match.start()))
+                    return ConversionResult(error=MEASURE_SEQUENCE, token=word, index=word_position(number_sentence, match.start()))
+                if separated:
+                    group = int(separated + str(group))
+                    separated = ""
+                total += (group if state != START else 1) * value
+                last_measure = value
+                group = 0
+                state = START
+                last_unit = 0
+                continue
+            if token_class == POINT:
+                in_decimal = True
+                continue
+
+            # the place of the word in the group decides if it continues the group
+            if token_class == DIGIT or token_class == UNIT:
+                fits = state != CLOSED
+                next_state = CLOSED
+            elif token_class == TEN:
+                if last_unit and value == 20:
+                    group += last_unit * 19  # the unit times twenty
+                    state = TEN_SET
+                    last_unit = 0
+                    continue
+                fits = state == START or state == HUNDRED_SET
+                next_state = TEN_SET if value % 10 == 0 else CLOSED
+            elif token_class == TEEN:
+                fits = state == START or state == HUNDRED_SET or (vigesimal and state == TEN_SET and group % 100 in VIGESIMAL_TENS)
+                next_state = TEN_SET if vigesimal and value == 10 else CLOSED
+            elif token_class == HUNDRED:
+                fits = state == START or (state != HUNDRED_SET and group < 100)
+                next_state = HUNDRED_SET
+            else:  # HUNDREDS
+                fits = state == START
+                next_state = HUNDRED_SET
+
+            if not fits:
+                if not is_separate:
+                    return ConversionResult(error=PLACE_SET, token=word, index=word_position(number_sentence, match.start()))
+                separated += str(group)
+                group = 0
+                state = START
+            if vigesimal:
+                last_unit = value if (token_class == DIGIT or token_class == UNIT) and (state == START or state == HUNDRED_SET) else 0
+            if token_class == HUNDRED:
+                group = (group if state != START else 1) * value
+            else:
+                group += value
+                if unit_first and next_state == CLOSED and (token_class == DIGIT or token_class == UNIT) and state != TEN_SET:
+                    after_unit = 1
+            state = next_state
+
+    if not has_words:
+        return ConversionResult(error=NO_NUMBER_WORDS)
+    if separated:
+        group = int(separated + str(group))
+    if not decimal_valid:
+        fraction, scale = 0, 1  # like `W2N.get_decimal_parts` for words which are no digits
+    return total + group, fraction, scale
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   optional instrumentation of the conversion stages
+
+   Set an Instrumentation as W2N.instrumentation (all instances) or as attribute of one instance,
+   or collect the calls of a block with `profile()`. Without instrumentation every stage costs
+   only the check of the attribute.
+
+   stages: normalize, convert (word_to_num after normalize, with the result cache),
+           parse (fsm engine), clean_str, validate and get_number_value (legacy engine),
+           normalize_text and extract_numbers (text_to_num and extract_numbers),
+           vectorize (word_to_num_many of the vectorized engine without the rows of the scalar path)
+   counters: word_to_num_errors, number_groups (numbers found in texts), numerals (inputs of digits only),
+             number_free_texts (texts skipped by the prefilter), vectorized_rows (distinct inputs of the vectorized engine)
+'''
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class Histogram:
+    ' Counts of values in power of two buckets '
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+        self.count = 0
+
+    def add(self, value: int):
+        bucket = max(value - 1, 0).bit_length()  # 1, 2, 3-4, 5-8, ...
+        if bucket >= len(self.counts):
+            self.counts.extend([0] * (bucket + 1 - len(self.counts)))
+        self.counts[bucket] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        """ public function to get the histogram as dict
+        output: dict with count, mean and buckets (upper bound as string to count)
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": {str(1 << bucket): count for bucket, count in enumerate(self.counts)},
+        }
+
+
+class Instrumentation:
+    ' Per stage timers, counters and the histogram of token counts, safe to share between threads '
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages = {}            # stage to [calls, seconds, max seconds]
+        self.counters = {}
+        self.token_counts = Histogram()
+
+    def lap(self, stage: str, started: float) -> float:
+        """ [internal] function to record one call of a stage
+
+        input: stage name, perf_counter() at the start of the stage
+        output: perf_counter() at the end of the stage, the start of the next one
+        """
+        now = perf_counter()
+        duration = now - started
+        with self._lock:
+            timer = self.stages.get(stage)
+            if timer is None:
+                self.stages[stage] = [1, duration, duration]
+            else:
+                timer[0] += 1
+                timer[1] += duration
+                if duration > timer[2]:
+                    timer[2] = duration
+        return now
+
+    def count(self, name: str, increment: int=1):
+        """ [internal] function to increment a counter
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + increment
+
+    def tokens(self, count: int):
+        """ [internal] function to record the count of words of a converted input
+        """
+        with self._lock:
+            self.token_counts.add(count)
+
+    def reset(self):
+        """ public function to clear all timers, counters and the histogram
+        """
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+            self.token_counts = Histogram()
+
+    def to_dict(self) -> dict:
+        """ public function to get a snapshot of the instrumentation and the cache statistics
+
+        output: dict with stages (calls, seconds, max_seconds), counters, token_counts (histogram with sum) and caches
+        """
+        with self._lock:
+            data = {
+                "stages": {stage: {"calls": calls, "seconds": seconds, "max_seconds": max_seconds}
+                           for stage, (calls, seconds, max_seconds) in self.stages.items()},
+                "counters": dict(self.counters),
+                "token_counts": dict(self.token_counts.snapshot(), sum=self.token_counts.total),
+            }
+        data["caches"] = cache_stats()
+        return data
+
+    def to_prometheus(self, prefix: str="w2n") -> str:
+        """ public function to export the snapshot in the Prometheus text format
+
+        input: prefix of the metric names
+        output: text with one sample per line
+        """
+        data = self.to_dict()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        stages = sorted(data["stages"].items())
+        metric("stage_calls_total", "counter", "Calls per conversion stage.",
+               [(f'{{stage="{stage}"}}', timer["calls"]) for stage, timer in stages])
+        metric("stage_seconds_total", "counter", "Seconds spent per conversion stage.",
+               [(f'{{stage="{stage}"}}', repr(timer["seconds"])) for stage, timer in stages])
+        metric("stage_seconds_max", "gauge", "Longest call per conversion stage.",
+               [(f'{{stage="{stage}"}}', repr(timer["max_seconds"])) for stage, timer in stages])
+        metric("events_total", "counter", "Counted events.",
+               [(f'{{event="{name}"}}', value) for name, value in sorted(data["counters"].items())])
+
+        histogram = data["token_counts"]
+        samples = []
+        cumulative = 0
+        for bound, count in histogram["buckets"].items():
+            cumulative += count
+            samples.append((f'_bucket{{le="{bound}"}}', cumulative))
+        samples.append(('_bucket{le="+Inf"}', histogram["count"]))
+        samples.append(("_sum", histogram["sum"]))
+        samples.append(("_count", histogram["count"]))
+        metric("tokens", "histogram", "Words per converted input.", [])
+        lines.extend(f"{prefix}_tokens{suffix} {value}" for suffix, value in samples)
+
+        for cache, stats in data["caches"].items():
+            metric(f"{cache}_hits_total", "counter", f"Hits of the {cache}.", [("", stats["hits"])])
+            metric(f"{cache}_misses_total", "counter", f"Misses of the {cache}.", [("", stats["misses"])])
+            metric(f"{cache}_evictions_total", "counter", f"Evictions of the {cache}.", [("", stats["evictions"])])
+            metric(f"{cache}_size", "gauge", f"Entries of the {cache}.", [("", stats["size"])])
+        return "\n".join(lines) + "\n"
+
+
+def cache_stats() -> dict:
+    """ [internal] function to get the statistics of the language registry and of W2N.result_cache
+    """
+    from word2numberi18n.w2n import W2N, registry
+
+    stats = {"registry": registry.stats()}
+    if W2N.result_cache is not None:
+        stats["result_cache"] = W2N.result_cache.stats()
+    return stats
+
+
+@contextmanager
+def profile(instrumentation: Instrumentation=None):
+    """ public function to collect the instrumentation of all calls in a block
+    for all W2N instances without own instrumentation
+
+    input: Instrumentation to add the calls to, a new one if None
+    output: context manager giving the Instrumentation
+    """
+    from word2numberi18n.w2n import W2N
+
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    previous = W2N.instrumentation
+    W2N.instrumentation = instrumentation
+    try:
+        yield instrumentation
+    finally:
+        W2N.instrumentation = previous
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   numerals in any Unicode digit script, alone or next to measure words
+
+   One translation table maps the decimal digits of every script (eg. Persian "۲", Arabic-Indic
+   "٢", Devanagari "२") and the Arabic decimal and thousands separators to ASCII, then one
+   pattern reads grouped and decimal numerals like "1,250.5" or "۱٬۲۵۰٫۵", for languages with
+   the option decimal_comma like "1.250,5". In the mixed mode
+   numerals are the values of groups before hundred and measure words, eg. "2.5 thousand"
+   or "۲ میلیون", calculated with integers scaled by the decimals of the numerals.
+'''
+import re
+
+from word2numberi18n.fsm import HUNDRED, MEASURE, CONJUNCTION, START, HUNDRED_SET, CLOSED
+from word2numberi18n.results import ConversionResult, MEASURE_SEQUENCE, PLACE_SET, NUMERALS_WITHOUT_MEASURE, INVALID_NUMERAL
+
+
+# integer part ungrouped or grouped by three with ",", decimals after "."
+NUMERAL = re.compile(r"([0-9]+|[0-9]{1,3}(?:,[0-9]{3})+)(?:\.([0-9]+))?")
+# the same with the separators of the option decimal_comma, grouped with "." and decimals after ","
+NUMERAL_COMMA = re.compile(r"([0-9]+|[0-9]{1,3}(?:\.[0-9]{3})+)(?:,([0-9]+))?")
+ANY_DIGIT = re.compile(r"\d")
+
+
+class DigitTable(dict):
+    ''' str.translate table of every Unicode decimal digit to its ASCII digit
+
+    The entry of a character is added on its first translation, so the table holds only the
+    characters seen and needs no scan of the Unicode database on import.
+    '''
+
+    def __missing__(self, code: int):
+        character = chr(code)
+        value = ord(str(int(character))) if character.isdecimal() else code
+        self[code] = value
+        return value
+
+
+DIGITS = DigitTable({ord("٫"): ord("."), ord("٬"): ord(",")})  # Arabic decimal and thousands separator
+DIGITS_COMMA = DigitTable({ord("٫"): ord(","), ord("٬"): ord(".")})
+
+
+def numeral_parts(text: str, decimal_comma: bool=False):
+    """ [internal] function to read a numeral of any digit script, eg. "1,250.5" or "۲٫۵"
+
+    input: string without surrounding spaces, option decimal_comma of the language ("1.250,5")
+    output: tuple of pre-decimal int, post-decimal digits as int and their count, None if the text is no numeral
+    """
+    if not text[:1].isdecimal():
+        return None
+    if text.isascii():
+        if text.isdigit():
+            return int(text), 0, 0
+    else:
+        text = text.translate(DIGITS_COMMA if decimal_comma else DIGITS)
+    match = (NUMERAL_COMMA if decimal_comma else NUMERAL).fullmatch(text)
+    if match is None:
+        return None
+    integer, decimals = match.groups()
+    integer = int(integer.replace("." if decimal_comma else ",", ""))
+    if decimals is None:
+        return integer, 0, 0
+    return integer, int(decimals), len(decimals)
+
+
+def mixed_parts(tables, number_sentence: str):
+    """ [internal] function to calculate numerals with hundred and measure words, eg. "2.5 thousand"
+    "5 hundred 20 thousand" is 520000 like the words, conjunctions are skipped
+
+    input: LanguageTables, normalized string
+    output: tuple like `numeral_parts` without trailing zero decimals, None if other words are in the sentence
+            or ConversionResult with the error if the number is formal incorrect or a word with digits is no numeral
+    """
+    classes = tables.token_classes
+    decimal_comma = tables.decimal_comma
+    tokens = []
+    positions = []  # index of the word of each token
+    scale = 0
+    other_words = False
+    for index, word in enumerate(number_sentence.split()):
+        numeral = numeral_parts(word, decimal_comma)
+        if numeral is not None:
+            tokens.append(numeral)
+            positions.append(index)
+            scale = max(scale, numeral[2])
+            continue
+        if ANY_DIGIT.search(word) is not None:  # the digits must not be dropped by the word engine
+            return ConversionResult(error=INVALID_NUMERAL, token=word, index=index)
+        token = classes.get(word)
+        if token is None or token[0] not in (HUNDRED, MEASURE, CONJUNCTION):
+            other_words = True
+        elif token[0] != CONJUNCTION:
+            tokens.append(token)
+            positions.append(index)
+    if other_words or not tokens:
+        return None
+
+    # values scaled by 10**scale, the largest count of decimals of the numerals
+    unit = 10 ** scale
+    total = 0
+    group = None
+    state = START
+    last_measure = 0
+    for token, index in zip(tokens, positions):
+        if len(token) == 3:  # numeral
+            integer, fraction, digits = token
+            value = (integer * 10 ** digits + fraction) * 10 ** (scale - digits)
+            if state == START:
+                group = value
+                state = CLOSED
+            elif state == HUNDRED_SET and value < 100 * unit:
+                group += value
+                state = CLOSED
+            else:
+                return ConversionResult(error=NUMERALS_WITHOUT_MEASURE, token=number_sentence.split()[index], index=index)
+            continue
+        token_class, measure = token
+        if token_class == HUNDRED:
+            if state == HUNDRED_SET or (state == CLOSED and group >= 100 * unit):
+                return ConversionResult(error=PLACE_SET, token=tables.name_by_value.get(measure, measure), index=index)
+            group = (unit if group is None else group) * measure
+            state = HUNDRED_SET
+            continue
+        if last_measure and measure >= last_measure:
+            return ConversionResult(error=MEASURE_SEQUENCE, token=number_sentence.split()[index], index=index)
+        total += (unit if group is None else group) * measure
+        last_measure = measure
+        group = None
+        state = START
+    if group is not None:
+        total += group
+
+    while scale and total % 10 == 0:
+        total //= 10
+        scale -= 1
+    integer, fraction = divmod(total, 10 ** scale)
+    return integer, fraction, scale
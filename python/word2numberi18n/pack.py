@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   precompiled binary language packs
+
+   usage: python -m word2numberi18n.pack [lang ...] [--check]
+
+   A pack holds the parsed configuration file of one language, so loading needs no per-line parsing:
+     magic "W2NP", format version (uint16), SHA-256 of the configuration file,
+     CRC-32 of the payload (uint32) and the marshal payload of the LanguageTables arguments.
+   A pack is used only if its version is known, the payload is intact and the checksum matches
+   the configuration file next to it, otherwise the configuration file is parsed.
+'''
+import marshal
+import struct
+import sys
+import zlib
+
+
+MAGIC = b"W2NP"
+PACK_VERSION = 3  # 2: options, 3: ambiguous words
+HEADER = struct.Struct("<4sH32sI")
+MARSHAL_VERSION = 4  # readable by every Python 3.4+
+# LanguageTables arguments in the payload, in this order
+FIELDS = ("number_system", "normalize_data", "measure_values", "point_name", "conjunctions", "zero_words", "replace_source",
+          "options", "ambiguous_words")
+
+
+def source_digest(source_path: str):
+    """ [internal] function to get the SHA-256 of a configuration file
+    output: 32 bytes or None if the file does not exist
+    """
+    import hashlib  # only needed when a language is loaded, not on import
+
+    try:
+        with open(source_path, "rb") as source:
+            return hashlib.sha256(source.read()).digest()
+    except OSError:
+        return None
+
+
+def encode_pack(fields: dict, digest: bytes) -> bytes:
+    """ [internal] function to encode the LanguageTables arguments as pack
+
+    input: dict with the FIELDS, SHA-256 of the configuration file
+    output: pack bytes
+    """
+    payload = marshal.dumps((
+        tuple(fields["number_system"].items()),
+        tuple(fields["normalize_data"].items()),
+        tuple(fields["measure_values"]),
+        fields["point_name"],
+        tuple(fields["conjunctions"]),
+        tuple(fields["zero_words"]),
+        fields["replace_source"],
+        tuple(fields["options"].items()),
+        tuple(fields["ambiguous_words"]),
+    ), MARSHAL_VERSION)
+    return HEADER.pack(MAGIC, PACK_VERSION, digest, zlib.crc32(payload)) + payload
+
+
+def decode_pack(data: bytes, digest: bytes=None):
+    """ [internal] function to decode a pack
+
+    input: pack bytes, SHA-256 of the configuration file or None to skip the stale check
+    output: dict with the FIELDS or None if the pack is stale, broken or of an unknown version
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, version, pack_digest, crc = HEADER.unpack_from(data)
+    if magic != MAGIC or version != PACK_VERSION:
+        return None
+    if digest is not None and digest != pack_digest:
+        return None
+    payload = memoryview(data)[HEADER.size:]
+    if zlib.crc32(payload) != crc:
+        return None
+    try:
+        values = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if type(values) is not tuple or len(values) != len(FIELDS):
+        return None
+    fields = dict(zip(FIELDS, values))
+    fields["number_system"] = dict(fields["number_system"])
+    fields["normalize_data"] = dict(fields["normalize_data"])
+    fields["options"] = dict(fields["options"])
+    return fields
+
+
+def read_pack(pack_path: str, source_path: str):
+    """ [internal] function to read the pack of a language if it is up to date
+
+    input: path of the pack, path of the configuration file
+    output: dict with the FIELDS or None to fall back to the configuration file
+    """
+    try:
+        with open(pack_path, "rb") as pack:
+            data = pack.read()
+    except OSError:
+        return None
+    return decode_pack(data, source_digest(source_path))
+
+
+def validate_fields(lang: str, fields: dict):
+    """ [internal] function to check the parsed configuration file before it is packed
+
+    raise: ValueError with the first problem found
+    """
+    from word2numberi18n.tables import OPTIONS
+
+    number_system = fields["number_system"]
+    values = set(number_system.values())
+    if list(number_system.values())[:10] != list(range(10)):
+        raise ValueError(f"{lang}: the first ten number words must be the digits 0 to 9")
+    if not fields["point_name"]:
+        raise ValueError(f"{lang}: no point word")
+    if fields["point_name"] in number_system:
+        raise ValueError(f"{lang}: point word {fields['point_name']} is a number word")
+    for measure_value in fields["measure_values"]:
+        if measure_value not in values:
+            raise ValueError(f"{lang}: no number word for measure {measure_value}")
+    for word in fields["zero_words"]:
+        if number_system.get(word) != 0:
+            raise ValueError(f"{lang}: zero word {word} is no number word for 0")
+    for word in fields["conjunctions"]:
+        if word in number_system:
+            raise ValueError(f"{lang}: conjunction {word} is a number word")
+    for word in fields["ambiguous_words"]:
+        if fields["normalize_data"].get(word, word) not in number_system:
+            raise ValueError(f"{lang}: ambiguous word {word} is no number word")
+    for option, value in fields["options"].items():
+        if option not in OPTIONS:
+            raise ValueError(f"{lang}: unknown option {option}")
+        if value not in ("true", "false"):
+            raise ValueError(f"{lang}: option {option} must be true or false")
+
+
+def compile_pack(lang: str) -> str:
+    """ public function to compile the configuration file of a language to its pack
+
+    input: language code
+    output: path of the written pack
+    raise: OSError if no configuration file exists, ValueError if it is not valid
+    """
+    from word2numberi18n.tables import data_file, pack_file, parse_properties, trie_pattern
+
+    fields = parse_properties(lang)
+    validate_fields(lang, fields)
+    fields["replace_source"] = trie_pattern(fields["normalize_data"]) if fields["normalize_data"] else None
+    data = encode_pack(fields, source_digest(data_file(lang)))
+    with open(pack_file(lang), "wb") as pack:
+        pack.write(data)
+    return pack_file(lang)
+
+
+def is_current(lang: str) -> bool:
+    """ public function to check if the pack of a language exists and is up to date
+    """
+    from word2numberi18n.tables import data_file, pack_file
+
+    return read_pack(pack_file(lang), data_file(lang)) is not None
+
+
+def main(argv=None):
+    from word2numberi18n.tables import available_languages
+
+    arguments = sys.argv[1:] if argv is None else argv
+    check = "--check" in arguments
+    langs = [argument for argument in arguments if argument != "--check"] or available_languages()
+    stale = []
+    for lang in langs:
+        if check:
+            if not is_current(lang):
+                stale.append(lang)
+        else:
+            print(compile_pack(lang))
+    if stale:
+        print(f"stale or missing packs: {' '.join(stale)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   thread-safe parallel conversion in one process
+
+   After construction a W2N instance only reads its language tables, so any count of threads
+   can convert with it. convert_parallel gives every worker thread its own instance over the
+   shared read-only tables of the language and converts chunks of the inputs without the
+   result cache (one lock for all threads), so the hot path shares no mutable state. Only the
+   bounded compound caches of compounding languages are shared, their single dict operations
+   are atomic on both interpreters.
+
+   On the standard interpreter the GIL lets one thread convert at a time, so the threads only
+   help if the inputs come from I/O. On the free-threaded build (eg. python3.13t) the threads
+   convert on all cores, see the workload threads of word2numberi18n.bench.
+'''
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable
+
+from word2numberi18n.w2n import W2N, ENGINES, registry
+
+
+OPS = ("word", "text", "spans")
+DEFAULT_CHUNK_SIZE = 256
+
+
+def convert_chunk(instance: W2N, chunk: list, op: str, options: dict) -> list:
+    """ [internal] function to convert one chunk of inputs with the instance of the thread
+
+    input: W2N instance, list of inputs, op, options of the op
+    output: list of results, None for inputs which could not be converted
+    """
+    if op == "word":
+        return instance.word_to_num_many(chunk, **options).to_list()
+    convert = instance.text_to_num if op == "text" else instance.extract_numbers
+    results = []
+    for text in chunk:
+        try:
+            results.append(convert(text, **options))
+        except ValueError:
+            results.append(None)
+    return results
+
+
+def convert_parallel(inputs: Iterable, lang: str=None, workers: int=None, op: str="word",
+                     chunk_size: int=DEFAULT_CHUNK_SIZE, engine: str=None, **options) -> list:
+    """ public function to convert many inputs with a pool of threads, safe to call from any thread
+    errors are captured per input like `W2N.word_to_num_many`
+
+    input: iterable of inputs, language name or None for the process default,
+           count of threads (None: one per CPU, 1 converts in the calling thread),
+           op "word" (word_to_num_many, options is_separate and result_type), "text" (text_to_num)
+           or "spans" (extract_numbers, both with option ignore_zero), inputs per task, parser engine
+    output: list of results in input order, None for inputs which could not be converted
+    raise: ValueError for an unknown op, engine or language
+    """
+    if op not in OPS:
+        raise ValueError(f"Unknown op {op}! Please use one of {', '.join(OPS)}")
+    if engine is not None and engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine}! Please use one of {', '.join(ENGINES)}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be at least 1")
+    inputs = list(inputs)
+    tables = registry.get(lang)  # the only access to the registry, before the threads start
+    local = threading.local()
+
+    def convert(chunk):
+        instance = getattr(local, "instance", None)
+        if instance is None:
+            instance = W2N(lang_param=tables.lang, tables=tables, engine=engine)
+            instance.result_cache = None  # also without the class wide cache
+            local.instance = instance
+        return convert_chunk(instance, chunk, op, options)
+
+    chunks = [inputs[start:start + chunk_size] for start in range(0, len(inputs), chunk_size)]
+    if workers == 1 or len(chunks) < 2:
+        parts = map(convert, chunks)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks)), thread_name_prefix="w2n") as executor:
+            parts = list(executor.map(convert, chunks))
+    results = []
+    for part in parts:
+        results.extend(part)
+    return results
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   process-wide registry of loaded languages
+'''
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def locale_language(default: bool=False):
+    """ [internal] function to get the language of the process locale or of the default locale
+    it is read once per process, call `locale_language.cache_clear()` after changing the locale
+
+    input: True for the default locale
+    output: language name or None
+    """
+    import locale  # only needed without language parameter
+
+    if default:
+        return locale.getdefaultlocale()[0]
+    return locale.getlocale()[0]
+
+
+def resolve_language(lang_param=None) -> str:
+    """ [internal] function to get the normalized language code
+
+    The order is: parameter, process locale, environment "w2n.lang",
+    default locale, environment "LANGUAGE" and at least "en".
+
+    input: language name or None
+    output: two letter language code
+    """
+    lang = lang_param
+    if lang is None:
+        lang = locale_language()
+    if "w2n.lang" in os.environ:
+        lang = os.environ["w2n.lang"]
+    if lang is None:
+        lang = locale_language(default=True)
+    if lang is None or lang[0] is None:
+        lang = None
+        if "LANGUAGE" in os.environ:
+            lang = os.environ["LANGUAGE"]
+    if lang is None:
+        lang = "en"  # fallback
+    return lang[:2].lower()
+
+
+class LanguageRegistry:
+    ' Thread-safe cache of loaded languages keyed by language code, eg. the read-only LanguageTables '
+
+    def __init__(self, factory, max_size=None):
+        """ factory: callable loading the language for a language code, eg. load_tables
+            max_size: maximum count of cached languages or None for no limit
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self._instances = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+        self.load_time = 0.0
+        self.load_times = {}
+
+    def get(self, lang_param=None):
+        """ public function to get the shared language
+        the language is loaded on first request only, it is shared with every caller and should be read-only
+
+        input: language name or None for the process default
+        output: shared result of the factory
+        """
+        lang = resolve_language(lang_param)
+        with self._lock:
+            instance = self._instances.get(lang)
+            if instance is not None:
+                self.hits += 1
+                self._instances.move_to_end(lang)
+                return instance
+            self.misses += 1
+            start = time.perf_counter()
+            instance = self.factory(lang)
+            duration = time.perf_counter() - start
+            self.loads += 1
+            self.load_time += duration
+            self.load_times[lang] = self.load_times.get(lang, 0.0) + duration
+            self._instances[lang] = instance
+            self._shrink()
+            return instance
+
+    def preload(self, langs):
+        """ public function to load languages before first use
+
+        input: iterable of language names
+        """
+        for lang in langs:
+            self.get(lang)
+
+    def evict(self, lang_param) -> bool:
+        """ public function to remove a language from the registry
+
+        input: language name
+        output: True if the language was loaded
+        """
+        lang = resolve_language(lang_param)
+        with self._lock:
+            return self._instances.pop(lang, None) is not None
+
+    def clear(self):
+        """ public function to remove all languages and reset the counters
+        """
+        with self._lock:
+            self._instances.clear()
+            self.hits = 0
+            self.misses = 0
+            self.loads = 0
+            self.evictions = 0
+            self.load_time = 0.0
+            self.load_times = {}
+
+    def languages(self):
+        """ public function to get the codes of the loaded languages
+        in order from least to most recently used
+        """
+        with self._lock:
+            return list(self._instances)
+
+    def stats(self) -> dict:
+        """ public function to get a snapshot of the registry counters
+        """
+        with self._lock:
+            return {
+                "size": len(self._instances),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "load_time": self.load_time,
+                "load_times": dict(self.load_times),
+            }
+
+    def _shrink(self):
+        if self.max_size is None:
+            return
+        while len(self._instances) > max(self.max_size, 0):
+            self._instances.popitem(last=False)
+            self.evictions += 1
+
+    def __contains__(self, lang_param):
+        return resolve_language(lang_param) in self._instances
+
+    def __len__(self):
+        return len(self._instances)
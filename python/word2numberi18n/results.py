@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   results of word_to_num from the integer and the digits after the point
+
+   The parsers give the pre-decimal integer, the digits after the point as integer
+   (fraction) and their count (scale, 0 without point), eg. "two point zero five" is (2, 5, 2).
+   The result types are built from these integers without string round-trips:
+     number:  int or float (as before, the float is correctly rounded)
+     str:     string like "2.05"
+     decimal: decimal.Decimal, exact for any count of digits
+     scaled:  (integer, scale) pair, eg. (205, 2) for 2.05
+
+   Malformed inputs give a ConversionResult with an error code instead of an exception,
+   the message of the ValueError raised by word_to_num is built only when requested.
+'''
+
+
+RESULT_TYPES = ("number", "str", "decimal", "scaled")
+
+# error codes of ConversionResult
+INVALID_TYPE = "invalid_type"                   # input is no str, int or float
+NO_NUMBER_WORDS = "no_number_words"
+NO_LANGUAGE = "no_language"                     # no detected language knows the words (lang_param "auto")
+REDUNDANT_POINT = "redundant_point"
+REDUNDANT_WORD = "redundant_word"               # measure word twice, eg. "million million"
+MEASURE_SEQUENCE = "measure_sequence"           # eg. "thousand million"
+MEASURE_AFTER_POINT = "measure_after_point"
+PLACE_SET = "place_set"                         # eg. "twenty thirty"
+NUMERALS_WITHOUT_MEASURE = "numerals_without_measure"  # eg. "1 2"
+INVALID_NUMERAL = "invalid_numeral"             # digits which are no numeral of the language, eg. "1,25" in English
+
+EXAMPLE = " Please enter a valid number word (eg. two million twenty three thousand and forty nine)"
+MESSAGES = {
+    INVALID_TYPE: "Type of input is not string! Please enter a valid number word (eg. 'two million twenty three thousand and forty nine')",
+    NO_NUMBER_WORDS: "No valid number words found!" + EXAMPLE,
+    NO_LANGUAGE: "No valid number words found in any language!" + EXAMPLE,
+    REDUNDANT_POINT: "Redundant point word {token}!" + EXAMPLE,
+    REDUNDANT_WORD: "Redundant number word {token} in!" + EXAMPLE,
+    MEASURE_SEQUENCE: "Malformed number in result of false measure word sequence eg. trillion after thousand!" + EXAMPLE,
+    MEASURE_AFTER_POINT: "Malformed number in result of false measure word after point eg. trillion after thousand!" + EXAMPLE,
+    PLACE_SET: "Malformed number, the place of {token} is already set!" + EXAMPLE,
+    NUMERALS_WITHOUT_MEASURE: "Malformed number, numerals without measure word between them!" + EXAMPLE,
+    INVALID_NUMERAL: "Malformed numeral {token}!" + EXAMPLE,
+}
+POWERS_OF_TEN = tuple(10 ** exponent for exponent in range(32))
+EXACT_CONTEXT = None
+
+
+def power_of_ten(exponent: int) -> int:
+    return POWERS_OF_TEN[exponent] if exponent < 32 else 10 ** exponent
+
+
+def make_result(integer: int, fraction: int, scale: int, result_type: str):
+    """ [internal] function to build the result of word_to_num
+
+    input: pre-decimal integer, digits after the point as integer, count of digits after the point, one of RESULT_TYPES
+    output: result of the result type
+    raise: ValueError for an unknown result type
+    """
+    if result_type == "number":
+        if not scale:
+            return integer
+        denominator = power_of_ten(scale)
+        return (integer * denominator + fraction) / denominator  # int division is correctly rounded like float("2.05")
+    if result_type == "str":
+        return format_number(integer, fraction, scale)
+    if result_type == "scaled":
+        return integer * power_of_ten(scale) + fraction if scale else integer, scale
+    if result_type == "decimal":
+        from decimal import Decimal  # only needed for this result type, not on import
+
+        if not scale:
+            return Decimal(integer)
+        return Decimal(integer * power_of_ten(scale) + fraction).scaleb(-scale, exact_context())
+    raise ValueError(f"Unknown result type {result_type}! Please use one of {', '.join(RESULT_TYPES)}")
+
+
+def exact_context():
+    """ [internal] function to get the decimal context without rounding, the default one rounds to 28 digits
+    """
+    global EXACT_CONTEXT
+    if EXACT_CONTEXT is None:
+        from decimal import Context, MAX_PREC
+        EXACT_CONTEXT = Context(prec=MAX_PREC)
+    return EXACT_CONTEXT
+
+
+def format_number(integer: int, fraction: int, scale: int) -> str:
+    """ [internal] function to write a number with the digits after the point
+    """
+    if not scale:
+        return str(integer)
+    return f"{integer}.{str(fraction).zfill(scale)}"
+
+
+class ConversionResult:
+    ''' Result of `W2N.try_word_to_num`, shared by the result cache, so it is not changed after construction
+
+    value: result of the result type, None on error
+    error: None or one of the error codes
+    token: offending word or None
+    index: index of the offending word in the words of the normalized input or None
+    '''
+
+    __slots__ = ("value", "error", "token", "index")
+
+    def __init__(self, value=None, error: str=None, token: str=None, index: int=None):
+        self.value = value
+        self.error = error
+        self.token = token
+        self.index = index
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def message(self):
+        """ public property with the message of the ValueError of `W2N.word_to_num`, None without error
+        """
+        if self.error is None:
+            return None
+        return MESSAGES[self.error].format(token=self.token)
+
+    def unwrap(self):
+        """ public function to get the value or to raise the error
+
+        output: value
+        raise: ValueError with the message
+        """
+        if self.error is not None:
+            raise ValueError(self.message)
+        return self.value
+
+    def __eq__(self, other):
+        if type(other) is not ConversionResult:
+            return NotImplemented
+        return (self.value, self.error, self.token, self.index) == (other.value, other.error, other.token, other.index)
+
+    __hash__ = None
+
+    def __repr__(self):
+        if self.error is None:
+            return f"{type(self).__name__}(value={self.value!r})"
+        return f"{type(self).__name__}(error={self.error!r}, token={self.token!r}, index={self.index!r})"
@@ -0,0 +1,368 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   local conversion server with micro-batching
+
+   usage: python -m word2numberi18n.server [--address 127.0.0.1:8765 | --address unix:/path]
+                                           [--lang en fa ...] [--window-ms 2] [--max-batch 256]
+
+   The languages stay loaded in the process for all connections. Requests of all connections
+   are put into one queue, a batcher thread takes them as micro-batch when the oldest request
+   waited for the latency window or max_batch requests are queued, and converts the requests
+   of one language and op together (word requests with word_to_num_many). The protocol and
+   the client are in word2numberi18n.client, the op "stats" gives the queue depth and the
+   batch-size histograms.
+'''
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+
+from word2numberi18n.client import parse_address, DEFAULT_PORT
+from word2numberi18n.instrument import Histogram
+from word2numberi18n.w2n import registry, language_instance
+
+
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_BATCH = 256
+MAX_REQUEST_BYTES = 1 << 20
+BATCH_OPS = {"word": "is_separate", "text": "ignore_zero", "spans": "ignore_zero"}
+OPTION_DEFAULTS = {"is_separate": False, "ignore_zero": True}
+
+
+def convert_group(instance, op: str, inputs: list, option: bool) -> list:
+    """ [internal] function to convert the inputs of one language and op
+
+    output: list of (True, result) or (False, error message)
+    """
+    if op == "word":
+        batch = instance.word_to_num_many(inputs, option)
+        return [(False, batch.errors[index]) if index in batch.errors else (True, batch[index])
+                for index in range(len(batch))]
+    outcomes = []
+    for text in inputs:
+        try:
+            if op == "text":
+                outcomes.append((True, instance.text_to_num(text, option)))
+            else:
+                outcomes.append((True, [span._asdict() for span in instance.extract_numbers(text, option)]))
+        except ValueError as error:
+            outcomes.append((False, str(error)))
+    return outcomes
+
+
+class MicroBatcher:
+    ' Queue of conversion requests, converted in micro-batches by one thread '
+
+    def __init__(self, window: float=DEFAULT_WINDOW, max_batch: int=DEFAULT_MAX_BATCH):
+        """ window: seconds the oldest request waits for more requests
+            max_batch: maximum count of requests in one batch
+        """
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.batch_sizes = Histogram()
+        self.queue_depths = Histogram()
+        self._thread = threading.Thread(target=self._run, name="w2n-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, request: dict, respond):
+        """ public function to queue a request
+
+        input: request with id, op, lang, input and option, callable to send the response dict
+        raise: RuntimeError if the batcher is closed
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("server is shutting down")
+            self._queue.append((request, respond))
+            self.requests += 1
+            self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+            self._condition.notify()
+
+    def _take(self):
+        """ [internal] function to wait for the next batch
+        output: list of (request, respond) or None if the batcher is closed
+        """
+        with self._condition:
+            while not self._queue and not self._closed:
+                self._condition.wait()
+            if not self._queue:
+                return None
+            deadline = time.monotonic() + self.window
+            while len(self._queue) < self.max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            self.queue_depths.add(len(self._queue))
+            batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch))]
+            self.batch_sizes.add(len(batch))
+            self.batches += 1
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take()
+            if batch is None:
+                return
+            self.process(batch)
+
+    def process(self, batch: list):
+        """ [internal] function to convert a batch, grouped by language, op and option
+        """
+        groups = {}
+        for request, respond in batch:
+            key = (request["lang"], request["op"], request["option"])
+            groups.setdefault(key, []).append((request, respond))
+        for (lang, op, option), items in groups.items():
+            try:
+                instance = language_instance(lang)
+            except (ValueError, OSError) as error:  # unknown language
+                outcomes = [(False, f"language {lang} is not available: {error}")] * len(items)
+            else:
+                try:
+                    outcomes = convert_group(instance, op, [request["input"] for request, _ in items], option)
+                except Exception as error:  # keep the batcher alive, every request gets its response
+                    outcomes = [(False, f"internal error: {error!r}")] * len(items)
+            for (request, respond), (success, value) in zip(items, outcomes):
+                if not success:
+                    self.errors += 1
+                respond({"id": request["id"], "result" if success else "error": value})
+
+    def stats(self) -> dict:
+        """ public function to get a snapshot of the counters and histograms
+        """
+        with self._condition:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "batches": self.batches,
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self.max_queue_depth,
+                "batch_size": self.batch_sizes.snapshot(),
+                "queue_depth_at_batch": self.queue_depths.snapshot(),
+                "window_ms": self.window * 1000,
+                "max_batch": self.max_batch,
+            }
+
+    def close(self):
+        """ public function to convert the queued requests and to stop the batcher thread
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+
+class RequestError(ValueError):
+    ' invalid request, answered with the id of the request if it has one '
+
+    def __init__(self, message: str, request_id=None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def parse_request(line: bytes) -> dict:
+    """ [internal] function to parse and check one request line
+
+    output: request with id, op, lang, input and option
+    raise: RequestError with the error message for the client
+    """
+    try:
+        message = json.loads(line)
+    except ValueError as error:
+        raise RequestError(f"invalid JSON: {error}") from None
+    if not isinstance(message, dict):
+        raise RequestError("request must be a JSON object")
+    request_id = message.get("id")
+    op = message.get("op")
+    if op not in BATCH_OPS and op not in ("stats", "ping"):
+        raise RequestError(f"unknown op {op}! Please use one of {', '.join([*BATCH_OPS, 'stats', 'ping'])}", request_id)
+    request = {"id": request_id, "op": op, "lang": message.get("lang"), "input": message.get("input")}
+    if op in BATCH_OPS:
+        value = request["input"]
+        if not isinstance(value, str) and not (op == "word" and isinstance(value, (int, float)) and not isinstance(value, bool)):
+            raise RequestError(f"input of op {op} must be a string", request_id)
+        if request["lang"] is not None and not isinstance(request["lang"], str):
+            raise RequestError("lang must be a string", request_id)
+        option = BATCH_OPS[op]
+        request["option"] = bool(message.get(option, OPTION_DEFAULTS[option]))
+    return request
+
+
+class ConnectionHandler(socketserver.StreamRequestHandler):
+    ' Reads the requests of one connection, responses are written by the batcher thread '
+
+    def handle(self):
+        write_lock = threading.Lock()
+        in_flight = threading.Condition()
+        pending = [0]
+
+        def respond(response: dict):
+            data = (json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8")
+            with write_lock:
+                try:
+                    self.wfile.write(data)
+                except (OSError, ValueError):  # client is gone
+                    pass
+
+        def respond_batched(response: dict):
+            respond(response)
+            with in_flight:
+                pending[0] -= 1
+                in_flight.notify()
+
+        batcher = self.server.batcher
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                break
+            if len(line) > MAX_REQUEST_BYTES and not line.endswith(b"\n"):
+                respond({"id": None, "error": f"request longer than {MAX_REQUEST_BYTES} bytes"})
+                break
+            if not line.strip():
+                continue
+            try:
+                request = parse_request(line)
+            except RequestError as error:
+                respond({"id": error.request_id, "error": str(error)})
+                continue
+            if request["op"] == "stats":
+                respond({"id": request["id"], "result": self.server.stats()})
+            elif request["op"] == "ping":
+                respond({"id": request["id"], "result": "pong"})
+            else:
+                with in_flight:
+                    pending[0] += 1
+                try:
+                    batcher.submit(request, respond_batched)
+                except RuntimeError as error:
+                    respond_batched({"id": request["id"], "error": str(error)})
+        # answer the requests sent before the client closed its side
+        with in_flight:
+            while pending[0]:
+                in_flight.wait()
+
+
+class ConversionServer:
+    ' Local conversion server, see the module documentation '
+
+    def __init__(self, address: str=f"127.0.0.1:{DEFAULT_PORT}", langs=(), window: float=DEFAULT_WINDOW,
+                 max_batch: int=DEFAULT_MAX_BATCH):
+        """ address: "unix:/path/of/socket" or "host:port", port 0 for a free port
+            langs: languages to load before the first request
+            window: seconds the oldest request waits for more requests
+            max_batch: maximum count of requests in one batch
+        """
+        if window < 0 or max_batch < 1:
+            raise ValueError("window must not be negative and max_batch must be at least 1")
+        registry.preload(langs)
+        family, socket_address = parse_address(address)
+        server_class = ThreadingUnixServer if address.startswith("unix:") else ThreadingTCPServer
+        self._server = server_class(socket_address, ConnectionHandler)
+        self._server.batcher = MicroBatcher(window, max_batch)
+        self._server.stats = self.stats
+        self._thread = None
+        self.started = time.time()
+
+    @property
+    def address(self) -> str:
+        """ public property with the address the server listens on, with the actual port for port 0
+        """
+        socket_address = self._server.server_address
+        if isinstance(socket_address, tuple):
+            return f"{socket_address[0]}:{socket_address[1]}"
+        return f"unix:{socket_address}"
+
+    def stats(self) -> dict:
+        """ public function to get the batcher counters, the loaded languages and the uptime
+        """
+        stats = self._server.batcher.stats()
+        stats["languages"] = registry.languages()
+        stats["uptime"] = time.time() - self.started
+        return stats
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        """ public function to serve in a background thread
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="w2n-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        """ public function to stop the server, queued requests are still converted
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+        self._server.server_close()
+        self._server.batcher.close()
+        if isinstance(self._server.server_address, str):
+            try:
+                os.unlink(self._server.server_address)
+            except OSError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class ThreadingUnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+else:  # no Unix domain sockets on this platform
+    ThreadingUnixServer = None
+
+
+def main(argv=None):
+    from word2numberi18n.tables import available_languages
+
+    parser = argparse.ArgumentParser(prog="python -m word2numberi18n.server",
+                                     description="Serve number conversions over newline-delimited JSON.")
+    parser.add_argument("--address", default=f"127.0.0.1:{DEFAULT_PORT}",
+                        help="\"host:port\" or \"unix:/path/of/socket\", default 127.0.0.1:%(default)s")
+    parser.add_argument("--lang", nargs="*", help="languages to keep loaded, default all")
+    parser.add_argument("--window-ms", type=float, default=DEFAULT_WINDOW * 1000,
+                        help="milliseconds a request waits for more requests of its batch")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="maximum requests per batch")
+    arguments = parser.parse_args(argv)
+    if arguments.address.startswith("unix:") and ThreadingUnixServer is None:
+        parser.error("Unix domain sockets are not available on this platform")
+
+    langs = available_languages() if arguments.lang is None else arguments.lang
+    server = ConversionServer(arguments.address, langs, arguments.window_ms / 1000, arguments.max_batch)
+    print(f"serving {', '.join(registry.languages())} on {server.address}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   number spans in a text and the offsets between normalized and original text
+'''
+from bisect import bisect_right
+from collections import namedtuple
+
+
+NumberSpan = namedtuple("NumberSpan", ["start", "end", "value", "text"])
+NumberSpan.__doc__ = ''' Number found in a text
+
+start, end: offsets of the number words in the original text
+value:      converted number as it replaces the words in `text_to_num`
+text:       original number words
+'''
+
+
+def normalize_with_offsets(tables, text: str):
+    """ [internal] function to normalize a text like `W2N.normalize` without stripping it
+    and to keep the way back to the offsets in the original text
+
+    input: LanguageTables, original text
+    output: normalized text and a function mapping (start, end) in the normalized text to (start, end) in the original text
+    """
+    lowered = text.lower()
+    lower_origin = None
+    if len(lowered) != len(text):
+        # some characters change their length in lower case, remember where every lower case character comes from
+        pieces = [char.lower() for char in text]
+        lowered = "".join(pieces)
+        lower_origin = []
+        for index, piece in enumerate(pieces):
+            lower_origin.extend([index] * len(piece))
+
+    # segments of the normalized text: (normalized start, lower case start, lower case end, is replaced)
+    segments = []
+    normal_parts = []
+    normal_length = 0
+    lower_position = 0
+    if tables.replace_pattern is not None:
+        substitute = tables._substitute
+        for match in tables.replace_pattern.finditer(lowered):
+            replacement = substitute(match)
+            if replacement == match.group():
+                continue  # word which is no compound
+            if match.start() > lower_position:
+                segments.append((normal_length, lower_position, match.start(), False))
+                normal_parts.append(lowered[lower_position:match.start()])
+                normal_length += match.start() - lower_position
+            segments.append((normal_length, match.start(), match.end(), True))
+            normal_parts.append(replacement)
+            normal_length += len(replacement)
+            lower_position = match.end()
+
+    if not segments and lower_origin is None:
+        return lowered, lambda start, end: (start, end)
+
+    segments.append((normal_length, lower_position, len(lowered), False))
+    normal_parts.append(lowered[lower_position:])
+    segment_starts = [segment[0] for segment in segments]
+
+    def to_lower(position, is_end):
+        # is_end: position is an exclusive end, so the character before it decides the segment
+        index = bisect_right(segment_starts, position - 1 if is_end else position) - 1
+        normal_start, lower_start, lower_end, is_replaced = segments[index]
+        if is_replaced:
+            return lower_end if is_end else lower_start
+        return lower_start + position - normal_start
+
+    def to_original(start, end):
+        lower_start = to_lower(start, False)
+        lower_end = to_lower(end, True)
+        if lower_origin is None:
+            return lower_start, lower_end
+        return lower_origin[lower_start], lower_origin[lower_end - 1] + 1
+
+    return "".join(normal_parts), to_original
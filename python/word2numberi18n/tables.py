@@ -0,0 +1,288 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   read-only language tables compiled from the configuration files
+'''
+import os
+import re
+from types import MappingProxyType
+
+from word2numberi18n.compound import CompoundSegmenter
+from word2numberi18n.fsm import token_classes
+from word2numberi18n.pack import read_pack
+
+
+DATA_DIR = os.path.dirname(__file__)+os.sep+"data"
+SINGLE_WORD = re.compile(r"\w+")
+# "option:" entries of the configuration files and their default values
+#   compound:   number words are written together, eg. "dreihundertvierundzwanzig"
+#   unit_first: units are read before tens, eg. "vier und zwanzig" is 24
+#   vigesimal:  tens are formed by twenty, eg. "quatre vingt" is 80 and "soixante dix sept" is 77
+#   decimal_comma: numerals are grouped with "." and have decimals after ",", eg. "1.250,5"
+OPTIONS = {"compound": "false", "unit_first": "false", "vigesimal": "false", "decimal_comma": "false"}
+
+
+class LanguageTables:
+    ' Read-only tables of one language, safe to share between instances and threads '
+
+    __slots__ = ("lang", "number_system", "normalize_data", "sorted_measure_values",
+                 "point_name", "decimal_words", "name_by_value", "measures", "measure_words",
+                 "replace_pattern", "_substitute", "conjunctions", "zero_words", "ambiguous_words", "token_classes",
+                 "options", "segmenter", "unit_first", "vigesimal", "decimal_comma", "_number_filter", "_token_ids")
+
+    def __init__(self, lang, number_system, normalize_data, measure_values, point_name, conjunctions=(), zero_words=(),
+                 replace_source=None, options=None, ambiguous_words=()):
+        """ lang: language code
+            number_system: dict of number word to value
+            normalize_data: dict of replacement rules
+            measure_values: iterable of measure values
+            point_name: localized name of the decimal point
+            conjunctions: words joining the parts of a number in a text like "and"
+            zero_words: words for zero kept as leading zero in a text
+            replace_source: precompiled `trie_pattern` of the normalize_data, built if None
+            options: dict of the "option:" entries, see OPTIONS
+            ambiguous_words: words which are also no number like the article "a", a number in a text only next to another number word
+        """
+        name_by_value = {}
+        for number_name, number_value in number_system.items():
+            name_by_value.setdefault(number_value, number_name)  # first name is the canonical one
+        _set = object.__setattr__
+        _set(self, "lang", lang)
+        _set(self, "number_system", MappingProxyType(dict(number_system)))
+        _set(self, "normalize_data", MappingProxyType(dict(normalize_data)))
+        _set(self, "sorted_measure_values", tuple(sorted(measure_values, reverse=True)))
+        _set(self, "point_name", point_name)
+        _set(self, "decimal_words", tuple(number_system)[:10])
+        _set(self, "name_by_value", MappingProxyType(name_by_value))
+        # measure value and localized measure word, from highest to lowest value
+        _set(self, "measures", tuple((measure_value, name_by_value.get(measure_value))
+                                     for measure_value in self.sorted_measure_values))
+        _set(self, "measure_words", frozenset(name for measure_value, name in self.measures if name is not None))
+        _set(self, "conjunctions", frozenset(conjunctions))
+        _set(self, "zero_words", frozenset(zero_words))
+        _set(self, "ambiguous_words", frozenset(ambiguous_words))
+        _set(self, "options", MappingProxyType({**OPTIONS, **(options or {})}))
+        _set(self, "unit_first", self.options["unit_first"] == "true")
+        _set(self, "vigesimal", self.options["vigesimal"] == "true")
+        _set(self, "decimal_comma", self.options["decimal_comma"] == "true")
+        segmenter = None
+        if self.options["compound"] == "true":
+            # number words and single word replacement rules, the conjunctions and the point only inside a compound
+            segmenter = CompoundSegmenter([*number_system, *(word for word in normalize_data if SINGLE_WORD.fullmatch(word))],
+                                          [*conjunctions, point_name] if point_name else conjunctions)
+        _set(self, "segmenter", segmenter)
+        # all replacement rules in one pattern, longest rule first and only for whole words
+        replace_pattern = None
+        if normalize_data:
+            if replace_source is None:
+                replace_source = trie_pattern(normalize_data)
+            replace_source = r"(?<!\w)" + replace_source + r"(?!\w)"
+        if segmenter is not None:
+            # every other word starting with a number word can be a compound
+            compound_source = r"(?<!\w)" + trie_pattern(segmenter.words) + r"\w*"
+            replace_source = replace_source + "|" + compound_source if replace_source else compound_source
+        if replace_source:
+            replace_pattern = re.compile(replace_source)
+        _set(self, "replace_pattern", replace_pattern)
+        if segmenter is None:
+            _set(self, "_substitute", lambda match, rules=self.normalize_data: rules[match.group()])
+        else:
+            _set(self, "_substitute", compound_substitute(self.normalize_data, segmenter))
+        # class and value of every word for the finite-state parser
+        _set(self, "token_classes", MappingProxyType(token_classes(self.number_system, point_name,
+                                                                  self.conjunctions, self.decimal_words)))
+        _set(self, "_number_filter", None)  # compiled on first use, see number_filter
+        _set(self, "_token_ids", None)      # built on first use, see token_ids
+
+    def replace(self, text: str) -> str:
+        """ [internal] function to apply all replacement rules in one pass over the text
+        and to split compound number words for languages with the option compound
+        
+        input: lower case text
+        output: text with replaced words
+        """
+        if self.replace_pattern is None:
+            return text
+        return self.replace_pattern.sub(self._substitute, text)
+
+    def number_filter(self):
+        """ [internal] function to get the pattern of the words which can become a number word by `replace`
+        a lower case text without match has no number, so the text functions can skip it after one scan
+
+        output: compiled pattern matching the number words, the point word and the replacement rules
+                as whole words, for compounding languages every word starting with a number word
+        """
+        number_filter = self._number_filter
+        if number_filter is None:
+            words = [*self.number_system, *self.normalize_data]
+            if self.point_name:
+                words.append(self.point_name)
+            if self.segmenter is None:
+                source = r"(?<!\w)" + trie_pattern(words) + r"(?!\w)"
+            else:
+                source = r"(?<!\w)" + trie_pattern([*words, *self.segmenter.words])
+            number_filter = re.compile(source)
+            object.__setattr__(self, "_number_filter", number_filter)  # the same pattern if threads race
+        return number_filter
+
+    def token_ids(self):
+        """ [internal] function to get small integer ids of the words for the vectorized engine
+        a word is read like `parse_number_words` reads it: replaced by its rule, then classified
+
+        output: tuple of dict of word (also the keys of the replacement rules) to id,
+                tuple of the token class per id and tuple of the value per id, id 0 is no number word
+        """
+        token_ids = self._token_ids
+        if token_ids is None:
+            ids = {}
+            classes = [0]
+            values = [0]
+            for word, (token_class, value) in self.token_classes.items():
+                ids[word] = len(classes)
+                classes.append(token_class)
+                values.append(value)
+            word_ids = dict(ids)
+            for word, replacement in self.normalize_data.items():
+                if replacement in ids:
+                    word_ids[word] = ids[replacement]
+                else:
+                    word_ids.pop(word, None)  # the rule replaces a number word by another word
+            token_ids = word_ids, tuple(classes), tuple(values)
+            object.__setattr__(self, "_token_ids", token_ids)  # the same ids if threads race
+        return token_ids
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.lang!r})"
+
+
+def compound_substitute(rules, segmenter):
+    """ [internal] function to get the substitution of `LanguageTables.replace` for a compounding language
+
+    input: replacement rules, CompoundSegmenter
+    output: function of a match to the rule for the matched words or the parts of a compound separated by spaces
+    """
+    replacements = {}  # compound to its replacement, bounded like the cache of the segmenter
+
+    def substitute(match):
+        word = match.group()
+        replacement = rules.get(word) or replacements.get(word)
+        if replacement is not None:
+            return replacement
+        parts = segmenter.segment(word)
+        replacement = word if parts is None or len(parts) < 2 else " ".join([rules.get(part, part) for part in parts])
+        if len(replacements) >= segmenter.max_cache:
+            replacements.clear()
+        replacements[word] = replacement
+        return replacement
+
+    return substitute
+
+
+def trie_pattern(words) -> str:
+    """ [internal] function to build a regular expression matching any of the words
+    the alternatives are factored by common prefixes and longer words are tried first
+
+    input: iterable of words
+    output: regular expression source
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end of word
+
+    def build(node):
+        is_end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 and not is_end else "(?:" + "|".join(branches) + ")"
+        return pattern + "?" if is_end else pattern
+
+    return build(trie)
+
+
+def data_file(lang: str) -> str:
+    """ [internal] function to get the configuration file of a language
+    """
+    return DATA_DIR+os.sep+"config_"+lang+".properties"
+
+
+def available_languages() -> list:
+    """ [internal] function to get the codes of all languages with a configuration file
+    """
+    return sorted(name[len("config_"):-len(".properties")] for name in os.listdir(DATA_DIR)
+                  if name.startswith("config_") and name.endswith(".properties"))
+
+
+def pack_file(lang: str) -> str:
+    """ [internal] function to get the precompiled pack of a language
+    """
+    return DATA_DIR+os.sep+"config_"+lang+".pack"
+
+
+def parse_properties(lang: str) -> dict:
+    """ [internal] function to parse the configuration file of a language
+
+    input: language code
+    output: dict of LanguageTables arguments
+    raise: OSError if no configuration file exists for the language
+    """
+    number_system = {}
+    normalize_data = {}
+    measure_values = []
+    point_name = ""
+    text_words = {"conjunction": [], "zero": [], "ambiguous": []}
+    options = {}
+    with open(data_file(lang), "r", encoding="utf-8") as number_system_data:
+        for line in number_system_data:
+            if line.startswith('#'):
+                pass
+            else:
+                (key, val) = line.split("=")
+                if key.startswith("replace:"):
+                    key = key[len("replace:"):]
+                    normalize_data[key] = val.strip()
+                elif key.startswith("measure:"):
+                    measure_values.append(int(val.strip()))
+                elif key.startswith("option:"):
+                    options[key[len("option:"):]] = val.strip().lower()
+                elif key.startswith("text:"):
+                    text_words.setdefault(key[len("text:"):], []).extend(word.strip() for word in val.split(","))
+                else:
+                    if "point" != key:
+                        number_system[key] = int(val)
+                    else:
+                        point_name = val.strip()
+    return {
+        "number_system": number_system,
+        "normalize_data": normalize_data,
+        "measure_values": measure_values,
+        "point_name": point_name,
+        "conjunctions": text_words["conjunction"],
+        "zero_words": text_words["zero"],
+        "options": options,
+        "ambiguous_words": text_words["ambiguous"],
+    }
+
+
+def load_tables(lang: str, use_pack: bool=True) -> LanguageTables:
+    """ [internal] function to load the tables of a language
+    from the precompiled pack if it is up to date, else from the configuration file
+
+    input: language code, False to always parse the configuration file
+    output: LanguageTables
+    raise: OSError if no configuration file exists for the language
+    """
+    fields = read_pack(pack_file(lang), data_file(lang)) if use_pack else None
+    if fields is None:
+        fields = parse_properties(lang)
+    return LanguageTables(lang, **fields)
@@ -1,5 +1,4 @@
-from typing import List
-
+from word2numberi18n.fsm import VIGESIMAL_TENS
 
 digits      = [i for i in range(20)] 
 tens        = [10*i for i in range(2, 10)] 
@@ -62,7 +61,40 @@ def is_dependent(in1: int, in2: int) -> bool:
     return result
 
 
-def split_by_terminate_number(number_list: List[int]) -> List[List[int]]:
+def is_unit_before_ten(in1: int, in2: int) -> bool:
+    """check if in1 is a unit read before the ten in2, like "vier und zwanzig"
+
+    Args:
+        in1 (int): first input
+        in2 (int): second input
+
+    Returns:
+        bool: if in1 is a unit and in2 a ten
+    """
+    return 0 < in1 < 10 and in2 in tens
+
+
+def vigesimal_value(in1: int, in2: int) -> int:
+    """get the value of in1 and in2 read together in a vigesimal language,
+    like "quatre vingt" (80), "soixante dix" (70) or "dix sept" (17)
+
+    Args:
+        in1 (int): first input
+        in2 (int): second input
+
+    Returns:
+        int: the value of both, 0 if they are not read together
+    """
+    if 0 < in1 < 10 and in2 == 20 and in1 * 20 in VIGESIMAL_TENS:
+        return in1 * 20
+    if in1 in VIGESIMAL_TENS and 10 <= in2 < 20:
+        return in1 + in2
+    if in1 == 10 and 0 < in2 < 10:
+        return in1 + in2
+    return 0
+
+
+def split_by_terminate_number(number_list: "list[int]") -> "list[list[int]]":
     """Split list when number in the same level are close to each other or
     when the descending order breaks.
 
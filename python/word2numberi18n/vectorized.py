@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: 2022 - AmirMohammad Babaei <AmirMohamadBabaee@users.noreply.github.com>
+# SPDX-License-Identifier: MIT
+
+'''
+   vectorized batch engine over token id matrices, needs NumPy (extra "numpy")
+
+   The words of every distinct input are encoded once to the ids of `LanguageTables.token_ids`
+   and padded to a 2-D matrix. Lookup tables turn it into a class and a value matrix, then the
+   states of `parse_number_words` advance one column for all rows at once. Rows which the matrix
+   can not express (numerals, point words, conjunctions of unit_first languages, very large measures,
+   long or malformed numbers) are converted by `W2N.try_word_to_num`, so the results and errors
+   are the same as the ones of the fsm engine.
+'''
+from itertools import chain
+from time import perf_counter
+
+import numpy
+
+from word2numberi18n.batch import BatchResult, INT64_MIN, INT64_MAX
+from word2numberi18n.fsm import (NUMBER_WORD, WORD_PART, DIGIT, UNIT, TEEN, TEN, HUNDRED, MEASURE, POINT, CONJUNCTION,
+                                 START, HUNDRED_SET, TEN_SET, CLOSED, VIGESIMAL_TENS)
+from word2numberi18n.numerals import ANY_DIGIT
+
+MAX_TOKENS = 32          # longer inputs are converted by the scalar path
+MAX_MEASURE = 10 ** 15   # with larger measures the total may not fit into int64
+FALLBACK = 255           # token class of the words only the scalar path reads
+
+
+def lookup_tables(tables):
+    """ [internal] function to get the class and the value of every token id
+
+    input: LanguageTables
+    output: tuple of uint8 array of token classes and int64 array of values
+    """
+    word_ids, classes, values = tables.token_ids()
+    token_classes = []
+    token_values = []
+    for token_class, value in zip(classes, values):
+        if token_class == CONJUNCTION:
+            token_class = FALLBACK if tables.unit_first else 0  # only read with a unit before, see parse_number_words
+        elif token_class == POINT or (token_class == MEASURE and value >= MAX_MEASURE):
+            token_class = FALLBACK
+        token_classes.append(token_class)
+        token_values.append(value if token_class != FALLBACK else 0)
+    return numpy.array(token_classes, dtype=numpy.uint8), numpy.array(token_values, dtype=numpy.int64)
+
+
+def encode(word_ids: dict, number_sentence: str) -> list:
+    """ [internal] function to get the token ids of the words of a normalized string
+    hyphenated words are split like in `parse_number_words` if they are no number word as a whole
+
+    input: dict of word to id, normalized string
+    output: list of ids, 0 for words which are no number words
+    """
+    words = NUMBER_WORD.findall(number_sentence)
+    if '-' not in number_sentence:
+        return [word_ids.get(word, 0) for word in words]
+    ids = []
+    for word in words:
+        token_id = word_ids.get(word)
+        if token_id is None and '-' in word:
+            ids.extend(word_ids.get(part, 0) for part in WORD_PART.findall(word))
+        else:
+            ids.append(token_id or 0)
+    return ids
+
+
+def evaluate(token_classes, token_values, matrix, vigesimal: bool=False):
+    """ [internal] function to calculate the rows of a token id matrix like `parse_number_words`
+    the place checks and the group and measure arithmetic run column by column for all rows
+
+    input: lookup tables of `lookup_tables`, 2-D array of token ids padded with 0, option vigesimal of the language
+    output: tuple of int64 array of the numbers and bool array which is False for the rows of the scalar path
+    """
+    classes = token_classes[matrix]
+    values = token_values[matrix]
+    rows = len(matrix)
+    total = numpy.zeros(rows, dtype=numpy.int64)
+    group = numpy.zeros(rows, dtype=numpy.int64)
+    last_measure = numpy.zeros(rows, dtype=numpy.int64)
+    last_unit = numpy.zeros(rows, dtype=numpy.int64)
+    state = numpy.full(rows, START, dtype=numpy.uint8)
+    invalid = (classes == FALLBACK).any(axis=1) | ~classes.any(axis=1)  # no number word is an error
+    for column in range(matrix.shape[1]):
+        token_class = classes[:, column]
+        value = values[:, column]
+        is_measure = token_class == MEASURE
+        is_place = (token_class != 0) & ~is_measure
+        multiplier = numpy.where(state != START, group, 1)
+
+        # a measure word multiplies the group and adds it to the total
+        invalid |= is_measure & (last_measure > 0) & (value >= last_measure)
+        total += numpy.where(is_measure, multiplier * value, 0)
+        last_measure = numpy.where(is_measure, value, last_measure)
+
+        # the place of the word in the group decides if it continues the group
+        is_unit = (token_class == DIGIT) | (token_class == UNIT)
+        is_ten = token_class == TEN
+        is_teen = token_class == TEEN
+        is_hundred = token_class == HUNDRED
+        before_ten = (state == START) | (state == HUNDRED_SET)
+        teen_fits = before_ten
+        times_twenty = is_ten & (value == 20) & (last_unit > 0)  # only set for vigesimal languages
+        if vigesimal:
+            teen_fits = teen_fits | ((state == TEN_SET) & numpy.isin(group % 100, VIGESIMAL_TENS))
+        fits = numpy.select([is_unit, is_ten, is_teen, is_hundred],
+                            [state != CLOSED, before_ten | times_twenty, teen_fits,
+                             (state == START) | ((state != HUNDRED_SET) & (group < 100))],
+                            state == START)  # HUNDREDS
+        invalid |= is_place & ~fits
+        next_state = numpy.select([is_teen & (value == 10) & vigesimal, is_unit | is_teen, is_ten],
+                                  [TEN_SET, CLOSED, numpy.where(value % 10 == 0, TEN_SET, CLOSED)],
+                                  HUNDRED_SET)
+        grown = numpy.where(is_hundred, multiplier * value, group + numpy.where(times_twenty, last_unit * 19, value))
+        if vigesimal:
+            started_tens = is_unit & before_ten & ~times_twenty
+            last_unit = numpy.where(is_place | is_measure, numpy.where(started_tens, value, 0), last_unit)
+        group = numpy.where(is_place, grown, numpy.where(is_measure, 0, group))
+        state = numpy.where(is_place, next_state, numpy.where(is_measure, START, state)).astype(numpy.uint8)
+    return total + group, ~invalid
+
+
+def convert_many(instance, number_sentences: list, result_type: str="number") -> BatchResult:
+    """ [internal] function to convert many inputs like `W2N.word_to_num_many` with the vectorized engine
+    distinct inputs are converted once, the rows for the scalar path with `try_word_to_num` of the instance
+
+    input: W2N, list of float, int or str, result type "number" or "scaled"
+    output: BatchResult
+    """
+    probe = instance.instrumentation
+    if probe is not None:
+        started = perf_counter()
+    slots = {}
+    distinct = []
+    inverse = []
+    for number_sentence in number_sentences:
+        try:
+            key = (type(number_sentence), number_sentence)
+            slot = slots.get(key)
+        except TypeError:  # unhashable input
+            key = None
+            slot = None
+        if slot is None:
+            slot = len(distinct)
+            distinct.append(number_sentence)
+            if key is not None:
+                slots[key] = slot
+        inverse.append(slot)
+
+    word_ids = instance.tables.token_ids()[0]
+    token_classes, token_values = lookup_tables(instance.tables)
+    fallback_ids = frozenset(numpy.flatnonzero(token_classes == FALLBACK).tolist())
+    point_name = instance.tables.point_name or None
+    rows = []           # token ids of the rows of the matrix
+    row_slots = []
+    scalar_slots = []   # slots for the scalar path
+    normalized = {}     # slot to normalized string of the rows without numerals
+    for slot, number_sentence in enumerate(distinct):
+        if type(number_sentence) is str:
+            number_sentence = instance.normalize(number_sentence)
+            if ANY_DIGIT.search(number_sentence) is None:
+                normalized[slot] = number_sentence
+                if point_name is not None and point_name in number_sentence:  # decimals need the scalar path
+                    scalar_slots.append(slot)
+                    continue
+                ids = encode(word_ids, number_sentence)
+                if 0 < len(ids) <= MAX_TOKENS and fallback_ids.isdisjoint(ids):
+                    rows.append(ids)
+                    row_slots.append(slot)
+                    continue
+        scalar_slots.append(slot)
+
+    values = numpy.zeros(len(distinct), dtype=numpy.int64)
+    valid = numpy.zeros(len(distinct), dtype=numpy.bool_)
+    scales = numpy.zeros(len(distinct), dtype=numpy.uint8)
+    if rows:
+        lengths = numpy.fromiter(map(len, rows), dtype=numpy.intp, count=len(rows))
+        matrix = numpy.zeros((len(rows), int(lengths.max())), dtype=numpy.intp)
+        matrix[numpy.arange(matrix.shape[1]) < lengths[:, None]] = numpy.fromiter(chain.from_iterable(rows), dtype=numpy.intp)
+        numbers, calculated = evaluate(token_classes, token_values, matrix, instance.tables.vigesimal)
+        row_slots = numpy.array(row_slots, dtype=numpy.intp)
+        values[row_slots[calculated]] = numbers[calculated]
+        valid[row_slots[calculated]] = True
+        scalar_slots.extend(row_slots[~calculated].tolist())
+        if probe is not None:
+            probe.count("vectorized_rows", int(calculated.sum()))
+    if probe is not None:
+        probe.lap("vectorize", started)  # the rows of the scalar path have their own stages
+
+    scaled = result_type == "scaled"
+    special = {}        # slot to (True, result without int64 value) or (False, error message)
+    # without cache and instrumentation the words need no second normalization
+    plain = instance.result_cache is None and probe is None
+    for slot in scalar_slots:
+        if plain and slot in normalized:
+            result = instance.normalized_try_word_to_num(normalized[slot], False, result_type)
+        else:
+            result = instance.try_word_to_num(distinct[slot], False, result_type)
+        if result.error is not None:
+            special[slot] = (False, result.message)
+            continue
+        value, scale = result.value if scaled and type(result.value) is tuple else (result.value, 0)
+        if type(value) is int and INT64_MIN <= value <= INT64_MAX and scale < 256:
+            values[slot] = value
+            scales[slot] = scale
+            valid[slot] = True
+        else:
+            special[slot] = (True, result.value)
+
+    inverse = numpy.array(inverse, dtype=numpy.intp)
+    overflow = {}
+    errors = {}
+    if special:
+        is_special = numpy.zeros(len(distinct), dtype=numpy.bool_)
+        is_special[list(special)] = True
+        for index in numpy.flatnonzero(is_special[inverse]).tolist():
+            converted, outcome = special[int(inverse[index])]
+            (overflow if converted else errors)[index] = outcome
+    return BatchResult.from_numpy(values[inverse], valid[inverse], overflow, errors, scales[inverse] if scaled else None)
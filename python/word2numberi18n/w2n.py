@@ -5,87 +5,99 @@
 """
 
 
-from itertools import groupby
-import os
-import locale
-import codecs
 import re
-from pickle import INST
-from typing import List
-
-from word2numberi18n.utils import split_by_terminate_number, is_dependent
+import threading
+from collections.abc import Iterable
+from time import perf_counter
+
+from word2numberi18n.utils import split_by_terminate_number, is_dependent, is_unit_before_ten, vigesimal_value
+from word2numberi18n.registry import LanguageRegistry, resolve_language
+from word2numberi18n.tables import LanguageTables, load_tables, available_languages
+from word2numberi18n.batch import BatchResult
+from word2numberi18n.cache import ResultCache
+from word2numberi18n.spans import NumberSpan, normalize_with_offsets
+from word2numberi18n.fsm import parse_number_words, find_word
+from word2numberi18n.detect import LanguageDetector
+from word2numberi18n.results import (RESULT_TYPES, make_result, format_number, ConversionResult, INVALID_TYPE,
+                                     NO_NUMBER_WORDS, NO_LANGUAGE, REDUNDANT_POINT, REDUNDANT_WORD,
+                                     MEASURE_SEQUENCE, MEASURE_AFTER_POINT)
+from word2numberi18n.numerals import ANY_DIGIT, numeral_parts, mixed_parts
+
+# the words of a text and the gap allowed between words of one number
+TEXT_WORD = re.compile(r"\w+(?:-\w+)*")
+WORD_PART = re.compile(r"\w+")
+NUMBER_GAP = re.compile(r"[^\S\n]*-?[^\S\n]*")
+TEXT_TOKEN = re.compile(r"\S+")
+TOKEN_LAST_WORD = re.compile(r"(\w+)-?$")
+STREAM_CHUNK_SIZE = 65536
+# smallest batch of word_to_num_many for the vectorized engine
+VECTORIZED_MIN_BATCH = 256
+# parser engines: "fsm" single pass state machine, "legacy" word list algorithm
+ENGINES = ("fsm", "legacy")
 
 class W2N:
     ' Word2Number class '
     
-    number_system = {}
-    normalize_data = {}
-    sorted_measure_values = []# = [1_000_000_000_000,1_000_000_000,1_000_000,1_000,100]
-    localizedPointName = ""
-    decimal_words = []
-    
     lang = "en"
-    
-    def __init__ (self, lang_param):
-        # first get programming language specific local spoken language
-        lang = lang_param
-        if lang is None:
-            lang = locale.getlocale()[0]
-        if "w2n.lang" in os.environ:
-            lang = os.environ["w2n.lang"]
-        if lang is None:
-            lang = locale.getdefaultlocale()[0]
-        if lang is None or lang[0] is None:
-            lang = None
-            if "LANGUAGE" in os.environ:
-                lang = os.environ["LANGUAGE"]
-        if lang is None:
-            lang = "en"  # fallback
-        lang = lang[:2]
-        
+    # opt-in ResultCache used by word_to_num, set it here for all instances
+    result_cache = None
+    # parser engine of word_to_num, set it here for all instances
+    engine = "legacy"
+    # opt-in Instrumentation of the conversion stages, set it here for all instances (see word2numberi18n.instrument)
+    instrumentation = None
+    # skip texts without any (replaceable) number word after one scan, set it here for all instances
+    prefilter = True
+    # opt-in NumPy engine of word_to_num_many for large batches (see word2numberi18n.vectorized), set it here for all instances
+    vectorized = False
+    
+    def __init__ (self, lang_param, tables: LanguageTables=None, result_cache: ResultCache=None, engine: str=None):
+        """ lang_param: language name or None for the process default
+            tables: already loaded tables of the language, loaded from the configuration file if None
+            result_cache: ResultCache for this instance, None to use the class wide W2N.result_cache
+            engine: parser engine for this instance, one of ENGINES, None to use the class wide W2N.engine
+        """
+        if engine is not None and engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine}! Please use one of {', '.join(ENGINES)}")
         # Now analyse the configuration file for the local spoken language
-        data_file = os.path.dirname(__file__)+os.sep+"data"+os.sep+"config_"+lang+".properties"
-        with codecs.open(data_file, "r", encoding="utf-8") as number_system_data:
-            for line in number_system_data:
-                if line.startswith('#'):
-                    pass
-                else:
-                    (key, val) = line.split("=")
-                    if key.startswith("replace:"):
-                        key =key[len("replace:"):]
-                        self.normalize_data[key] = val.strip()
-                    elif key.startswith("measure:"):
-                        self.sorted_measure_values.append(int(val.strip()))
-                    else:
-                        if "point" != key:
-                            val = int(val)
-                            self.number_system[key] = val
-                        else:
-                            self.localizedPointName = val.strip()
-        
-        self.sorted_measure_values = sorted(self.sorted_measure_values,reverse=True)
-        self.decimal_words = list(self.number_system.keys())[:10]
-
-    def parse_number_list(self, digit_values: List[int]) -> int:
-        hundred_index = digit_values.count(100)
-        hundred_index = digit_values.index(100) if 100 in digit_values else -1
-        if hundred_index == 1:
-            digit_values[0] = digit_values[0] * digit_values[1] # this is like other languages need to do it
-            del digit_values[1]
-        if len(digit_values) > 3 and digit_values[0] < 100:
-            digit_values[0] *= digit_values[1]
-            del digit_values[1]
-        elif len(digit_values) > 3 and digit_values[0] > 100:
-            digit_values[1] *= digit_values[2]
-            del digit_values[2]
+        if tables is None:
+            # first get programming language specific local spoken language
+            tables = load_tables(resolve_language(lang_param))
+        self.tables = tables
+        self.lang = tables.lang
+        
+        # the read-only tables are owned by this instance, other instances have their own
+        self.number_system = tables.number_system
+        self.normalize_data = tables.normalize_data
+        self.sorted_measure_values = tables.sorted_measure_values
+        self.localizedPointName = tables.point_name
+        self.decimal_words = tables.decimal_words
+        if result_cache is not None:
+            self.result_cache = result_cache
+        if engine is not None:
+            self.engine = engine
+
+    def parse_number_list(self, digit_values: "list[int]") -> int:
+        """ [internal] function to calculate the value of up to three digits, eg. [2, 100, 20, 5] is 225
+        the list is only read, so concurrent calls share no mutable state
+        
+        input: list of integers
+        return value: integer
+        """
+        first = digit_values[0]
+        rest = 1  # index of the first value after first
+        if len(digit_values) > 1 and digit_values[1] == 100 and first != 100:
+            first *= 100 # this is like other languages need to do it
+            rest = 2
+        if len(digit_values) - rest > 2:
+            if first < 100:
+                first *= digit_values[rest]
+                rest += 1
+            elif first > 100:
+                return first + digit_values[rest] * digit_values[rest + 1] + sum(digit_values[rest + 2:])
         # add the three digits
-        while len(digit_values) > 1:
-            digit_values[0] += digit_values[1]
-            del digit_values[1]
-        # return the result
-        return digit_values[0]       
+        return first + sum(digit_values[rest:])
     
-    def number_formation(self, number_words: List[str], is_separate: bool=False) -> int:
+    def number_formation(self, number_words: "list[str]", is_separate: bool=False) -> int:
         """ [internal] function to form numeric multipliers
         
         input: list of strings
@@ -121,6 +133,20 @@ class W2N:
                 decimal_number_str.append(self.number_system[dec_word])
         final_decimal_string = ''.join(map(str, decimal_number_str))
         return final_decimal_string
+
+    def get_decimal_parts(self, decimal_digit_words):
+        """ [internal] function to convert post decimal digit words to the digits as int and their count
+        the digits are added arithmetically, eg. "zero five" is (5, 2)
+        
+        input: list of strings
+        output: tuple of int and count of digits, (0, 1) if a word is no digit like `get_decimal_string`
+        """
+        fraction = 0
+        for dec_word in decimal_digit_words:
+            if(dec_word not in self.decimal_words):
+                return 0, 1
+            fraction = fraction * 10 + self.number_system[dec_word]
+        return fraction, len(decimal_digit_words)
     
     
     def normalize(self, number_sentence):
@@ -141,9 +167,7 @@ class W2N:
     
         # for examples: both is right "vingt et un" and "vingt-et-un"
         # we change this to composed value "vingt-et-un" over the localized data file "replace:" entry
-        for non_composed_number_value, composed_number_value in self.normalize_data.items():
-            if number_sentence.count(non_composed_number_value) > 0:
-                number_sentence = number_sentence.replace(non_composed_number_value, composed_number_value)
+        number_sentence = self.tables.replace(number_sentence)
     
         return number_sentence.strip()
     
@@ -176,10 +200,7 @@ class W2N:
         input: numeric value
         output: name from language configuration or None if not found 
         """
-        for number_name, number_value in self.number_system.items():
-            if new_number == number_value:
-                return number_name
-        return None
+        return self.tables.name_by_value.get(new_number)
     
     
     def get_index_for_number(self, new_number, clean_numbers):
@@ -196,7 +217,7 @@ class W2N:
         return clean_numbers.index(localized_name) if localized_name in clean_numbers else -1
     
     
-    def get_number_value (self, clean_numbers: List[str], is_separate: bool=False):
+    def get_number_value (self, clean_numbers: "list[str]", is_separate: bool=False):
         """ [internal] function to get the pre-decimal number from clean_number
         
             input: sorted array with number words
@@ -228,8 +249,8 @@ class W2N:
         # Also it is no different to calculate a trillion or a million or other
         #
         
-        for measure_value in self.sorted_measure_values:
-            measure_value_index = self.get_index_for_number(measure_value, clean_numbers)
+        for measure_value, measure_name in self.tables.measures:
+            measure_value_index = clean_numbers.index(measure_name) if measure_name in clean_numbers else -1
             if measure_value_index > -1:
                 result +=  self.get_measure_multiplier(measure_value_index, clean_numbers) * measure_value
                 clean_numbers = clean_numbers[measure_value_index+1:]
@@ -256,270 +277,616 @@ class W2N:
 
     def clean_str(self, number_sentence):
         clean_numbers = []
-        split_words = re.findall(r'\w+', number_sentence)  # strip extra spaces and comma and than split sentence into words
+        # strip extra spaces and comma and than split sentence into words, hyphenated number words stay whole like "quatre-vingt-dix"
+        split_words = []
+        for text_word in TEXT_WORD.findall(number_sentence):
+            if '-' in text_word and self.normalize_data.get(text_word, text_word) not in self.number_system:
+                split_words += WORD_PART.findall(text_word)
+            else:
+                split_words.append(text_word)
+        unit_first = self.tables.unit_first
+        after_unit = False  # unit_first: conjunction after a unit, eg. "vier und"
         # removing unknown words form text
         for word in split_words:
             word = self.normalize_data.get(word,word) # replacing words and lemma text
             if word in self.number_system:
-                clean_numbers.append(word)
+                if after_unit and is_unit_before_ten(self.number_system[clean_numbers[-1]], self.number_system[word]):
+                    clean_numbers.insert(-1, word)  # "vier und zwanzig" is read as "zwanzig vier"
+                else:
+                    clean_numbers.append(word)
             elif word == self.localizedPointName:
                 clean_numbers.append(word)
+            after_unit = (unit_first and word in self.tables.conjunctions and len(clean_numbers) > 0
+                          and 0 < self.number_system.get(clean_numbers[-1], 0) < 10)
         return clean_numbers
     
-    def word_to_num(self, number_sentence: str, is_separate: bool=False, str_out: bool=False):
+    def word_to_num(self, number_sentence: str, is_separate: bool=False, str_out: bool=False, result_type: str=None):
         """ public function to return integer for an input `number_sentence` string
         This function return as result
         - the same float if float is input
         - the same int if int is given
+        - the number of a numeral in any digit script without the word engine, eg. "1,250.5" or "۲٫۵"
+          (with the option decimal_comma of the language "1.250,5")
         - None if no number can be extracted
         - ValueError if extracted number is formal incorrect
+        
+        numerals next to hundred and measure words are their values, eg. "2.5 thousand" is 2500,
+        a word with digits which is no numeral of the language is an error.
+        `result_type` is one of RESULT_TYPES: "number" (int or float, default), "str" (like `str_out`),
+        "decimal" (exact decimal.Decimal) or "scaled" (exact (integer, scale) pair, eg. (205, 2) for 2.05)
+        this is `try_word_to_num` raising its error
     
         preconditions: number_sentence is type of float, int or str
         input: string
         output: int or float or None
         raise: given number is formal incorrect
         """
-        result = None
-        clean_numbers = []
-        clean_decimal_numbers = []
-    
+        if result_type is None:
+            result_type = "str" if str_out else "number"
+        result = self.try_word_to_num(number_sentence, is_separate, result_type)
+        if result.error is not None:
+            raise ValueError(result.message)
+        return result.value
+
+    def try_word_to_num(self, number_sentence: str, is_separate: bool=False, result_type: str="number") -> ConversionResult:
+        """ public function like `word_to_num` without exceptions for malformed input
+        The result has the value or the error code with the offending word and its index
+        in the words of the normalized input, the message is only built if it is read.
+        
+        example: try_word_to_num("million million") with lang="en" is
+                 ConversionResult(error="redundant_word", token="million", index=1)
+        
+        input: float, int or string, is_separate, one of RESULT_TYPES
+        output: ConversionResult
+        raise: ValueError for an unknown result type
+        """
         # check preconditions
     
         if type(number_sentence) is float:
-            return number_sentence
+            return ConversionResult(number_sentence)
         if type(number_sentence) is int:
-            return number_sentence
+            return ConversionResult(number_sentence)
         
         if type(number_sentence) is not str:
-            raise ValueError("Type of input is not string! Please enter a valid number word (eg. \'two million twenty three thousand and forty nine\')")
-    
+            return ConversionResult(error=INVALID_TYPE)
+    
+        numeral = numeral_parts(number_sentence.strip(), self.tables.decimal_comma)
+        if numeral is not None:  # form fields are mostly digits, no need for the words
+            if self.instrumentation is not None:
+                self.instrumentation.count("numerals")
+            return ConversionResult(make_result(*numeral, result_type))
+        probe = self.instrumentation
+        if probe is not None:
+            started = perf_counter()
         number_sentence = self.normalize(number_sentence) 
+        if probe is not None:
+            return self.probed_try_word_to_num(probe, probe.lap("normalize", started), number_sentence, is_separate, result_type)
     
-        if(number_sentence.isdigit()):  # return the number if user enters a number string
-            result = int(number_sentence)
-        else:
-            clean_numbers = self.clean_str(number_sentence)
-        
-            # Error message if the user enters invalid input!
-            if len(clean_numbers) == 0:
-                raise ValueError("No valid number words found! Please enter a valid number word (eg. two million twenty three thousand and forty nine)")
-        
-            # check point count
-            if clean_numbers.count(self.localizedPointName)>1:
-                 raise ValueError("Redundant point word "+self.localizedPointName+"! Please enter a valid number word (eg. two million twenty three thousand and forty nine)")
-                      
-            # split in pre-decimal and post-decimal part
-            point_count = clean_numbers.count(self.localizedPointName)
-            if point_count == 1:
-                clean_decimal_numbers = clean_numbers[clean_numbers.index(self.localizedPointName)+1:]
-                clean_numbers = clean_numbers[:clean_numbers.index(self.localizedPointName)]
-    
-            # check measure word errors
-            measure_words_sequence = []
-            # check for to much measure words like "million million"
-            for measure_value_double_check in self.sorted_measure_values:
-                if measure_value_double_check >= 1000: # measure values under 1000 can be more than one in text
-                    self.check_double_input(measure_value_double_check, clean_numbers)
-                    # save index for next check
-                    if -1 != self.get_index_for_number(measure_value_double_check,clean_numbers):
-                        measure_words_sequence.append(self.get_index_for_number(measure_value_double_check,clean_numbers))
-    
-            # check generic measure words are in right sequence
-            if measure_words_sequence != sorted(measure_words_sequence):
-                raise ValueError("Malformed number in result of false measure word sequence eg. trillion after thousand! Please enter a valid number word (eg. two million twenty three thousand and forty nine)")
-    
-            # check no measure words in decimal numbers
-            for measure_value in self.sorted_measure_values:
-                measure_name = self.get_name_by_number_value(measure_value)
-                if measure_name in clean_decimal_numbers:
-                    raise ValueError("Malformed number in result of false measure word after point eg. trillion after thousand! Please enter a valid number word (eg. two million twenty three thousand and forty nine)")
-    
-            # Now we calculate the pre-decimal value
-            result = self.get_number_value(clean_numbers, is_separate)
-            
-            # And add the post-decimal value
-            if len(clean_decimal_numbers) > 0:
-                total_sum_as_string = str(result)+"."+str(self.get_decimal_string(clean_decimal_numbers))
-                if not str_out:
-                    result = float(total_sum_as_string)
-                else:
-                    result = total_sum_as_string
-
-        if str_out:
-            return str(result)
-    
-        return result
-
+        if self.result_cache is not None:
+            key = (self.lang, self.engine, number_sentence, is_separate, result_type)
+            return self.result_cache.get_or_convert(key, self.normalized_try_word_to_num, number_sentence, is_separate, result_type)
+        return self.normalized_try_word_to_num(number_sentence, is_separate, result_type)
 
-    def text_to_num(self, text: str, ignore_zero: bool=True):
-        normal_text = self.normalize(text)
-        temp_text   = normal_text
-        safe_name   = list(self.number_system.keys()) + ['و'] + [self.localizedPointName]
-
-        #by saber>>>>
-        normal_text_list1 = normal_text.split()
-
-        new_normal_text_list2 = []
-        i = 0
-        for i in range(len(normal_text_list1)):
-            new_normal_text_list2.append(normal_text_list1[i])
-
-        per_Index = 0
-        Index_va = 0
-        Index_zero = 0
-        j = 0
-        i = 0
-        for i in range(len(normal_text_list1)):
-            if normal_text_list1[i] in safe_name and normal_text_list1[i] != 'و' and normal_text_list1[i] != 'صفر':
-                if per_Index == 1:
-                    if normal_text_list1[i] != 'هزار' and normal_text_list1[i] != 'میلیون' and normal_text_list1[i] != 'میلیارد' and normal_text_list1[i] != 'تریلیون':
-                        new_normal_text_list2.insert(i + j, 'بارانسزگاز')
-                        j += 1
-                elif normal_text_list1[i] == 'هزار':
-                    new_normal_text_list2[i+j]='یک هزار'
-
-                elif normal_text_list1[i] == 'میلیون':
-                    new_normal_text_list2[i + j] = 'یک میلیون'
-
-                elif normal_text_list1[i] == 'میلیارد':
-                    new_normal_text_list2[i+j]='یک میلیارد'
-
-                elif normal_text_list1[i] == 'تریلیون':
-                    new_normal_text_list2[i + j] = 'یک تریلیون'
-
-                per_Index = 1
-                Index_va = 0
-                Index_zero = 0
-            elif normal_text_list1[i] == 'صفر':
-                if per_Index == 1:
-                    new_normal_text_list2.insert(i + j, 'بارانسزگاز')
-                    j += 1
-                    per_Index = 0
-                if Index_va == 1:
-                    new_normal_text_list2.insert(i + j, 'بارانسزگاز')
-                    new_normal_text_list2.insert(i + j - 1, 'بارانسزگاز')
-                    j += 2
-                if Index_zero == 1:
-                    new_normal_text_list2.insert(i + j, 'بارانسزگاز')
-                    j += 1
-                Index_va = 0
-                Index_zero = 1
+    def probed_try_word_to_num(self, probe, started: float, number_sentence: str, is_separate: bool, result_type: str) -> ConversionResult:
+        """ [internal] function to convert a normalized string like `try_word_to_num` with instrumentation
+        
+        input: Instrumentation, perf_counter() at the start, normalized string, is_separate, result_type
+        output: ConversionResult
+        """
+        probe.tokens(len(number_sentence.split()))
+        try:
+            if self.result_cache is not None:
+                key = (self.lang, self.engine, number_sentence, is_separate, result_type)
+                result = self.result_cache.get_or_convert(key, self.normalized_try_word_to_num, number_sentence, is_separate, result_type)
             else:
-                per_Index = 0
-                if  normal_text_list1[i] == 'و':
-                    Index_va = 1
-                else:
-                    Index_va = 0
-                if  normal_text_list1[i] == 'صفر':
-                    Index_zero = 1
-                else:
-                    Index_zero = 0
-
-        normal_text_list1 = []
-
-        i=0
-        for i in range(len(new_normal_text_list2)):
-            normal_text_list1.append(new_normal_text_list2[i])
-
-        str1 = ""
-        for ele in normal_text_list1:
-            str1 += ele
-            str1 += ' '
-
-        normal_text = str1[:-1]
-        temp_text = normal_text
-        #by saber<<<<
-
-        # clean_numbers = self.clean_str(text)    
-
-        def clean_number_state_func(normal_text: str) -> List[bool]:
-            clean_state_list = []
-            normal_text_list = normal_text.split()
-
-            # some change by saber in for loop
-            prev_number = None
-            second_prev_number = None
-            for number in normal_text_list:
-
-                if number in safe_name:
-                    if prev_number == 'و' and prev_number in list(self.number_system.keys())[:20]:
-                        clean_state_list.append(False)
-
-                    #elif prev_number != 'و' and prev_number in list(self.number_system.keys()):
-                    #    clean_state_list.append(False)
-
-                    elif prev_number == 'و' and second_prev_number is not None:
-                        first_number = self.number_system.get(second_prev_number, -1)
-                        second_number = self.number_system.get(number, -1)
-                        if not is_dependent(first_number, second_number):
-                            clean_state_list[-1] = False
-                        
-                        clean_state_list.append(True)
-
-                    else:
-                        #by saber
-                        if number == 'و':
-                            if prev_number in safe_name:
-                                clean_state_list.append(True)
-                            else:
-                                clean_state_list.append(False)
-                        else:
-                            clean_state_list.append(True)
-
-                else:
-                    clean_state_list.append(False)
-
-                second_prev_number = prev_number
-                prev_number = number
-
-            return clean_state_list
-
-        clean_number_state  = clean_number_state_func(normal_text)
+                result = self.normalized_try_word_to_num(number_sentence, is_separate, result_type)
+            if result.error is not None:
+                probe.count("word_to_num_errors")
+            return result
+        finally:
+            probe.lap("convert", started)
+
+    def normalized_try_word_to_num(self, number_sentence: str, is_separate: bool=False, result_type: str="number") -> ConversionResult:
+        """ [internal] function to convert an already normalized string like `try_word_to_num`
         
-        number_list = [] 
-        for k, g in groupby(enumerate(clean_number_state), key=lambda x: x[1]):
-            if k: # k is True
-                g = list(g) # for example: [(1, True), (2, True)]
-                number_list.append([g[0][0], len(g)]) # for example: [1, 2]
-
-        zero_flag=0  #by saber
-
-        for start_index, length in number_list:
-            i=i+1
-            has_zero = False
-            cur_text = ' '.join(normal_text.split()[start_index: start_index+length])
-            cur_clean_numbers = self.clean_str(cur_text)
-
-            if 'صفر' in cur_clean_numbers and cur_clean_numbers.index('صفر') == 0:
-                has_zero = True
-                cur_clean_numbers = cur_clean_numbers[1:]
-
-            #by saber
-            if len(cur_clean_numbers) == 0 :
-                zero_flag = 1
-
-            number_start_index  = temp_text.find(cur_text)
-            number_end_index = number_start_index + len(cur_text)
+        input: normalized string, is_separate, one of RESULT_TYPES
+        output: ConversionResult
+        """
+        parts = self.normalized_number_parts(number_sentence, is_separate)
+        if type(parts) is not tuple:
+            return parts
+        return ConversionResult(make_result(*parts, result_type))
 
-            if zero_flag == 0: #if condition by saber
-                number = self.word_to_num(' '.join(cur_clean_numbers), is_separate=True, str_out=True)
-                number = number.replace('0.0', '0')
-            else:  #by saber
-                number = ''
-                zero_flag = 0
+    def normalized_word_to_num(self, number_sentence: str, is_separate: bool=False, result_type: str="number"):
+        """ [internal] function to return the number of an already normalized string
+        
+        input: normalized string, is_separate, one of RESULT_TYPES
+        output: result of the result type
+        raise: given number is formal incorrect
+        """
+        return self.normalized_try_word_to_num(number_sentence, is_separate, result_type).unwrap()
 
-            if not ignore_zero:
-                if has_zero:
-                    number = f'0{number}'
+    def normalized_number_parts(self, number_sentence: str, is_separate: bool=False):
+        """ [internal] function to validate and calculate an already normalized string with the engine
+        
+        input: normalized string
+        output: tuple of pre-decimal int, post-decimal digits as int and their count (0 without decimal words)
+                or ConversionResult with the error if the number is formal incorrect
+        """
+        if ANY_DIGIT.search(number_sentence) is not None:
+            # return the number if user enters a number string, also with measure words
+            parts = numeral_parts(number_sentence, self.tables.decimal_comma) or mixed_parts(self.tables, number_sentence)
+            if parts is not None:
+                return parts
+        if self.engine == "fsm":
+            probe = self.instrumentation
+            if probe is None:
+                return parse_number_words(self.tables, number_sentence, is_separate)
+            started = perf_counter()
+            parts = parse_number_words(self.tables, number_sentence, is_separate)
+            probe.lap("parse", started)
+            return parts
+        return self.get_number_parts(number_sentence, is_separate)
+
+    def get_number_parts(self, number_sentence: str, is_separate: bool=False):
+        """ [internal] function to validate and calculate a normalized number sentence with the word lists
+        this is the "legacy" engine, see `parse_number_words` for the "fsm" engine
+        
+        input: normalized string
+        output: tuple of pre-decimal int, post-decimal digits as int and their count (0 without decimal words)
+                or ConversionResult with the error if the number is formal incorrect
+        """
+        probe = self.instrumentation
+        if probe is not None:
+            started = perf_counter()
+        clean_decimal_numbers = []
+        clean_numbers = self.clean_str(number_sentence)
+        if probe is not None:
+            started = probe.lap("clean_str", started)
+
+        # Error message if the user enters invalid input!
+        if len(clean_numbers) == 0:
+            return ConversionResult(error=NO_NUMBER_WORDS)
+
+        # check point count
+        if clean_numbers.count(self.localizedPointName)>1:
+            point_name = self.localizedPointName
+            return ConversionResult(error=REDUNDANT_POINT, token=point_name, index=find_word(self.tables, number_sentence, point_name, 2))
+
+        # split in pre-decimal and post-decimal part
+        point_count = clean_numbers.count(self.localizedPointName)
+        if point_count == 1:
+            clean_decimal_numbers = clean_numbers[clean_numbers.index(self.localizedPointName)+1:]
+            clean_numbers = clean_numbers[:clean_numbers.index(self.localizedPointName)]
+
+        # index the positions of all words in one pass
+        word_positions = {}
+        for index, word in enumerate(clean_numbers):
+            word_positions.setdefault(word, []).append(index)
+
+        # check measure word errors
+        measure_words_sequence = []
+        # check for to much measure words like "million million"
+        for measure_value, measure_name in self.tables.measures:
+            if measure_value >= 1000: # measure values under 1000 can be more than one in text
+                positions = word_positions.get(measure_name)
+                if positions is not None:
+                    if len(positions) > 1:
+                        return ConversionResult(error=REDUNDANT_WORD, token=measure_name, index=find_word(self.tables, number_sentence, measure_name, 2))
+                    # save index for next check
+                    measure_words_sequence.append(positions[0])
+
+        # check generic measure words are in right sequence
+        if measure_words_sequence != sorted(measure_words_sequence):
+            # the first measure word in the text which is not smaller than the one before
+            last_value = 0
+            for word in clean_numbers:
+                value = self.number_system[word]
+                if value >= 1000 and word in self.tables.measure_words:
+                    if last_value and value >= last_value:
+                        return ConversionResult(error=MEASURE_SEQUENCE, token=word, index=find_word(self.tables, number_sentence, word))
+                    last_value = value
+
+        # check no measure words in decimal numbers
+        if not self.tables.measure_words.isdisjoint(clean_decimal_numbers):
+            word = next(word for word in clean_decimal_numbers if word in self.tables.measure_words)
+            occurrence = clean_numbers.count(word) + 1
+            return ConversionResult(error=MEASURE_AFTER_POINT, token=word, index=find_word(self.tables, number_sentence, word, occurrence))
+
+        if probe is not None:
+            started = probe.lap("validate", started)
+
+        # Now we calculate the pre-decimal value
+        result = self.get_number_value(clean_numbers, is_separate)
+        if probe is not None:
+            probe.lap("get_number_value", started)
+        
+        if len(clean_decimal_numbers) > 0:
+            return (result, *self.get_decimal_parts(clean_decimal_numbers))
+        return result, 0, 0
+
+    def word_to_num_many(self, number_sentences: Iterable, is_separate: bool=False, str_out: bool=False, result_type: str=None) -> BatchResult:
+        """ public function to convert many inputs like `word_to_num`
+        Errors are captured per item instead of raising and repeated inputs
+        are converted only once per batch. With result_type "scaled" the int64
+        column holds the numbers times 10**scale and `scales` the scales,
+        so decimals stay exact without overflow entries.
+        
+        Throughput target: within 10% of calling `word_to_num` in a loop for
+        unique inputs and at least 5x faster for batches of short phrases
+        where less than 1% of the inputs are distinct.
+        With `vectorized` and NumPy installed large batches of the fsm engine
+        are calculated column-wise over token id matrices.
+    
+        input: iterable of float, int or str
+        output: BatchResult with int64 column, validity mask, overflow and errors
+        """
+        if result_type is None:
+            result_type = "str" if str_out else "number"
+        if result_type not in RESULT_TYPES:
+            raise ValueError(f"Unknown result type {result_type}! Please use one of {', '.join(RESULT_TYPES)}")
+        if self.vectorized and self.engine == "fsm" and not is_separate and result_type in ("number", "scaled"):
+            number_sentences = list(number_sentences)
+            if len(number_sentences) >= VECTORIZED_MIN_BATCH:
+                try:
+                    from word2numberi18n.vectorized import convert_many
+                except ImportError:  # NumPy is an optional extra
+                    pass
+                else:
+                    return convert_many(self, number_sentences, result_type)
+        batch = BatchResult(scaled=result_type == "scaled")
+        append = batch.append_scaled if result_type == "scaled" else batch.append
+        append_error = batch.append_error
+        converted = {}
+        for number_sentence in number_sentences:
+            try:
+                key = (type(number_sentence), number_sentence)
+                outcome = converted.get(key)
+            except TypeError:  # unhashable input
+                key = None
+                outcome = None
+            if outcome is None:
+                result = self.try_word_to_num(number_sentence, is_separate, result_type)
+                outcome = (True, result.value) if result.error is None else (False, result.message)
+                if key is not None:
+                    converted[key] = outcome
+            if outcome[0]:
+                append(outcome[1])
+            else:
+                append_error(outcome[1])
+        return batch
 
-            temp_text = temp_text.replace(temp_text[number_start_index:number_end_index], f'{number}', 1) #by saber: add "count"=1 attribute
 
-        temp_text = temp_text.replace(' بارانسزگاز ','')  #by saber
-        return temp_text
+    def convert_number_group(self, number_words: "list[str]", ignore_zero: bool=True) -> str:
+        """ [internal] function to convert the words of one number in a text
+        a leading zero word is kept as "0" only if not `ignore_zero`, before the point it is the integer part
+        
+        input: normalized number words
+        output: string with the number or None if the number is formal incorrect
+        """
+        has_zero = number_words[0] in self.tables.zero_words and number_words[1:2] != [self.localizedPointName]
+        if has_zero:
+            number_words = number_words[1:]
+        number = ''
+        if len(number_words) > 0:
+            parts = self.normalized_number_parts(' '.join(number_words), is_separate=True)
+            if type(parts) is not tuple:
+                return None
+            integer, fraction, scale = parts
+            if integer == 0 and fraction == 0 and scale == 1:  # only unknown words after point
+                scale = 0
+            number = format_number(integer, fraction, scale)
+        if has_zero and not ignore_zero:
+            number = f'0{number}'
+        return number
+
+    def text_words(self, normal_text: str):
+        """ [internal] function to get the words of a normalized text
+        hyphenated words are split if they are no number word as a whole, eg. "ninety-eight"
+        
+        input: normalized text
+        output: generator of (word, start, end)
+        """
+        number_system = self.number_system
+        for match in TEXT_WORD.finditer(normal_text):
+            word = match.group()
+            if '-' in word and word not in number_system:
+                offset = match.start()
+                for part in WORD_PART.finditer(word):
+                    yield part.group(), offset + part.start(), offset + part.end()
+            else:
+                yield word, match.start(), match.end()
+
+    def extract_numbers(self, text: str, ignore_zero: bool=True) -> "list[NumberSpan]":
+        """ public function to find the numbers in a text in one pass over its words
+        Numbers which directly follow each other without conjunction (eg. phone
+        numbers read in parts) are one span with the joined digits as value,
+        a decimal is always a span of its own. The point word is only part of a
+        number before a digit word, eg. not in "at some point", a leading point
+        word starts a decimal like "point five" (0.5).
+        Malformed numbers like "million million" are no span.
+        
+        input: string the full text
+        output: list of NumberSpan(start, end, value, text) with offsets in the given text
+        """
+        if type(text) is not str:
+            raise ValueError("Type of input is not string! Please enter a valid text")
+        probe = self.instrumentation
+        if self.prefilter and self.tables.number_filter().search(text.lower()) is None:
+            if probe is not None:
+                probe.count("number_free_texts")
+            return []
+        if probe is not None:
+            text_started = perf_counter()
+        normal_text, to_original = normalize_with_offsets(self.tables, text)
+        if probe is not None:
+            probe.lap("normalize_text", text_started)
+        number_system = self.number_system
+        point_name = self.localizedPointName
+        measure_values = set(self.sorted_measure_values)
+        conjunctions = self.tables.conjunctions
+        zero_words = self.tables.zero_words
+        decimal_words = self.decimal_words
+        unit_first = self.tables.unit_first
+        vigesimal = self.tables.vigesimal
+        name_by_value = self.tables.name_by_value
+        ambiguous_words = self.tables.ambiguous_words
+        ambiguous_numbers = {self.normalize_data.get(ambiguous, ambiguous) for ambiguous in ambiguous_words}
+        
+        spans = []
+        parts = []                  # (start, end, number) of the groups in the current span, number is None if malformed
+        group = []                  # number words of the current group
+        group_start = group_end = 0 # normalized offsets of the current group
+        last_value = None           # value of the last number word in the current group
+        is_decimal = False          # point word in the current group
+        after_conjunction = False   # conjunction directly after the current group
+        conjunction = None          # the last conjunction word
+        is_ambiguous = False        # the current group is only an ambiguous word like "a", no number alone
+        
+        def finish_group():
+            if group:
+                if probe is not None:
+                    probe.count("number_groups")
+                parts.append((group_start, group_end, None if is_ambiguous else self.convert_number_group(group, ignore_zero)))
+                group.clear()
+        
+        def finish_span():
+            finish_group()
+            # following well-formed groups are one span, malformed groups stay text, decimals are not joined
+            valid_parts = []
+            for part in parts + [(0, 0, None)]:
+                number = part[2]
+                if valid_parts and (number is None or '.' in number or '.' in valid_parts[-1][2]):
+                    start, end = to_original(valid_parts[0][0], valid_parts[-1][1])
+                    spans.append(NumberSpan(start, end, ''.join(number for _, _, number in valid_parts), text[start:end]))
+                    valid_parts = []
+                if number is not None:
+                    valid_parts.append(part)
+            parts.clear()
+        
+        last_end = 0                # normalized end of the last word of the current number
+        words = self.text_words(normal_text)
+        following = next(words, None)  # the word after the current word
+        while following is not None:
+            word, start, end = following
+            following = next(words, None)
+            if (group or parts) and not NUMBER_GAP.fullmatch(normal_text, last_end, start):
+                # punctuation or a new line ends the number
+                finish_span()
+                after_conjunction = False
+            if word in conjunctions:
+                if group and not after_conjunction:
+                    after_conjunction = True
+                    conjunction = word
+                    last_end = end
+                    continue
+                finish_span()
+                after_conjunction = False
+                continue
+            if word == point_name:
+                # the point is a number only with a digit word after it, eg. "one point five" or "point five"
+                if ((group and (after_conjunction or is_decimal)) or following is None or following[0] not in decimal_words
+                        or not NUMBER_GAP.fullmatch(normal_text, end, following[1])):
+                    finish_span()
+                    after_conjunction = False
+                    continue
+                value = -1
+            elif word in number_system:
+                value = number_system[word]
+            else:
+                # no number word, this ends the number
+                finish_span()
+                after_conjunction = False
+                continue
+            
+            is_point = word == point_name
+            is_zero = word in zero_words
+            # vigesimal numbers are read together as the number word of both, eg. "quatre vingt" as "quatre-vingt"
+            combined = vigesimal_value(last_value, value) if vigesimal and group and not after_conjunction else 0
+            if combined not in name_by_value:
+                combined = 0
+            if not group and not parts:
+                joins = None  # first word of a new span
+            elif after_conjunction:
+                # the conjunction joins only dependent numbers like "twenty and three" or with unit_first "vier und zwanzig"
+                is_smaller = (last_value in measure_values and value < last_value) or is_dependent(last_value, value)
+                is_unit_first = unit_first and is_unit_before_ten(last_value, value)
+                joins = "group" if (not is_decimal and not is_point and not is_zero and (is_smaller or is_unit_first)) else None
+                if joins and is_unit_first:
+                    group.append(conjunction)  # the parser reads the unit first only with the conjunction
+            elif is_decimal:
+                joins = "group"
+            elif is_point:
+                joins = "group"
+            elif is_zero:
+                joins = "span"
+            elif combined:
+                joins = "vigesimal"
+            elif last_value == 0 or value in measure_values or (last_value in measure_values and value < last_value) or is_dependent(last_value, value):
+                joins = "group"
+            else:
+                joins = "span"  # like a phone number read in parts
+            
+            if joins is None:
+                finish_span()
+                is_decimal = False
+            elif joins == "span":
+                finish_group()
+                is_decimal = False
+            if joins == "vigesimal":
+                value = combined
+                group[-1] = name_by_value[combined]
+            elif group:
+                group.append(word)
+            else:
+                group_start = start
+                group.append(word)
+            is_ambiguous = (not group[1:] and word in ambiguous_numbers
+                            and text[slice(*to_original(start, end))].lower() in ambiguous_words)
+            group_end = last_end = end
+            after_conjunction = False
+            last_value = value
+            is_decimal = is_decimal or is_point
+        finish_span()
+        if probe is not None:
+            probe.lap("extract_numbers", text_started)
+        return spans
+
+    def text_to_num(self, text: str, ignore_zero: bool=True) -> str:
+        """ public function to replace the number words in a text by numbers
+        The text outside of the numbers is kept as it is.
+        
+        input: string the full text
+        output: string
+        """
+        parts = []
+        position = 0
+        for span in self.extract_numbers(text, ignore_zero):
+            parts.append(text[position:span.start])
+            parts.append(span.value)
+            position = span.end
+        parts.append(text[position:])
+        return ''.join(parts)
+
+    def text_to_num_stream(self, text_stream, ignore_zero: bool=True, max_pending: int=65536):
+        """ public function like `text_to_num` for a text stream
+        The stream is converted piece by piece and only the words after the
+        last non number word are carried to the next chunk, so a number
+        split over two chunks is still found. Joined together the pieces are
+        the same as `text_to_num` of the whole text.
+        
+        input: text file object, iterable of strings or string
+               max_pending: count of characters to carry at most, more is converted without lookahead
+        output: generator of converted text pieces
+        """
+        if isinstance(text_stream, str):
+            chunks = (text_stream,)
+        elif hasattr(text_stream, "read"):
+            chunks = iter(lambda: text_stream.read(STREAM_CHUNK_SIZE), "")
+        else:
+            chunks = text_stream
+        
+        # words which can continue a number, a cut is only allowed after any other word or punctuation
+        number_words = {self.localizedPointName} | self.tables.conjunctions
+        for word in self.number_system:
+            number_words.update(WORD_PART.findall(word))
+        for non_composed_number_value, composed_number_value in self.normalize_data.items():
+            number_words.update(WORD_PART.findall(non_composed_number_value))
+            number_words.update(WORD_PART.findall(composed_number_value))
+        
+        pending = ""
+        for chunk in chunks:
+            pending += chunk
+            cut = 0
+            word_end = 0
+            for match in TEXT_TOKEN.finditer(pending):
+                if match.end() == len(pending):
+                    break  # the word can go on in the next chunk
+                word_end = match.end()
+                last_word = TOKEN_LAST_WORD.search(match.group().lower())
+                if last_word is None or last_word.group(1) not in number_words:
+                    cut = word_end
+            if cut == 0 and len(pending) > max_pending:
+                cut = word_end or len(pending)
+            if cut > 0:
+                yield self.text_to_num(pending[:cut], ignore_zero)
+                pending = pending[cut:]
+        if pending:
+            yield self.text_to_num(pending, ignore_zero)
+
+
+# process-wide read-only tables of the languages, each configuration file is read once
+registry = LanguageRegistry(load_tables)
+
+# language parameter to detect the language of every input
+AUTO = "auto"
+_detector = None
+_detector_lock = threading.Lock()
+
+
+def language_instance(lang_param=None) -> W2N:
+    """ public function to get a new instance over the shared tables of the registry
+    the instance is cheap to build, so settings like `engine` of one caller do not change the others
+
+    input: language name or None for the process default
+    output: W2N
+    """
+    tables = registry.get(lang_param)
+    return W2N(lang_param=tables.lang, tables=tables)
+
+
+def language_detector() -> LanguageDetector:
+    """ public function to get the process-wide detector over all bundled languages
+    built on first use from the languages of the registry
+    """
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = LanguageDetector(registry.get(lang) for lang in available_languages())
+        return _detector
 
 
 def word_to_num(number_sentence, lang_param=None):
-    instance = W2N(lang_param)
-    return instance.word_to_num(number_sentence)
+    """ public function to convert a number sentence with the shared language tables
+    with lang_param "auto" the language is detected for every input: the words are scored for
+    all languages in one pass and only the best language converts, the next ones only if it fails
+
+    input: string, language name or None for the process default or "auto"
+    output: int or float
+    raise: given number is formal incorrect in the language (in every scored language with "auto")
+    """
+    result = try_word_to_num(number_sentence, lang_param)
+    if result.error is not None:
+        raise ValueError(result.message)
+    return result.value
+
+
+def try_word_to_num(number_sentence, lang_param=None) -> ConversionResult:
+    """ public function like `word_to_num` without exceptions for malformed input
+    with lang_param "auto" the error is the one of the best scored language
+
+    input: string, language name or None for the process default or "auto"
+    output: ConversionResult
+    """
+    if lang_param != AUTO:
+        return language_instance(lang_param).try_word_to_num(number_sentence)
+    if type(number_sentence) is not str:
+        return language_instance(None).try_word_to_num(number_sentence)
+    numeral = numeral_parts(number_sentence.strip())
+    comma_numeral = numeral_parts(number_sentence.strip(), decimal_comma=True)
+    if numeral is not None and numeral == comma_numeral:  # the same in every language, eg. "1250"
+        return ConversionResult(make_result(*numeral, "number"))
+    if numeral is not None or comma_numeral is not None:
+        # the separators depend on the language, without words the process default decides
+        return language_instance(None).try_word_to_num(number_sentence)
+    first_error = None
+    for lang in language_detector().rank(number_sentence):
+        result = language_instance(lang).try_word_to_num(number_sentence)
+        if result.error is None:
+            return result
+        first_error = first_error or result
+    if first_error is not None:
+        return first_error
+    return ConversionResult(error=NO_LANGUAGE)
 
 #EOF
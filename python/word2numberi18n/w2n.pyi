@@ -1,4 +1,17 @@
-from typing import Union
+from typing import Union, Optional
 
-def word_to_num(number_sentence: str) -> Union[int, float, None]:
+from word2numberi18n.registry import LanguageRegistry
+from word2numberi18n.detect import LanguageDetector
+from word2numberi18n.results import ConversionResult
+
+registry: LanguageRegistry
+AUTO: str
+
+def language_detector() -> LanguageDetector:
+    pass
+
+def word_to_num(number_sentence: str, lang_param: Optional[str] = None) -> Union[int, float, None]:
+    pass
+
+def try_word_to_num(number_sentence: str, lang_param: Optional[str] = None) -> ConversionResult:
     pass